@@ -5,7 +5,7 @@ necessary for performing data acquisition and dataset generation.
 from flask import Flask, url_for, redirect
 from flask_cors import CORS
 
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from pydas import routes, signals
 from pydas.containers import ApplicationContainer
@@ -29,7 +29,9 @@ def create_app(config_filename: str = 'pydas.yaml'):
                  routes.entity,
                  routes.configuration,
                  routes.feature,
+                 routes.formatting,
                  routes.handler,
+                 routes.jobs,
                  routes.option,
                  routes.statistics,
                  signals])
@@ -47,6 +49,7 @@ def create_app(config_filename: str = 'pydas.yaml'):
     app.register_blueprint(routes.configuration_bp)
     app.register_blueprint(routes.feature_bp)
     app.register_blueprint(routes.handler_bp)
+    app.register_blueprint(routes.jobs_bp)
     app.register_blueprint(routes.option_bp)
     app.register_blueprint(routes.statistics_bp)
     app.register_blueprint(routes.swaggerui_bp, url_prefix=SWAGGER_URL)
@@ -73,6 +76,13 @@ def create_app(config_filename: str = 'pydas.yaml'):
             'Unable to register signals, please check that blinker is installed: %s',
             exc)
 
+    try:
+        recovered = app_container.job_manager().recover()
+        if recovered:
+            app.logger.info('Resumed %d unfinished acquisition jobs', recovered)
+    except SQLAlchemyError as exc:
+        app.logger.warning('Unable to resume unfinished acquisition jobs: %s', exc)
+
     return app
 
 
@@ -0,0 +1,24 @@
+"""
+Data acquisition pipeline used by the acquire routes to retrieve feature data for entities.
+
+The pipeline separates metadata resolution, which must happen on the thread that owns the
+metadata session, from the upstream requests made by feature handlers, which are fanned out
+across a bounded pool of worker threads. If ``acquisition.aio.enabled`` is configured, the
+workers await their upstream requests on a single event loop through a
+:class:`pydas.clients.AsyncIexClient`.
+"""
+
+from .batching import MarketBatchClient
+from .cache import ResultCache
+from .features import (EntityRequest,
+                       FeatureRequest,
+                       FeatureResult,
+                       acquire_entities,
+                       acquire_features,
+                       build_feature_requests,
+                       iter_entities,
+                       iter_features)
+from .incremental import IncrementalFetch
+from .jobs import JobManager
+from .plans import PlanCache, compile_plan
+from .singleflight import CoalescingClient, SingleFlight
@@ -0,0 +1,166 @@
+"""
+Cross-entity market batch acquisition, so that a feature shared by many entities is requested
+for up to 100 entities at a time.
+"""
+from concurrent.futures import Future
+import json
+import logging
+import re
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from pydas_metadata.models import Entity, Feature
+
+from pydas.acquisition.features import EntityRequest
+from pydas.clients.base import BaseDataClient
+from pydas.clients.iex import MAX_BATCH_SYMBOLS, IexClient
+from pydas.constants import SdasConstants
+
+# Feature URIs of single endpoint types that can be requested through a market batch.
+_BATCH_URI = re.compile(r'^/stocks?/\{symbol(:[^}]*)?\}/(?P<type>[\w-]+)/?$')
+
+# Feature handlers that pass options through as query parameters without post-processing.
+_BATCH_HANDLERS = ('batch_handler',)
+
+
+def get_batch_type(feature: Feature) -> Optional[str]:
+    """
+    Returns the market batch endpoint type of a feature, or ``None`` if the feature can't be
+    requested through a market batch.
+    """
+    if feature.handler_metadata.name not in _BATCH_HANDLERS:
+        return None
+
+    match = _BATCH_URI.match(feature.uri or '')
+    return match.group('type') if match is not None else None
+
+
+class MarketBatchClient(BaseDataClient):
+    """
+    IEX data client that requests the features shared by several entities through market batch
+    requests, demultiplexing each response back into per-entity feature data.
+
+    Entities that request the same endpoint types with the same options are grouped together,
+    so that no entity's data is requested for a type it doesn't use, and each group is
+    requested for up to :data:`pydas.clients.iex.MAX_BATCH_SYMBOLS` entities at a time. A
+    market batch is only requested once another request needs it, and its response is shared
+    by every entity in it. If a market batch request fails, each of its entities' features is
+    requested individually instead. Features that can't be batched, or are requested with
+    options that weren't planned, are requested individually.
+
+    Attributes
+    ----------
+    client: :class:`pydas.clients.IexClient`
+        IEX data client used to make the requests.
+
+    batches: int
+        Number of market batch requests made.
+    """
+
+    def __init__(self,
+                 client: IexClient,
+                 entity_requests: List[EntityRequest],
+                 batch_size: int = MAX_BATCH_SYMBOLS):
+        self.client = client
+        self.batches = 0
+        self._batch_size = batch_size
+        self._groups: Dict[Tuple[str, Tuple[str, ...]], Tuple[List[str], list]] = dict()
+        self._chunks: Dict[Tuple[str, str], Tuple[Tuple[str, Tuple[str, ...]], int]] = dict()
+        self._results: Dict[Tuple[Tuple[str, Tuple[str, ...]], int], Future] = dict()
+        self._lock = Lock()
+
+        for entity_request in entity_requests:
+            entity_types: Dict[str, Tuple[List[str], list]] = dict()
+            for request in entity_request.requests:
+                batch_type = get_batch_type(request.feature)
+                if batch_type is None:
+                    continue
+
+                types, _ = entity_types.setdefault(
+                    self._get_key(request.options),
+                    ([], [{SdasConstants.name_property: option[SdasConstants.name_property],
+                           SdasConstants.value_property: option[SdasConstants.value_property]}
+                          for option in request.options]))
+                if batch_type not in types:
+                    types.append(batch_type)
+
+            for key, (types, options) in entity_types.items():
+                symbols, _ = self._groups.setdefault((key, tuple(sorted(types))), ([], options))
+                if entity_request.entity.identifier not in symbols:
+                    symbols.append(entity_request.entity.identifier)
+
+        for group, (symbols, _) in list(self._groups.items()):
+            if len(symbols) < 2:
+                # A batch of one entity saves no requests
+                del self._groups[group]
+                continue
+
+            for index, symbol in enumerate(symbols):
+                self._chunks[(group[0], symbol)] = (group, index // batch_size)
+
+            logging.debug('Planned %d market batches of "%s" for %d entities',
+                          (len(symbols) - 1) // batch_size + 1, (',').join(group[1]), len(symbols))
+
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
+        return False
+
+    def get_feature_data(self, feature: Feature, entity: Entity, options: list):
+        batch_type = get_batch_type(feature)
+        group, chunk = self._chunks.get((self._get_key(options), entity.identifier), (None, None))
+        if batch_type is None or group is None or batch_type not in group[1]:
+            return self.client.get_feature_data(feature, entity, options)
+
+        try:
+            response = self._get_batch(group, chunk)
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.warning('Requesting "%s" for "%s" on its own after its market batch failed: %s',
+                            feature.name, entity.identifier, exc)
+            return self.client.get_feature_data(feature, entity, options)
+
+        symbol_data = _get_symbol_data(response, entity.identifier)
+        if symbol_data is None or batch_type not in symbol_data:
+            raise LookupError(f'Market batch has no "{batch_type}" data for "{entity.identifier}"')
+
+        return symbol_data[batch_type]
+
+    def _get_batch(self, group: Tuple[str, Tuple[str, ...]], chunk: int) -> dict:
+        with self._lock:
+            future = self._results.get((group, chunk))
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._results[(group, chunk)] = future
+
+        if is_leader:
+            symbols, options = self._groups[group]
+            start = chunk * self._batch_size
+            try:
+                future.set_result(self.client.get_market_batch(
+                    symbols[start:start + self._batch_size], list(group[1]), options))
+            except Exception as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self.batches += 1
+
+        return future.result()
+
+    @staticmethod
+    def _get_key(options: list) -> str:
+        # Options are mapped to an entity and feature, so only their names and values are keyed
+        return json.dumps(sorted((option[SdasConstants.name_property],
+                                  str(option.get(SdasConstants.value_property)))
+                                 for option in options))
+
+
+def _get_symbol_data(response: dict, symbol: str) -> Optional[dict]:
+    if symbol in response:
+        return response[symbol]
+
+    # IEX keys market batch responses by upper-case symbol
+    for response_symbol, data in response.items():
+        if response_symbol.lower() == symbol.lower():
+            return data
+
+    return None
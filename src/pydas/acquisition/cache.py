@@ -0,0 +1,174 @@
+"""
+In-process cache of acquired datasets with per-handler expiry and least-recently-used eviction.
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+from threading import Lock
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from pydas.acquisition.features import EntityRequest
+from pydas.acquisition.incremental import END_OF_DAY_HANDLERS
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 60
+DEFAULT_END_OF_DAY_TTL = 3600
+
+
+class ResultCache:
+    """
+    Bounded cache of acquired datasets, keyed by entity, feature set, options and format.
+
+    Each entry expires after the time-to-live of the shortest-lived feature handler used to
+    acquire it, so datasets containing intraday features can expire sooner than datasets
+    containing only end-of-day features. End-of-day features are those acquired by the
+    :data:`pydas.acquisition.incremental.END_OF_DAY_HANDLERS`, which the incremental fetch
+    serves from its local store. Once the cache is full, the least recently used entry is
+    evicted.
+
+    Attributes
+    ----------
+    max_entries: int
+        Maximum number of datasets that are cached.
+
+    default_ttl: float
+        Time-to-live in seconds of datasets acquired by intraday handlers without a configured
+        time-to-live.
+
+    end_of_day_ttl: float
+        Time-to-live in seconds of datasets acquired by end-of-day handlers without a
+        configured time-to-live.
+
+    ttls: dict[str, float]
+        Time-to-live in seconds keyed by feature handler name, overriding the time-to-live of
+        the handler's class.
+
+    hits: int
+        Number of lookups that returned a cached dataset.
+
+    misses: int
+        Number of lookups that didn't find an unexpired cached dataset.
+
+    evictions: int
+        Number of datasets evicted to make room for newer datasets.
+    """
+
+    def __init__(self,
+                 max_entries: int = None,
+                 default_ttl: float = None,
+                 ttls: Dict[str, float] = None,
+                 end_of_day_ttl: float = None):
+        self.max_entries = max_entries or DEFAULT_MAX_ENTRIES
+        self.default_ttl = default_ttl if default_ttl is not None else DEFAULT_TTL
+        self.end_of_day_ttl = end_of_day_ttl if end_of_day_ttl is not None else DEFAULT_END_OF_DAY_TTL
+        self.ttls = dict(ttls or dict())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(plan: EntityRequest, output_format: str) -> tuple:
+        """
+        Returns the cache key of an acquisition plan's dataset in the given output format.
+
+        Parameters
+        ----------
+        plan: :class:`pydas.acquisition.EntityRequest`
+            Entity and feature requests the dataset is acquired for.
+
+        output_format: str
+            Format the dataset is cached in.
+
+        Returns
+        -------
+        tuple:
+            The entity identifier, feature names, options hash and output format.
+        """
+        options = [request.options for request in plan.requests]
+        digest = hashlib.sha1(json.dumps(options, sort_keys=True, default=str).encode('utf-8'))
+        return (plan.entity.identifier,
+                tuple(request.feature.name for request in plan.requests),
+                digest.hexdigest(),
+                output_format.lower())
+
+    def get_ttl(self, plan: EntityRequest) -> float:
+        """
+        Returns the time-to-live in seconds of a plan's dataset, which is the shortest
+        time-to-live of the feature handlers used by the plan.
+        """
+        return min((self._get_handler_ttl(request.feature.handler_metadata.name)
+                    for request in plan.requests),
+                   default=self.default_ttl)
+
+    def _get_handler_ttl(self, handler_name: str) -> float:
+        if handler_name in self.ttls:
+            return self.ttls[handler_name]
+
+        return self.end_of_day_ttl if handler_name in END_OF_DAY_HANDLERS else self.default_ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached dataset for a key, or ``None`` if there is no unexpired dataset.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: float = None):
+        """
+        Caches a dataset, evicting the least recently used datasets if the cache is full.
+
+        Parameters
+        ----------
+        key: Hashable
+            Cache key returned by :meth:`get_key`.
+
+        value: any
+            Dataset to cache.
+
+        ttl: float
+            Time-to-live of the dataset in seconds. Default: :attr:`default_ttl`.
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                logging.debug('Evicted cached dataset for "%s"', evicted[0])
+
+    def clear(self):
+        """Removes every cached dataset."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> dict:
+        """Returns the cache's size and hit, miss and eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0
+            }
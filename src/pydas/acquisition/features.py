@@ -0,0 +1,307 @@
+"""
+Concurrent feature acquisition for one or more entities.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from typing import Callable, Iterator, List, Tuple
+
+from pydas_metadata import json
+from pydas_metadata.models import Entity, Feature, Option
+
+from pydas.clients.base import BaseDataClient
+from pydas.columns import FeatureColumns
+from pydas.constants import SdasConstants
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class FeatureRequest:
+    """
+    A feature that has been resolved from metadata and is ready to be acquired.
+
+    Attributes
+    ----------
+    feature: :class:`pydas_metadata.models.Feature`
+        Feature to acquire data for. The handler metadata must already be loaded, as the
+        request is processed outside of the metadata session's thread.
+
+    options: list[dict]
+        JSON representation of the feature options passed to the feature handler.
+    """
+
+    def __init__(self, feature: Feature, options: list):
+        self.feature = feature
+        self.options = options
+
+
+class EntityRequest:
+    """
+    An entity and its resolved feature requests.
+
+    Attributes
+    ----------
+    entity: :class:`pydas_metadata.models.Entity`
+        Entity to acquire data for.
+
+    requests: list[:class:`pydas.acquisition.FeatureRequest`]
+        Resolved features to acquire for the entity.
+    """
+
+    def __init__(self, entity: Entity, requests: List[FeatureRequest]):
+        self.entity = entity
+        self.requests = requests
+
+
+class FeatureResult:
+    """
+    Outcome of acquiring a single feature.
+
+    Attributes
+    ----------
+    feature_name: str
+        Name of the feature that was acquired.
+
+    columns: :class:`pydas.columns.FeatureColumns`
+        Values and dates acquired for the feature. Empty if the acquisition failed.
+
+    error: Exception
+        Exception raised while acquiring the feature, or ``None`` if the acquisition
+        succeeded.
+    """
+
+    def __init__(self, feature_name: str, values=None, error: Exception = None):
+        self.feature_name = feature_name
+        self.columns = FeatureColumns.from_values(values)
+        self.error = error
+
+    @property
+    def values(self) -> list:
+        """Collection of ``(value, date)`` tuples acquired for the feature."""
+        return list(self.columns)
+
+    @property
+    def succeeded(self) -> bool:
+        """Returns a flag indicating whether the feature was acquired without error."""
+        return self.error is None
+
+
+def build_feature_requests(entity: Entity, options: List[Option]) -> List[FeatureRequest]:
+    """
+    Resolves the features mapped to an entity into feature requests.
+
+    This must be called while the metadata session that loaded the entity is still open, as
+    the feature handler metadata may need to be lazily loaded.
+
+    Parameters
+    ----------
+    entity: :class:`pydas_metadata.models.Entity`
+        Entity to resolve the features of.
+
+    options: list[:class:`pydas_metadata.models.Option`]
+        Options mapped to the entity. Options for features that aren't mapped to the entity
+        are ignored.
+
+    Returns
+    -------
+    list[:class:`pydas.acquisition.FeatureRequest`]:
+        Feature requests in the same order as the entity features.
+    """
+    requests = []
+    for feature in entity.features:
+        feature_options = [option for option in options
+                           if option.entity_id == entity.identifier
+                           and option.feature_name == feature.name]
+        option = [json(option) for option in feature_options]
+        logging.info(
+            'Retrieved mapped options: [%s]',
+            (" ").join([json(option, True) for option in feature_options]))
+
+        # TODO: Determine if this could/should be moved into source-aware code
+        if feature.handler_metadata.name == "tech_indicators_handler" and not option:
+            logging.info(
+                'Adding missing option on technical indicator')
+            option.append({"feature_name": feature.name,
+                           "name": "range",
+                           "value": "1m"})
+
+        requests.append(FeatureRequest(feature, option))
+
+    return requests
+
+
+def extract_values(feature: Feature, data) -> FeatureColumns:
+    """
+    Extracts the values and dates of a feature from the data returned by its handler, which
+    may be a list of data points, a generator of data points parsed from a streamed response,
+    a single data point, or a single data point whose properties are lists of values, i.e.
+    columnar data. Feature columns that have already been extracted are returned as is.
+
+    Further series of columnar data, keyed by the feature name suffixed with the index of the
+    series, e.g. ``bbands_1`` and ``bbands_2`` for ``bbands``, are extracted as extra columns.
+    """
+    if isinstance(data, FeatureColumns):
+        return data
+
+    if isinstance(data, dict) and not isinstance(data.get(SdasConstants.date_property), list):
+        data = [data]
+
+    if isinstance(data, (dict, list, Iterator)):
+        values, dates = feature.get_columns(data)
+        extra = _get_extra_series(feature, data) if isinstance(data, dict) and len(values) else None
+        return FeatureColumns.from_columns(dates, values, extra)
+
+    return FeatureColumns()
+
+
+def _get_extra_series(feature: Feature, data: dict) -> dict:
+    """Returns the further series of columnar data, keyed ``{feature}_{i}`` from ``1``."""
+    extra = dict()
+    name = f'{feature.name}_1'
+    while name in data:
+        extra[name] = data[name]
+        name = f'{feature.name}_{len(extra) + 1}'
+
+    return extra
+
+
+def acquire_feature(client: BaseDataClient, entity: Entity, request: FeatureRequest) -> FeatureResult:
+    """
+    Acquires the data for a single feature, capturing any raised exception in the result.
+
+    Parameters
+    ----------
+    client: :class:`pydas.clients.base.BaseDataClient`
+        Data client used to request the feature data.
+
+    entity: :class:`pydas_metadata.models.Entity`
+        Entity the feature data is acquired for.
+
+    request: :class:`pydas.acquisition.FeatureRequest`
+        Resolved feature and options to acquire.
+
+    Returns
+    -------
+    :class:`pydas.acquisition.FeatureResult`:
+        Values acquired for the feature, or the error raised while acquiring them.
+    """
+    feature = request.feature
+    try:
+        logging.info('Acquiring feature data for "%s"', feature.name)
+        data = client.get_feature_data(feature, entity, request.options)
+        values = extract_values(feature, data)
+        logging.info('Acquired %d rows for "%s"', len(values), feature.name)
+        return FeatureResult(feature.name, values)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.error('Unable to acquire feature "%s": %s', feature.name, exc)
+        return FeatureResult(feature.name, error=exc)
+
+
+def iter_features(client: BaseDataClient,
+                  entity: Entity,
+                  requests: List[FeatureRequest],
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  fetch: Callable[[BaseDataClient, Entity, FeatureRequest], FeatureResult] = acquire_feature
+                  ) -> Iterator[FeatureResult]:
+    """
+    Acquires the requested features concurrently, yielding each result in request order.
+
+    Parameters
+    ----------
+    client: :class:`pydas.clients.base.BaseDataClient`
+        Data client shared by all of the feature requests.
+
+    entity: :class:`pydas_metadata.models.Entity`
+        Entity the feature data is acquired for.
+
+    requests: list[:class:`pydas.acquisition.FeatureRequest`]
+        Resolved features to acquire.
+
+    max_workers: int
+        Maximum number of features acquired at the same time. Default: ``4``.
+
+    fetch: Callable
+        Function used to acquire a single feature. Default:
+        :func:`pydas.acquisition.features.acquire_feature`.
+
+    Returns
+    -------
+    Iterator[:class:`pydas.acquisition.FeatureResult`]:
+        Feature results in the same order as the requests. A result is yielded as soon as it,
+        and every result before it, has completed.
+    """
+    for _, results in iter_entities(client, [EntityRequest(entity, requests)], max_workers, fetch):
+        yield from results
+
+
+def iter_entities(client: BaseDataClient,
+                  entity_requests: List[EntityRequest],
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  fetch: Callable[[BaseDataClient, Entity, FeatureRequest], FeatureResult] = acquire_feature
+                  ) -> Iterator[Tuple[Entity, Iterator[FeatureResult]]]:
+    """
+    Acquires the features of several entities concurrently using a single bounded pool of
+    workers that is shared across all of the entities.
+
+    Parameters
+    ----------
+    client: :class:`pydas.clients.base.BaseDataClient`
+        Data client shared by all of the entities.
+
+    entity_requests: list[:class:`pydas.acquisition.EntityRequest`]
+        Entities and their resolved features to acquire.
+
+    max_workers: int
+        Maximum number of features acquired at the same time. Default: ``4``.
+
+    fetch: Callable
+        Function used to acquire a single feature. Default:
+        :func:`pydas.acquisition.features.acquire_feature`.
+
+    Returns
+    -------
+    Iterator[tuple]:
+        Pairs of each entity and an iterator over its feature results, in request order. The
+        feature results must be consumed before advancing to the next entity.
+    """
+    total = sum(len(entity_request.requests) for entity_request in entity_requests)
+    workers = max(1, min(max_workers or DEFAULT_MAX_WORKERS, total or 1))
+    logging.debug('Acquiring %d features for %d entities with %d workers',
+                  total, len(entity_requests), workers)
+    with ThreadPoolExecutor(max_workers=workers,
+                            thread_name_prefix='pydas-feature') as executor:
+        pending = [(entity_request.entity,
+                    [executor.submit(fetch, client, entity_request.entity, request)
+                     for request in entity_request.requests])
+                   for entity_request in entity_requests]
+        try:
+            for entity, futures in pending:
+                yield entity, (future.result() for future in futures)
+        finally:
+            for _, futures in pending:
+                for future in futures:
+                    future.cancel()
+
+
+def acquire_features(client: BaseDataClient,
+                     entity: Entity,
+                     requests: List[FeatureRequest],
+                     max_workers: int = DEFAULT_MAX_WORKERS) -> List[FeatureResult]:
+    """
+    Acquires the requested features concurrently and returns the results in request order.
+
+    See :func:`pydas.acquisition.iter_features` for a description of the parameters.
+    """
+    return list(iter_features(client, entity, requests, max_workers))
+
+
+def acquire_entities(client: BaseDataClient,
+                     entity_requests: List[EntityRequest],
+                     max_workers: int = DEFAULT_MAX_WORKERS) -> List[Tuple[Entity, List[FeatureResult]]]:
+    """
+    Acquires the features of several entities concurrently and returns the results in request
+    order.
+
+    See :func:`pydas.acquisition.iter_entities` for a description of the parameters.
+    """
+    return [(entity, list(results))
+            for entity, results in iter_entities(client, entity_requests, max_workers)]
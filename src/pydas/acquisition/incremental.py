@@ -0,0 +1,301 @@
+"""
+Incremental acquisition that only requests the data points acquired since a feature's
+watermark.
+
+A watermark is persisted in the metadata store for each entity, feature and set of options,
+recording the latest date acquired so far and the earliest date covered. Every data point
+acquired is kept in a local :class:`pydas.stores.BaseStore`, so an acquisition only needs to
+request the missing tail of the configured range from the data source and can serve the rest
+of the range locally. A range starting before the earliest date covered, e.g. after widening
+the range from ``5d`` to ``1m``, is acquired in full.
+"""
+import datetime as dt
+import hashlib
+import json
+import logging
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+
+from pydas_metadata.contexts import BaseContext
+from pydas_metadata.models import AcquisitionWatermark, Entity
+
+from pydas.acquisition.features import FeatureRequest, FeatureResult, acquire_feature
+from pydas.clients.base import BaseDataClient
+from pydas.columns import FeatureColumns
+from pydas.constants import SdasConstants
+from pydas.stores import BaseStore
+from pydas.transformers.planner import CHART_RANGES
+from pydas.transformers.trading_calendar import get_calendar
+from pydas.transformers.utils import calc_range
+
+RANGE_OPTION = 'range'
+EXACT_DATE_OPTION = 'exactDate'
+
+# Handlers that return one final data point per trading day, which never changes once acquired.
+END_OF_DAY_HANDLERS = frozenset(['batch_handler', 'range_handler'])
+
+
+def options_hash(options: List[dict]) -> str:
+    """
+    Returns the SHA-1 digest of a feature's options, excluding the ``range`` option.
+
+    The range only controls how much history is returned, not which data points are acquired,
+    so changing it doesn't start a new watermark. The watermark records the earliest date it
+    covers instead, so a wider range is still acquired in full.
+    """
+    canonical = sorted((option[SdasConstants.name_property],
+                        str(option.get(SdasConstants.value_property)),
+                        str(option.get('value_number')))
+                       for option in options
+                       if option[SdasConstants.name_property] != RANGE_OPTION)
+    return hashlib.sha1(json.dumps(canonical).encode('utf-8')).hexdigest()
+
+
+def tail_range(handler_name: str, since: dt.date, today: dt.date) -> Optional[str]:
+    """
+    Returns the smallest range that can be requested from a handler to acquire the trading
+    days after the given day, or ``None`` if the handler can't acquire a partial range.
+
+    Parameters
+    ----------
+    handler_name: str
+        Name of the feature handler function.
+
+    since: :class:`datetime.date`
+        Last day that has already been acquired, e.g. the feature's watermark.
+
+    today: :class:`datetime.date`
+        Date the range ends on.
+
+    Returns
+    -------
+    str:
+        Range option value to request the tail with.
+    """
+    start = since + dt.timedelta(days=1)
+    if handler_name == 'range_handler':
+        # Day ranges count trading days, not calendar days
+        return f'{max(len(get_calendar().get_days(start, today)), 1)}d'
+
+    if handler_name == 'batch_handler':
+        for chart_range in CHART_RANGES:
+            if get_calendar().get_range_start(today, chart_range) <= start:
+                return chart_range
+
+    return None
+
+
+class IncrementalFetch:
+    """
+    Feature fetch function for :func:`pydas.acquisition.iter_entities` that only requests the
+    data points missing since a feature's watermark.
+
+    Every data point acquired is written to the local store. Only features acquired with a
+    ``range`` option through one of the :data:`END_OF_DAY_HANDLERS` are read back from the
+    store, and are only requested again once a trading day has passed since their watermark.
+    All other features, including those with an ``exactDate`` option, are acquired in full with
+    :func:`pydas.acquisition.features.acquire_feature`. Features with several data points on
+    the same date, e.g. news, are neither written to nor served from the store.
+
+    Attributes
+    ----------
+    context: :class:`pydas_metadata.contexts.BaseContext`
+        Metadata context used to persist the watermarks.
+
+    store: :class:`pydas.stores.BaseStore`
+        Local store that acquired data points are written to and read from.
+    """
+
+    def __init__(self,
+                 metadata_context: BaseContext,
+                 store: BaseStore,
+                 today: Callable[[], dt.date] = None):
+        self.context = metadata_context
+        self.store = store
+        self._today = today or dt.date.today
+        self._locks: Dict[str, Lock] = dict()
+        self._lock = Lock()
+
+    def __call__(self,
+                 client: BaseDataClient,
+                 entity: Entity,
+                 request: FeatureRequest) -> FeatureResult:
+        return self.acquire(client, entity, request)
+
+    def acquire(self,
+                client: BaseDataClient,
+                entity: Entity,
+                request: FeatureRequest,
+                refresh: bool = False) -> FeatureResult:
+        """
+        Acquires the data for a single feature, only requesting the data points acquired since
+        the feature's watermark.
+
+        Parameters
+        ----------
+        client: :class:`pydas.clients.base.BaseDataClient`
+            Data client used to request the feature data.
+
+        entity: :class:`pydas_metadata.models.Entity`
+            Entity the feature data is acquired for.
+
+        request: :class:`pydas.acquisition.FeatureRequest`
+            Resolved feature and options to acquire.
+
+        refresh: bool
+            Flag indicating whether the full range should be requested regardless of the
+            watermark. Default: ``False``.
+
+        Returns
+        -------
+        :class:`pydas.acquisition.FeatureResult`:
+            Values within the configured range in date order, or the error raised while
+            acquiring them.
+        """
+        feature = request.feature
+        key = options_hash(request.options)
+        date_range = _get_option(request.options, RANGE_OPTION)
+        if date_range is None \
+                or _get_option(request.options, EXACT_DATE_OPTION) is not None \
+                or feature.handler_metadata.name not in END_OF_DAY_HANDLERS:
+            return self._write(entity, key, acquire_feature(client, entity, request))
+
+        today = self._today()
+        try:
+            window = calc_range(today, date_range)
+        except KeyError:
+            return self._write(entity, key, acquire_feature(client, entity, request))
+
+        start = today - dt.timedelta(days=window - 1)
+        with self._get_lock(entity.identifier, feature.name, key):
+            watermark = None
+            if not refresh:
+                watermark = self._get_covering_watermark(entity.identifier, feature.name, key, start)
+
+            partial_range = None
+            if watermark is not None and watermark >= start - dt.timedelta(days=1):
+                partial_range = tail_range(feature.handler_metadata.name, watermark, today)
+
+            first_date = None
+            if watermark is not None and not get_calendar().get_days(watermark + dt.timedelta(days=1), today):
+                logging.info('Serving "%s" for "%s" from the local store',
+                             feature.name, entity.identifier)
+                result = FeatureResult(feature.name)
+            elif partial_range is not None:
+                logging.info('Acquiring the %s since %s of "%s" for "%s"',
+                             partial_range, watermark, feature.name, entity.identifier)
+                result = acquire_feature(client, entity, FeatureRequest(
+                    feature, _replace_option(request.options, RANGE_OPTION, partial_range)))
+                if result.succeeded and _has_duplicate_dates(result.columns):
+                    result, first_date = acquire_feature(client, entity, request), start
+            else:
+                result, first_date = acquire_feature(client, entity, request), start
+
+            if not result.succeeded or _has_duplicate_dates(result.columns):
+                return result
+
+            dates = self._write(entity, key, result).columns.dates
+            if dates:
+                self._set_watermark(entity.identifier,
+                                    feature.name,
+                                    key,
+                                    dt.date.fromisoformat(max(dates)[:10]),
+                                    first_date)
+
+        points = self.store.read(entity.identifier, feature.name, key, start.isoformat())
+        dates = sorted(points)
+        return FeatureResult(feature.name,
+                             FeatureColumns.from_columns(dates, [points[date] for date in dates]))
+
+    def get_watermark(self, entity_id: str, feature_name: str, key: str) -> Optional[dt.date]:
+        """
+        Returns the latest date acquired for a feature of an entity, or ``None`` if the feature
+        hasn't been acquired with the given options before.
+        """
+        with self.context.get_session() as session:
+            watermark = session.query(AcquisitionWatermark).filter(
+                AcquisitionWatermark.entity_id == entity_id,
+                AcquisitionWatermark.feature_name == feature_name,
+                AcquisitionWatermark.options_hash == key).one_or_none()
+            return watermark.last_date if watermark is not None else None
+
+    def _get_covering_watermark(self,
+                                entity_id: str,
+                                feature_name: str,
+                                key: str,
+                                start: dt.date) -> Optional[dt.date]:
+        """
+        Returns the watermark of a feature, or ``None`` if the data points acquired so far
+        don't cover the range starting on the given date, e.g. after the range was widened.
+        """
+        with self.context.get_session() as session:
+            watermark = session.query(AcquisitionWatermark).filter(
+                AcquisitionWatermark.entity_id == entity_id,
+                AcquisitionWatermark.feature_name == feature_name,
+                AcquisitionWatermark.options_hash == key).one_or_none()
+            if watermark is None or watermark.first_date is None or watermark.first_date > start:
+                return None
+
+            return watermark.last_date
+
+    def _set_watermark(self,
+                       entity_id: str,
+                       feature_name: str,
+                       key: str,
+                       last_date: dt.date,
+                       first_date: dt.date = None):
+        """
+        Advances the watermark of a feature to the given latest date, and extends the dates it
+        covers back to the given earliest date, if any.
+        """
+        with self.context.get_session() as session:
+            watermark = session.query(AcquisitionWatermark).filter(
+                AcquisitionWatermark.entity_id == entity_id,
+                AcquisitionWatermark.feature_name == feature_name,
+                AcquisitionWatermark.options_hash == key).one_or_none()
+            if watermark is None:
+                watermark = AcquisitionWatermark(entity_id=entity_id,
+                                                 feature_name=feature_name,
+                                                 options_hash=key,
+                                                 last_date=last_date)
+
+            watermark.last_date = max(watermark.last_date, last_date)
+            if first_date is not None and (watermark.first_date is None or first_date < watermark.first_date):
+                watermark.first_date = first_date
+
+            session.add(watermark)
+
+    def _write(self, entity: Entity, key: str, result: FeatureResult) -> FeatureResult:
+        """
+        Writes the dated values of a succeeded feature result to the store, unless several of
+        its values share a date, which the store can't hold.
+        """
+        if result.succeeded and not _has_duplicate_dates(result.columns):
+            self.store.write(entity.identifier,
+                             result.feature_name,
+                             key,
+                             dict(zip(result.columns.dates, result.columns.get_values())))
+
+        return result
+
+    def _get_lock(self, *key) -> Lock:
+        with self._lock:
+            return self._locks.setdefault('/'.join(key), Lock())
+
+
+def _has_duplicate_dates(columns: FeatureColumns) -> bool:
+    return len(set(columns.dates)) != len(columns.dates)
+
+
+def _get_option(options: List[dict], name: str):
+    for option in options:
+        if option[SdasConstants.name_property] == name:
+            return option[SdasConstants.value_property]
+
+    return None
+
+
+def _replace_option(options: List[dict], name: str, value) -> List[dict]:
+    return [dict(option, **{SdasConstants.value_property: value})
+            if option[SdasConstants.name_property] == name else option
+            for option in options]
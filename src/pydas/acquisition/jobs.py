@@ -0,0 +1,240 @@
+"""
+Background acquisition jobs whose state is persisted in the metadata store.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+from os import path
+from pathlib import Path
+import tempfile
+from typing import Callable, List
+import uuid
+
+from pydas_metadata.contexts import BaseContext
+from pydas_metadata.models import AcquisitionJob, JobStatus
+
+from pydas.acquisition.features import (DEFAULT_MAX_WORKERS,
+                                        FeatureResult,
+                                        acquire_feature,
+                                        iter_entities)
+from pydas.acquisition.batching import MarketBatchClient
+from pydas.acquisition.plans import PlanCache
+from pydas.acquisition.singleflight import CoalescingClient, SingleFlight
+from pydas.clients.iex import IexClient
+from pydas.clients.iex_async import AsyncIexClient
+from pydas.formatters import FormatterFactory
+from pydas.transformers.aio import EventLoopThread
+from pydas.transformers.sessions import HttpSession
+
+DEFAULT_JOB_WORKERS = 2
+
+
+class JobManager:
+    """
+    Executes acquisitions on a pool of background workers and tracks their progress through
+    :class:`pydas_metadata.models.AcquisitionJob` objects in the metadata store.
+
+    Since all job state is persisted, jobs that were pending or running when the server stopped
+    can be resumed with :meth:`recover`.
+
+    Attributes
+    ----------
+    context: :class:`pydas_metadata.contexts.BaseContext`
+        Metadata context used to load entities and persist job state.
+
+    max_workers: int
+        Maximum number of features acquired concurrently by a single job.
+
+    result_path: str
+        Directory that completed job datasets are written to.
+
+    plan_cache: :class:`pydas.acquisition.PlanCache`
+        Cache of the compiled acquisition plans of each entity.
+
+    fetch: Callable
+        Function used to acquire a single feature, e.g. an
+        :class:`pydas.acquisition.IncrementalFetch`. Default:
+        :func:`pydas.acquisition.features.acquire_feature`.
+
+    feature_flight: :class:`pydas.acquisition.SingleFlight`
+        Single-flight group that identical feature data requests made by concurrent jobs and
+        routes share.
+
+    http_session: :class:`pydas.transformers.sessions.HttpSession`
+        Pooled HTTP session that feature data is requested through. Default: a new session
+        with the default configuration.
+
+    event_loop: :class:`pydas.transformers.aio.EventLoopThread`
+        Event loop that feature data requests are awaited on. Default: ``None``, so feature
+        data is requested on the worker threads.
+    """
+
+    def __init__(self,
+                 metadata_context: BaseContext,
+                 max_workers: int = None,
+                 job_workers: int = None,
+                 result_path: str = None,
+                 plan_cache: PlanCache = None,
+                 fetch: Callable[..., FeatureResult] = None,
+                 feature_flight: SingleFlight = None,
+                 http_session: HttpSession = None,
+                 event_loop: EventLoopThread = None):
+        self.context = metadata_context
+        self.plan_cache = plan_cache or PlanCache()
+        self.fetch = fetch or acquire_feature
+        self.feature_flight = feature_flight or SingleFlight()
+        self.http_session = http_session or HttpSession()
+        self.event_loop = event_loop
+        self.max_workers = max_workers or DEFAULT_MAX_WORKERS
+        self.result_path = result_path or path.join(tempfile.gettempdir(), 'pydas-jobs')
+        self._executor = ThreadPoolExecutor(max_workers=job_workers or DEFAULT_JOB_WORKERS,
+                                            thread_name_prefix='pydas-job')
+
+    def submit(self, identifiers: List[str]) -> AcquisitionJob:
+        """
+        Persists a new acquisition job and queues it for execution.
+
+        Parameters
+        ----------
+        identifiers: list[str]
+            Identifiers of the entities to acquire data for.
+
+        Returns
+        -------
+        :class:`pydas_metadata.models.AcquisitionJob`:
+            The pending job.
+        """
+        job = AcquisitionJob(id=uuid.uuid4().hex,
+                             entity_identifiers=(',').join(identifiers),
+                             status=JobStatus.PENDING.name,
+                             features_done=0,
+                             features_total=0)
+        with self.context.get_session() as session:
+            session.add(job)
+            session.flush()
+            session.refresh(job)
+            session.expunge(job)
+
+        logging.info('Submitted acquisition job %s', job.id)
+        self._executor.submit(self.run, job.id)
+        return job
+
+    def get_job(self, job_id: str) -> AcquisitionJob:
+        """
+        Returns the acquisition job with the given ID, or ``None`` if there is no such job.
+        """
+        with self.context.get_session() as session:
+            job = session.query(AcquisitionJob).filter(
+                AcquisitionJob.id == job_id).one_or_none()
+            if job is not None:
+                session.expunge(job)
+
+            return job
+
+    def recover(self) -> int:
+        """
+        Queues every job that was pending or running when the server last stopped.
+
+        Returns
+        -------
+        int:
+            Number of jobs that were queued.
+        """
+        with self.context.get_session() as session:
+            unfinished = session.query(AcquisitionJob).filter(
+                AcquisitionJob.status.in_([JobStatus.PENDING.name,
+                                           JobStatus.RUNNING.name])).all()
+            job_ids = [job.id for job in unfinished]
+
+        for job_id in job_ids:
+            logging.info('Resuming acquisition job %s', job_id)
+            self._executor.submit(self.run, job_id)
+
+        return len(job_ids)
+
+    def shutdown(self, wait: bool = True):
+        """Stops accepting jobs, optionally waiting for the queued jobs to finish."""
+        self._executor.shutdown(wait=wait)
+
+    def run(self, job_id: str):
+        """
+        Executes the acquisition job with the given ID, updating its progress after each
+        feature is acquired. The merged dataset is written to :attr:`result_path` as JSON.
+        """
+        logging.info('Running acquisition job %s', job_id)
+        self._update(job_id, status=JobStatus.RUNNING.name, features_done=0, message=None)
+        try:
+            with self.context.get_session() as session:
+                job = session.query(AcquisitionJob).filter(
+                    AcquisitionJob.id == job_id).one()
+                identifiers = job.identifiers
+
+            plans = self.plan_cache.get_plans(self.context, identifiers)
+            if not plans:
+                raise LookupError('Cannot find any of the requested entities')
+
+            errors = {identifier: 'Cannot find entity'
+                      for identifier in identifiers if identifier not in plans}
+            entity_requests = [plans[identifier] for identifier in identifiers if identifier in plans]
+            api_key = self.context.get_configuration('apiKey')
+            if self.event_loop is not None:
+                iex_client = AsyncIexClient(api_key, self.http_session, event_loop=self.event_loop)
+            else:
+                iex_client = IexClient(api_key, self.http_session)
+
+            client = CoalescingClient(MarketBatchClient(iex_client, entity_requests),
+                                      self.feature_flight)
+            total = sum(len(entity_request.requests) for entity_request in entity_requests)
+            self._update(job_id, features_total=total)
+
+            done = 0
+            entity_results = dict()
+            for entity, feature_results in iter_entities(client,
+                                                          entity_requests,
+                                                          self.max_workers,
+                                                          self.fetch):
+                results = dict()
+                for result in feature_results:
+                    results[result.feature_name] = result.columns
+                    if not result.succeeded:
+                        errors.setdefault(entity.identifier, dict())[
+                            result.feature_name] = str(result.error)
+
+                    done += 1
+                    self._update(job_id, features_done=done)
+
+                entity_results[entity.identifier] = results
+
+            if len(identifiers) == 1:
+                dataset = FormatterFactory.get_formatter('json').transform(
+                    entity_results[identifiers[0]])
+                errors = errors.get(identifiers[0], dict())
+            else:
+                dataset = FormatterFactory.get_formatter('panel').transform(entity_results)
+
+            if errors:
+                dataset['errors'] = errors
+
+            result_path = self._write_result(job_id, dataset)
+            self._update(job_id, status=JobStatus.COMPLETED.name, result_path=result_path)
+            logging.info('Completed acquisition job %s', job_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.error('Acquisition job %s failed: %s', job_id, exc)
+            self._update(job_id, status=JobStatus.FAILED.name, message=str(exc)[:255])
+
+    def _write_result(self, job_id: str, dataset: dict) -> str:
+        Path(self.result_path).mkdir(parents=True, exist_ok=True)
+        result_path = path.join(self.result_path, f'job_{job_id}.json')
+        with open(result_path, 'w') as file:
+            json.dump(dataset, file)
+
+        return result_path
+
+    def _update(self, job_id: str, **attributes):
+        with self.context.get_session() as session:
+            job = session.query(AcquisitionJob).filter(
+                AcquisitionJob.id == job_id).one()
+            for name, value in attributes.items():
+                setattr(job, name, value)
+
+            session.add(job)
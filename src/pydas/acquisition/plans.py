@@ -0,0 +1,132 @@
+"""
+Compiled acquisition plans that are cached in-process between acquisitions.
+
+An acquisition plan is an :class:`pydas.acquisition.EntityRequest` whose entity, features,
+handlers and options are detached snapshots of the metadata. Since a plan holds no reference
+to a metadata session, it can be shared by concurrent acquisitions and reused until the
+metadata it was compiled from is changed.
+"""
+import logging
+from threading import Lock
+from typing import Dict, List
+
+from sqlalchemy.orm import selectinload
+
+from pydas_metadata.contexts import BaseContext
+from pydas_metadata.models import Entity, Feature, Handler, Option
+
+from pydas.acquisition.features import EntityRequest, build_feature_requests
+
+
+def compile_plan(entity: Entity, options: List[Option]) -> EntityRequest:
+    """
+    Compiles the acquisition plan for an entity.
+
+    Parameters
+    ----------
+    entity: :class:`pydas_metadata.models.Entity`
+        Entity to compile the plan of. The entity's features and their handlers must already
+        be loaded.
+
+    options: list[:class:`pydas_metadata.models.Option`]
+        Options mapped to the entity.
+
+    Returns
+    -------
+    :class:`pydas.acquisition.EntityRequest`:
+        Detached snapshot of the entity and its resolved feature requests.
+    """
+    snapshot = Entity(identifier=entity.identifier,
+                      name=entity.name,
+                      category=entity.category)
+    requests = build_feature_requests(entity, options)
+    for request in requests:
+        feature = request.feature
+        request.feature = Feature(name=feature.name,
+                                  uri=feature.uri,
+                                  handler_id=feature.handler_id,
+                                  description=feature.description,
+                                  handler_metadata=Handler(id=feature.handler_metadata.id,
+                                                           name=feature.handler_metadata.name))
+
+        # Resolve the handler function while compiling, so acquisitions never import it.
+        request.feature.handler  # pylint: disable=pointless-statement
+
+    return EntityRequest(snapshot, requests)
+
+
+class PlanCache:
+    """
+    In-process cache of compiled acquisition plans, keyed by entity identifier.
+
+    Plans that aren't cached are loaded with a single eager-loaded query for all of the
+    missing entities and their features and handlers, and a single query for their options.
+    The routes that change entities, features or options invalidate the cache.
+    """
+
+    def __init__(self):
+        self._plans: Dict[str, EntityRequest] = dict()
+        self._generation = 0
+        self._lock = Lock()
+
+    def get_plan(self, metadata_context: BaseContext, identifier: str) -> EntityRequest:
+        """
+        Returns the acquisition plan for an entity, or ``None`` if the entity doesn't exist.
+        """
+        return self.get_plans(metadata_context, [identifier]).get(identifier)
+
+    def get_plans(self, metadata_context: BaseContext, identifiers: List[str]) -> Dict[str, EntityRequest]:
+        """
+        Returns the acquisition plans for several entities.
+
+        Parameters
+        ----------
+        metadata_context: :class:`pydas_metadata.contexts.BaseContext`
+            Metadata context used to load the plans that aren't cached.
+
+        identifiers: list[str]
+            Identifiers of the entities to return the plans of.
+
+        Returns
+        -------
+        dict[str, :class:`pydas.acquisition.EntityRequest`]:
+            Acquisition plans keyed by entity identifier. Entities that don't exist are omitted.
+        """
+        with self._lock:
+            generation = self._generation
+            plans = {identifier: self._plans[identifier]
+                     for identifier in identifiers if identifier in self._plans}
+
+        missing = [identifier for identifier in identifiers if identifier not in plans]
+        if not missing:
+            return plans
+
+        logging.debug('Compiling acquisition plans for %d entities', len(missing))
+        with metadata_context.get_session() as session:
+            entities = session.query(Entity).options(
+                selectinload(Entity.features).joinedload(Feature.handler_metadata)).filter(
+                    Entity.identifier.in_(missing)).all()
+            options = session.query(Option).filter(
+                Option.entity_id.in_(missing)).all()
+            compiled = {entity.identifier: compile_plan(entity, options) for entity in entities}
+
+        with self._lock:
+            # Plans compiled while the cache was invalidated may already be stale.
+            if generation == self._generation:
+                self._plans.update(compiled)
+
+        plans.update(compiled)
+        return plans
+
+    def invalidate(self, identifier: str = None):
+        """
+        Removes the plan of an entity from the cache, or every plan if no identifier is given.
+        """
+        with self._lock:
+            self._generation += 1
+            if identifier is None:
+                logging.debug('Invalidating all acquisition plans')
+                self._plans.clear()
+            else:
+                logging.debug('Invalidating acquisition plan for "%s"', identifier)
+                self._plans.pop(identifier, None)
@@ -0,0 +1,123 @@
+"""
+Coalescing of concurrent identical acquisitions, so that they share one in-flight computation.
+"""
+from concurrent.futures import Future
+import json
+import logging
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable
+
+from pydas_metadata.models import Entity, Feature
+
+from pydas.acquisition.features import extract_values
+from pydas.clients.base import BaseDataClient
+
+
+class SingleFlight:
+    """
+    Executes at most one call per key at a time. Callers that request a key while a call for
+    it is in flight wait for that call and receive its result, or its exception.
+
+    Results are shared by every caller, so they must not be mutated.
+
+    Attributes
+    ----------
+    coalesced: int
+        Number of calls that were served by another caller's in-flight call.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: Dict[Hashable, Future] = dict()
+        self._lock = Lock()
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Calls a function, unless a call with the same key is already in flight.
+
+        Parameters
+        ----------
+        key: Hashable
+            Key identifying identical calls.
+
+        function: Callable
+            Function to call if no identical call is in flight.
+
+        args: list
+            Positional arguments for the function.
+
+        kwargs: dict
+            Keyword arguments for the function.
+
+        Returns
+        -------
+        any:
+            Result of the function, or of the identical call that was already in flight.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+            else:
+                self.coalesced += 1
+
+        if not is_leader:
+            logging.debug('Waiting for in-flight call for %s', key)
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class CoalescingClient(BaseDataClient):
+    """
+    Data client that coalesces concurrent identical feature data requests made through another
+    data client.
+
+    Requests are identical when they are for the same feature, URI, entity, handler and options.
+    The feature data is returned as :class:`pydas.columns.FeatureColumns`, extracted once by the
+    request that was in flight.
+
+    Attributes
+    ----------
+    client: :class:`pydas.clients.base.BaseDataClient`
+        Data client that requests are delegated to.
+
+    flight: :class:`pydas.acquisition.SingleFlight`
+        Single-flight group shared by every client whose requests should be coalesced.
+    """
+
+    def __init__(self, client: BaseDataClient, flight: SingleFlight):
+        self.client = client
+        self.flight = flight
+
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
+        return False
+
+    def get_feature_data(self, feature: Feature, entity: Entity, options: list):
+        # Keyed by the request alone, so that requests made through different clients, e.g. a
+        # market batch client, coalesce with those of a single entity. The feature name is part
+        # of the key, as the shared columns are extracted for the leader's feature
+        key = (entity.identifier,
+               feature.name,
+               feature.uri,
+               feature.handler_metadata.name,
+               json.dumps(options, sort_keys=True, default=str))
+        return self.flight.do(key, self._get_feature_data, feature, entity, options)
+
+    def _get_feature_data(self, feature: Feature, entity: Entity, options: list):
+        # Records parsed from a streamed response can only be consumed once, so the leader
+        # extracts them as they are parsed and only the extracted columns are shared
+        return extract_values(feature, self.client.get_feature_data(feature, entity, options))
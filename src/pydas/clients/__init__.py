@@ -5,6 +5,7 @@ from typing import List
 from .aws import AwsS3Client
 from .base import BaseDataClient
 from .iex import IexClient
+from .iex_async import AsyncIexClient
 from .ipfs import IpfsArchiveClient
 
 
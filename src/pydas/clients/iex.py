@@ -1,7 +1,18 @@
 """Contains IEX Cloud specific client for data retrieval via REST API"""
 import logging
+from typing import List
 
 from pydas.clients.base import BaseDataClient
+from pydas.transformers import batch_handler
+from pydas.transformers.sessions import HttpSession
+
+MARKET_BATCH_URI = '/stock/market/batch'
+
+# Maximum number of symbols IEX Cloud accepts in a single market batch request.
+MAX_BATCH_SYMBOLS = 100
+
+# Maximum number of endpoint types IEX Cloud accepts in a single market batch request.
+MAX_BATCH_TYPES = 10
 
 
 # pylint: disable=too-few-public-methods
@@ -19,10 +30,15 @@ class IexClient(BaseDataClient):
 
     base_uri: str
         The base path to make requests against. Default: ``'https://cloud.iexapis.com'``.
+
+    session: :class:`pydas.transformers.sessions.HttpSession`
+        Pooled HTTP session that the feature handlers send their requests through. Default: a
+        new session with the default configuration.
     """
 
-    def __init__(self, apiKey: str):
+    def __init__(self, apiKey: str, session: HttpSession = None):
         self.key = apiKey
+        self.session = session or HttpSession()
         self.version = '/v1'
         self.base_uri = 'https://cloud.iexapis.com'
 
@@ -49,4 +65,51 @@ class IexClient(BaseDataClient):
                self.version +
                feature.uri.format(symbol=entity.identifier))
         logging.debug('Requesting data at %s', url)
-        return feature.handler(url, options, self.key)
+        return feature.handler(url, options, self.key, session=self.session)
+
+    def get_market_batch(self, symbols: List[str], types: List[str], options: list) -> dict:
+        """Retrieves several endpoint types for several symbols with market batch requests
+
+        The types are requested :data:`MAX_BATCH_TYPES` at a time, so more than that many
+        types are requested with one market batch request per chunk of types, and the
+        responses are merged.
+
+        Parameters
+        ----------
+        symbols: list[str]
+            Symbols to retrieve data for, at most :data:`MAX_BATCH_SYMBOLS`.
+
+        types: list[str]
+            Endpoint types to retrieve, e.g. ``quote`` or ``chart``.
+
+        options: list
+            Additional query options shared by every endpoint type (e.g. range).
+
+        Returns
+        -------
+        dict:
+            Data from IEX API keyed by symbol and then by endpoint type.
+
+        Raises
+        ------
+        ValueError:
+            If more than :data:`MAX_BATCH_SYMBOLS` symbols are given.
+        """
+        if len(symbols) > MAX_BATCH_SYMBOLS:
+            raise ValueError(f'A market batch supports at most {MAX_BATCH_SYMBOLS} symbols')
+
+        url = self.base_uri + self.version + MARKET_BATCH_URI
+        data = dict()
+        for start in range(0, len(types), MAX_BATCH_TYPES):
+            chunk = types[start:start + MAX_BATCH_TYPES]
+            logging.debug('Requesting %s for %d symbols at %s', (',').join(chunk), len(symbols), url)
+            response = batch_handler(url,
+                                     [{'name': 'symbols', 'value': (',').join(symbols)},
+                                      {'name': 'types', 'value': (',').join(chunk)},
+                                      *options],
+                                     self.key,
+                                     self.session)
+            for symbol, symbol_data in response.items():
+                data.setdefault(symbol, dict()).update(symbol_data)
+
+        return data
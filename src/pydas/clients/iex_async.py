@@ -0,0 +1,77 @@
+"""Contains the asyncio-based IEX Cloud client for data retrieval via REST API"""
+import asyncio
+from concurrent.futures import Executor
+import logging
+
+from pydas.clients.iex import IexClient
+from pydas.transformers import aio
+from pydas.transformers.sessions import HttpSession
+
+
+class AsyncIexClient(IexClient):
+    """
+    IEX Cloud client whose feature data requests can be awaited on an event loop.
+
+    Features whose handler has an asynchronous variant in :mod:`pydas.transformers.aio` are
+    requested with it. All other handlers are blocking, so they are run on an executor.
+
+    Feature data requested with :meth:`get_feature_data`, e.g. by the worker threads of the
+    acquisition pipeline, is awaited on :attr:`event_loop`.
+
+    Attributes
+    ----------
+    executor: :class:`concurrent.futures.Executor`
+        Executor that blocking handlers are run on. Default: the event loop's default executor.
+
+    event_loop: :class:`pydas.transformers.aio.EventLoopThread`
+        Event loop that blocking feature data requests are awaited on. Default: a new event
+        loop for each request.
+    """
+
+    def __init__(self,
+                 apiKey: str,
+                 session: HttpSession = None,
+                 executor: Executor = None,
+                 event_loop: aio.EventLoopThread = None):
+        super().__init__(apiKey, session)
+        self.executor = executor
+        self.event_loop = event_loop
+
+    @classmethod
+    def can_handle(cls, source: str) -> bool:
+        return source.lower() == 'iex-async'
+
+    def get_feature_data(self, feature, entity, options):
+        """Retrieves data from IEX Cloud REST API using the feature handler, blocking the
+        calling thread while the request is awaited on the client's event loop
+
+        See :meth:`pydas.clients.IexClient.get_feature_data` for a description of the
+        parameters and return value.
+        """
+        if self.event_loop is None:
+            return asyncio.run(self._get_feature_data(feature, entity, options))
+
+        return self.event_loop.run(self.get_feature_data_async(feature, entity, options))
+
+    async def get_feature_data_async(self, feature, entity, options):
+        """Retrieves data from IEX Cloud REST API using the feature handler, without blocking
+        the event loop
+
+        See :meth:`pydas.clients.IexClient.get_feature_data` for a description of the
+        parameters and return value.
+        """
+        url = (self.base_uri +
+               self.version +
+               feature.uri.format(symbol=entity.identifier))
+        handler = aio.get_handler(feature.handler_metadata.name)
+        if handler is not None:
+            logging.debug('Requesting data at %s', url)
+            return await handler(url, options, self.key, self.session)
+
+        logging.debug('Requesting data at %s with blocking handler', url)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, feature.handler, url, options, self.key, self.session)
+
+    async def _get_feature_data(self, feature, entity, options):
+        async with aio.open_session():
+            return await self.get_feature_data_async(feature, entity, options)
@@ -0,0 +1,128 @@
+"""
+Columnar feature data, which holds the values and dates acquired for a feature in two parallel
+arrays rather than as one ``(value, date)`` tuple per data point.
+
+Numeric values are stored in a NumPy array when NumPy is installed. Feature columns can still
+be used anywhere a collection of ``(value, date)`` tuples is expected, as they are a sequence
+of such tuples, but the formatters merge them column by column.
+"""
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def to_array(values: list) -> Any:
+    """
+    Returns numeric values as a NumPy array if NumPy is installed, otherwise the values as a
+    list. Values that aren't all integers or all numbers, e.g. text or missing values, are
+    always returned as a list.
+    """
+    if np is None or not len(values):
+        return list(values)
+
+    if isinstance(values, np.ndarray):
+        array = values
+    else:
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            return list(values)
+
+    return array if array.ndim == 1 and array.dtype.kind in 'iuf' else list(values)
+
+
+class FeatureColumns(Sequence):
+    """
+    Values and dates acquired for a feature, stored as parallel arrays.
+
+    Attributes
+    ----------
+    dates: list[str]
+        Date of each data point.
+
+    values: list or :class:`numpy.ndarray`
+        Value of each data point.
+
+    extra: dict[str, list]
+        Further series acquired with the feature, e.g. the bands of a technical indicator,
+        keyed by their column name. Each series is aligned with the dates.
+    """
+
+    __slots__ = ('dates', 'values', 'extra')
+
+    def __init__(self, dates: List[str] = None, values: Any = None, extra: Dict[str, Any] = None):
+        self.dates = dates if dates is not None else []
+        self.values = values if values is not None else []
+        self.extra = extra if extra is not None else dict()
+        if any(len(self.dates) != len(series) for series in [self.values, *self.extra.values()]):
+            raise ValueError('dates and values must be the same length')
+
+    @classmethod
+    def from_columns(cls, dates: list, values: list, extra: Dict[str, list] = None) -> 'FeatureColumns':
+        """Returns feature columns for parallel lists of dates, values and extra series."""
+        return cls(list(dates),
+                   to_array(values),
+                   {name: to_array(series) for name, series in (extra or dict()).items()})
+
+    @classmethod
+    def from_values(cls, values) -> 'FeatureColumns':
+        """
+        Returns feature columns for a collection of ``(value, date)`` tuples. Items that
+        aren't tuples are skipped. Feature columns are returned as is.
+        """
+        if isinstance(values, FeatureColumns):
+            return values
+
+        points = [value for value in values or [] if isinstance(value, tuple)]
+        return cls.from_columns([point[1] for point in points], [point[0] for point in points])
+
+    def get_values(self) -> list:
+        """Returns the values as a list of Python objects, e.g. for JSON serialization."""
+        if np is not None and isinstance(self.values, np.ndarray):
+            return self.values.tolist()
+
+        return list(self.values)
+
+    def get_extra_columns(self) -> List[Tuple[str, 'FeatureColumns']]:
+        """Returns the pairs of column name and feature columns of each extra series."""
+        return [(name, FeatureColumns(self.dates, series)) for name, series in self.extra.items()]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FeatureColumns(self.dates[index],
+                                  self.values[index],
+                                  {name: series[index] for name, series in self.extra.items()})
+
+        value = self.values[index]
+        return (value.item() if hasattr(value, 'item') else value, self.dates[index])
+
+    def __iter__(self) -> Iterator[Tuple[Any, str]]:
+        return zip(self.get_values(), self.dates)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f'FeatureColumns({list(self)!r})'
+
+
+def iter_points(values: Iterable) -> Iterator[Tuple[str, Any]]:
+    """
+    Returns an iterator of ``(date, value)`` pairs over feature columns, or over a collection
+    of ``(value, date)`` tuples, skipping items that aren't tuples. Feature columns are iterated
+    column by column, converting their values to Python objects in a single pass.
+    """
+    if isinstance(values, FeatureColumns):
+        return zip(values.dates, values.get_values())
+
+    return ((value[1], value[0]) for value in values if isinstance(value, tuple))
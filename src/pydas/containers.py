@@ -2,7 +2,9 @@ from logging.config import dictConfig
 
 from dependency_injector import containers, providers
 
-from pydas import clients
+from pydas import acquisition, clients, stores
+from pydas.formatters import blocks
+from pydas.transformers import aio, sessions, text
 from pydas_metadata import contexts
 
 
@@ -13,9 +15,65 @@ class ApplicationContainer(containers.DeclarativeContainer):
     configure_logging = providers.Resource(dictConfig,
                                            config=config.logging)
 
+    http_session = providers.Resource(sessions.open_session,
+                                      pool_size=config.acquisition.http.pool_size,
+                                      timeout=config.acquisition.http.timeout,
+                                      max_retries=config.acquisition.http.max_retries,
+                                      max_in_flight=config.acquisition.http.max_in_flight,
+                                      retries=config.acquisition.http.retries,
+                                      retry_backoff=config.acquisition.http.retry_backoff,
+                                      stream_json=config.acquisition.http.stream_json,
+                                      chunk_size=config.acquisition.http.chunk_size)
+
+    event_loop = providers.Resource(aio.open_event_loop,
+                                    enabled=config.acquisition.aio.enabled,
+                                    max_connections=config.acquisition.aio.max_connections,
+                                    timeout=config.acquisition.http.timeout)
+
+    text_preprocessor = providers.Resource(text.configure_preprocessor,
+                                           processes=config.acquisition.news.processes,
+                                           min_batch_size=config.acquisition.news.min_batch_size,
+                                           preload=config.acquisition.news.preload)
+
+    block_compressor = providers.Resource(blocks.configure_compressor,
+                                          processes=config.formatters.compression.processes,
+                                          block_size=config.formatters.compression.block_size,
+                                          level=config.formatters.compression.level)
+
     context_factory = providers.Factory(contexts.ContextFactory.get_context,
                                         context_type=config.database.dialect,
                                         database=config.database.initial_catalog,
                                         hostname=config.database.hostname,
                                         port=config.database.port,
                                         username=config.database.username)
+
+    plan_cache = providers.Singleton(acquisition.PlanCache)
+
+    result_cache = providers.Singleton(acquisition.ResultCache,
+                                       max_entries=config.acquisition.cache.max_entries,
+                                       default_ttl=config.acquisition.cache.default_ttl,
+                                       ttls=config.acquisition.cache.ttls,
+                                       end_of_day_ttl=config.acquisition.cache.end_of_day_ttl)
+
+    entity_flight = providers.Singleton(acquisition.SingleFlight)
+
+    feature_flight = providers.Singleton(acquisition.SingleFlight)
+
+    store = providers.Singleton(stores.StoreFactory.get_store,
+                                store_type=config.acquisition.store.type,
+                                path=config.acquisition.store.path)
+
+    incremental_fetch = providers.Singleton(acquisition.IncrementalFetch,
+                                            metadata_context=context_factory,
+                                            store=store)
+
+    job_manager = providers.Singleton(acquisition.JobManager,
+                                      metadata_context=context_factory,
+                                      max_workers=config.acquisition.max_workers,
+                                      job_workers=config.acquisition.jobs.max_workers,
+                                      result_path=config.acquisition.jobs.result_path,
+                                      plan_cache=plan_cache,
+                                      fetch=incremental_fetch,
+                                      feature_flight=feature_flight,
+                                      http_session=http_session,
+                                      event_loop=event_loop)
@@ -2,10 +2,15 @@
 
 from typing import List
 
+from .arrays import NpyFormatter, NpzFormatter
 from .base import BaseFormatter
+from .chain import STAGE_SEPARATOR, FormatterChain, get_stages
+from .columnar import ColumnarFormatter, ColumnarReader
 from .compression import CompressionFormatter
 from .file import FileFormatter
 from .json import JsonFormatter
+from .ndjson import NdjsonFormatter
+from .panel import PanelFormatter
 
 
 class FormatterFactory:
@@ -13,20 +18,31 @@ class FormatterFactory:
     Provides a centralized store for output formatters.
 
     The factory is pre-seeded with built-in formatters commonly used by the core sDAS solution.
-    These formatters include :class:`pydas.formatters.FileFormatter`,
-    :class:`pydas.formatters.FileFormatter`, and :class:`pydas.formatters.JsonFormatter`. There is
+    These formatters include :class:`pydas.formatters.ColumnarFormatter`,
+    :class:`pydas.formatters.CompressionFormatter`, :class:`pydas.formatters.FileFormatter`,
+    :class:`pydas.formatters.JsonFormatter`,
+    :class:`pydas.formatters.NdjsonFormatter`, :class:`pydas.formatters.NpyFormatter`,
+    :class:`pydas.formatters.NpzFormatter`, and :class:`pydas.formatters.PanelFormatter`. There is
     also a ``register_formatter`` function for registering user-defined formatters for additional
     output formatting.
 
+    Output formats that join several formats with a ``+``, e.g. ``csv+gzip``, are served by a
+    :class:`pydas.formatters.FormatterChain` of the formatters of each format.
+
     Attributes
     ----------
     formatters: list[BaseFormatter]
         Collection of built-in output formatters.
     """
 
-    formatters: List[BaseFormatter] = [CompressionFormatter,
+    formatters: List[BaseFormatter] = [ColumnarFormatter,
+                                       CompressionFormatter,
                                        FileFormatter,
-                                       JsonFormatter]
+                                       JsonFormatter,
+                                       NdjsonFormatter,
+                                       NpyFormatter,
+                                       NpzFormatter,
+                                       PanelFormatter]
 
     @classmethod
     def register_formatter(cls, formatter: BaseFormatter):
@@ -56,7 +72,8 @@ class FormatterFactory:
         Parameters
         ----------
         output_format: str
-            The name of the output formatter to retrieve. Example: ``"file"``.
+            The name of the output formatter to retrieve. Example: ``"file"``, or
+            ``"csv+gzip"`` for a chain of formatters.
 
         Returns
         -------
@@ -69,6 +86,10 @@ class FormatterFactory:
             Thrown if there are no registered output formatters that supports
             the given format.
         """
+        stages = get_stages(output_format)
+        if len(stages) > 1:
+            return FormatterChain([(stage, cls.get_formatter(stage)) for stage in stages])
+
         for formatter in cls.formatters:
             if formatter.can_handle(output_format):
                 return formatter()
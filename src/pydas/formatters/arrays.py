@@ -0,0 +1,145 @@
+from datetime import datetime
+import io
+import logging
+from typing import Any, Iterator, List
+import zipfile
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pydas.constants import SdasConstants, UtilityConstants
+from pydas.formatters.base import BaseFormatter
+
+# Number of rows written to each chunk of a streamed .npy file.
+DEFAULT_CHUNK_ROWS = 65536
+
+
+class NpzFormatter(BaseFormatter):
+    """
+    Data formatter for converting a merged dataset into a NumPy ``.npz`` archive, with a
+    ``date`` index array followed by one typed array per feature in header order, so machine
+    learning consumers can load the dataset with :func:`numpy.load` rather than parsing
+    delimited text.
+
+    Dates are stored as ``datetime64`` values when every date can be parsed as an ISO date.
+    Numeric features are stored as ``int64``, or as ``float64`` with ``NaN`` for missing values,
+    and any other feature as Unicode strings. NumPy must be installed, e.g. with the
+    ``columnar`` extra, for the format to be available.
+    """
+
+    content_type = 'application/octet-stream'
+    extension = 'npz'
+    attachment = True
+
+    @classmethod
+    def can_handle(cls, output_format: str) -> bool:
+        return np is not None and output_format.lower() == cls.extension
+
+    def transform(self, data: dict, **format_options) -> Any:
+        """
+        Transform a merged dataset into a binary bundle of NumPy arrays.
+
+        Parameters
+        ----------
+        data: dict
+            Merged dataset with a ``header`` and ``values``, as returned by
+            :class:`pydas.formatters.JsonFormatter`.
+
+        format_options: dict
+            Additional formatting options.
+
+        Returns
+        -------
+        Iterator[bytes]:
+            Generator of the chunks of the bundle.
+        """
+        header = data[SdasConstants.header_property]
+        rows = data[SdasConstants.multi_value_property]
+        columns = list(zip(*rows)) if rows else [()] * len(header)
+        arrays = [to_typed_array(column, is_date=i == 0) for i, column in enumerate(columns)]
+        logging.debug('Converted %d columns of %d rows to arrays', len(arrays), len(rows))
+        return self._encode(header, arrays)
+
+    def get_filename(self) -> str:
+        """Returns the timestamped name of a bundle created now."""
+        return f'data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{self.extension}'
+
+    def _encode(self, header: List[str], arrays: list) -> Iterator[bytes]:
+        # Members are written explicitly rather than with numpy.savez, whose keyword arguments
+        # can't hold feature names such as "file" or names that aren't Python identifiers
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name, array in zip(header, arrays):
+                with archive.open(f'{name}.npy', 'w', force_zip64=True) as member:
+                    np.lib.format.write_array(member, array, allow_pickle=False)
+
+        yield buffer.getvalue()
+
+
+class NpyFormatter(NpzFormatter):
+    """
+    Data formatter for converting a merged dataset into a single NumPy ``.npy`` file of a
+    structured array, with a ``date`` field followed by one typed field per feature.
+
+    The ``.npy`` header describes the name and type of every field, so the file is loaded
+    without copying with ``numpy.load(filename, mmap_mode='r')``, and each feature is read as
+    a zero-copy view, e.g. ``array['close']``. Values are typed as by
+    :class:`pydas.formatters.NpzFormatter`.
+    """
+
+    extension = 'npy'
+
+    def _encode(self, header: List[str], arrays: list) -> Iterator[bytes]:
+        records = np.empty(len(arrays[0]) if arrays else 0,
+                           dtype=[(name, array.dtype) for name, array in zip(header, arrays)])
+        for name, array in zip(header, arrays):
+            records[name] = array
+
+        buffer = io.BytesIO()
+        header_data = np.lib.format.header_data_from_array_1_0(records)
+        try:
+            np.lib.format.write_array_header_1_0(buffer, header_data)
+        except ValueError:
+            # Version 1.0 headers are limited to 64 KiB, which many features may exceed
+            np.lib.format.write_array_header_2_0(buffer, header_data)
+        yield buffer.getvalue()
+
+        for start in range(0, len(records), DEFAULT_CHUNK_ROWS):
+            yield records[start:start + DEFAULT_CHUNK_ROWS].tobytes()
+
+
+def to_typed_array(values: tuple, is_date: bool = False) -> Any:
+    """
+    Converts a column of a merged dataset into a typed NumPy array.
+
+    Parameters
+    ----------
+    values: tuple
+        Values of the column.
+
+    is_date: bool
+        Flag indicating whether the column contains dates, which are stored as ``datetime64``
+        values if they can be parsed.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`:
+        Array of ``datetime64``, ``int64``, ``float64``, ``bool`` or Unicode values.
+    """
+    if is_date:
+        try:
+            return np.array(values, dtype='datetime64')
+        except ValueError:
+            return np.array([str(value) for value in values], dtype=str)
+
+    array = np.array(values)
+    if array.dtype.kind in 'biuf':
+        return array.astype(np.int64) if array.dtype.kind in 'iu' else array
+
+    try:
+        return np.array([np.nan if value == UtilityConstants.str_empty else value for value in values],
+                        dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array([str(value) for value in values], dtype=str)
@@ -0,0 +1,302 @@
+"""
+Block-parallel compression engine used by :class:`pydas.formatters.CompressionFormatter`.
+
+Input is split into independent blocks, which are compressed across a pool of worker
+processes and written back in order, so multi-gigabyte exports are compressed on every
+core rather than on a single thread. The output remains readable by standard tools:
+
+* Gzip output is a multi-member gzip file with one member per block, which ``gzip -d``,
+  :mod:`gzip` and every other conforming reader decompress as a single stream.
+* Zip entries are a single raw deflate stream. Each block is compressed independently and
+  ended with a sync flush, so that the blocks concatenate into a valid deflate stream,
+  which is closed with an empty final block.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import logging
+import struct
+import time
+from threading import Lock
+from typing import Callable, Iterable, Iterator, List, Tuple
+import zlib
+
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_LEVEL = 6
+
+# zlib window bits that produce a gzip header and trailer, and a raw deflate stream.
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+DEFLATE_WBITS = -zlib.MAX_WBITS
+
+# Empty final deflate block that closes a stream of sync flushed blocks.
+_DEFLATE_END = zlib.compressobj(DEFAULT_LEVEL, zlib.DEFLATED, DEFLATE_WBITS).flush()
+
+
+def iter_blocks(chunks: Iterable[bytes], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    """Regroups chunks of bytes of any size into blocks of ``block_size`` bytes."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= block_size:
+            yield bytes(buffer[:block_size])
+            del buffer[:block_size]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_file_blocks(filename: str, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    """Reads a file in blocks of ``block_size`` bytes."""
+    with open(filename, 'rb') as file:
+        block = file.read(block_size)
+        while block:
+            yield block
+            block = file.read(block_size)
+
+
+class BlockCompressor:
+    """
+    Compresses streams of blocks across a pool of worker processes.
+
+    Attributes
+    ----------
+    processes: int
+        Number of worker processes that blocks are compressed with. Blocks are compressed in
+        the calling thread if this is ``0`` or ``1``, or if a stream only has one block.
+
+    block_size: int
+        Number of bytes in each independently compressed block.
+
+    level: int
+        Compression level, from ``1`` (fastest) to ``9`` (smallest).
+    """
+
+    def __init__(self, processes: int = None, block_size: int = None, level: int = None):
+        self.processes = processes or 0
+        self.block_size = block_size or DEFAULT_BLOCK_SIZE
+        self.level = level if level is not None else DEFAULT_LEVEL
+        self._executor: ProcessPoolExecutor = None
+        self._lock = Lock()
+
+    def gzip(self, blocks: Iterable[bytes]) -> Iterator[bytes]:
+        """Compresses blocks into the members of a multi-member gzip stream, in order."""
+        return self._map(partial(_gzip_block, level=self.level), blocks)
+
+    def deflate(self, blocks: Iterable[bytes]) -> 'DeflateStream':
+        """
+        Compresses blocks into a raw deflate stream, e.g. for a zip entry. The CRC-32 and size
+        of the uncompressed data are tallied as the stream is consumed.
+        """
+        return DeflateStream(self, blocks)
+
+    def close(self):
+        """Shuts down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+    def _map(self, func: Callable[[bytes], bytes], blocks: Iterable[bytes]) -> Iterator[bytes]:
+        blocks = iter(blocks)
+        first = next(blocks, None)
+        if first is None:
+            return
+
+        second = next(blocks, None)
+        if second is None or self.processes <= 1:
+            yield func(first)
+            if second is not None:
+                yield func(second)
+                yield from map(func, blocks)
+            return
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes)
+            executor = self._executor
+
+        # Only a few blocks per worker are compressed ahead of the consumer, bounding memory
+        pending = deque([executor.submit(func, first), executor.submit(func, second)])
+        for block in blocks:
+            if len(pending) >= self.processes * 2:
+                yield pending.popleft().result()
+
+            pending.append(executor.submit(func, block))
+
+        while pending:
+            yield pending.popleft().result()
+
+
+class DeflateStream:
+    """
+    Raw deflate stream of blocks compressed by a :class:`BlockCompressor`.
+
+    Attributes
+    ----------
+    crc: int
+        CRC-32 of the uncompressed data consumed so far.
+
+    size: int
+        Number of uncompressed bytes consumed so far.
+    """
+
+    def __init__(self, compressor: BlockCompressor, blocks: Iterable[bytes]):
+        self.crc = 0
+        self.size = 0
+        self._compressed = compressor._map(  # pylint: disable=protected-access
+            partial(_deflate_block, level=compressor.level), self._tally(blocks))
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._compressed
+        yield _DEFLATE_END
+
+    def _tally(self, blocks: Iterable[bytes]) -> Iterator[bytes]:
+        for block in blocks:
+            self.crc = zlib.crc32(block, self.crc)
+            self.size += len(block)
+            yield block
+
+
+def _gzip_block(block: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(block) + compressor.flush()
+
+
+def _deflate_block(block: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, DEFLATE_WBITS)
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class ZipStreamWriter:
+    """
+    Writes a zip archive sequentially, e.g. into an HTTP response, from entries compressed by
+    a :class:`BlockCompressor`. Entries are written with a trailing data descriptor, so that
+    their sizes and CRC-32 needn't be known before they are compressed, and with ZIP64
+    extensions, so that entries and archives may exceed 4 GiB.
+    """
+
+    def __init__(self, compressor: BlockCompressor):
+        self.compressor = compressor
+        self._offset = 0
+        self._entries: List[Tuple[bytes, int, int, int, int, Tuple[int, int]]] = []
+
+    def write_entry(self, name: str, blocks: Iterable[bytes]) -> Iterator[bytes]:
+        """Returns the bytes of a deflated entry named ``name`` containing the given blocks."""
+        encoded_name = name.encode('utf-8')
+        date_time = _get_dos_date_time()
+        offset = self._offset
+        yield self._count(struct.pack('<4s2B4HL2L2H',
+                                      b'PK\x03\x04', _ZIP64_VERSION, 0, _FLAGS, zlib.DEFLATED,
+                                      date_time[1], date_time[0], 0, _MAX_32, _MAX_32,
+                                      len(encoded_name), 20)
+                          + encoded_name
+                          + struct.pack('<HHQQ', 1, 16, 0, 0))
+
+        stream = self.compressor.deflate(blocks)
+        compressed_size = 0
+        for data in stream:
+            compressed_size += len(data)
+            yield self._count(data)
+
+        yield self._count(struct.pack('<4sLQQ', b'PK\x07\x08', stream.crc, compressed_size, stream.size))
+        self._entries.append((encoded_name, stream.crc, compressed_size, stream.size, offset, date_time))
+
+    def close(self) -> Iterator[bytes]:
+        """Returns the bytes of the central directory that ends the archive."""
+        start = self._offset
+        for name, crc, compressed_size, size, offset, date_time in self._entries:
+            extra = b''
+            for value in (size, compressed_size, offset):
+                if value >= _MAX_32:
+                    extra += struct.pack('<Q', value)
+
+            if extra:
+                extra = struct.pack('<HH', 1, len(extra)) + extra
+
+            yield self._count(struct.pack('<4s4B4HL2L5H2L',
+                                          b'PK\x01\x02', _ZIP64_VERSION, 3, _ZIP64_VERSION, 0,
+                                          _FLAGS, zlib.DEFLATED, date_time[1], date_time[0], crc,
+                                          min(compressed_size, _MAX_32), min(size, _MAX_32),
+                                          len(name), len(extra), 0, 0, 0, 0o100644 << 16,
+                                          min(offset, _MAX_32))
+                              + name
+                              + extra)
+
+        end = self._offset
+        count = len(self._entries)
+        if count >= 0xFFFF or start >= _MAX_32 or end - start >= _MAX_32:
+            yield self._count(struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, _ZIP64_VERSION,
+                                          _ZIP64_VERSION, 0, 0, count, count, end - start, start))
+            yield self._count(struct.pack('<4sLQL', b'PK\x06\x07', 0, end, 1))
+
+        yield self._count(struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, min(count, 0xFFFF),
+                                      min(count, 0xFFFF), min(end - start, _MAX_32),
+                                      min(start, _MAX_32), 0))
+
+    def _count(self, data: bytes) -> bytes:
+        self._offset += len(data)
+        return data
+
+
+# Version 4.5 of the zip specification, which introduced ZIP64 extensions.
+_ZIP64_VERSION = 45
+# Data descriptor follows the entry data, and names are UTF-8 encoded.
+_FLAGS = 0x08 | 0x800
+_MAX_32 = 0xFFFFFFFF
+
+
+def _get_dos_date_time() -> Tuple[int, int]:
+    now = time.localtime()
+    return ((now.tm_year - 1980) << 9 | now.tm_mon << 5 | now.tm_mday,
+            now.tm_hour << 11 | now.tm_min << 5 | now.tm_sec // 2)
+
+
+_compressor: BlockCompressor = None
+_compressor_lock = Lock()
+
+
+def get_compressor() -> BlockCompressor:
+    """
+    Returns the block compressor shared by the compression formatters, creating a compressor
+    with the default configuration if :func:`configure_compressor` hasn't been called.
+    """
+    global _compressor  # pylint: disable=global-statement
+    with _compressor_lock:
+        if _compressor is None:
+            _compressor = BlockCompressor()
+
+        return _compressor
+
+
+def configure_compressor(processes: int = None, block_size: int = None, level: int = None):
+    """
+    Replaces the block compressor shared by the compression formatters, closing the previous
+    compressor.
+
+    Parameters
+    ----------
+    processes: int
+        Number of worker processes that blocks are compressed with. Default: ``0``.
+
+    block_size: int
+        Number of bytes in each independently compressed block. Default: ``4194304``.
+
+    level: int
+        Compression level, from ``1`` (fastest) to ``9`` (smallest). Default: ``6``.
+
+    Returns
+    -------
+    :class:`pydas.formatters.blocks.BlockCompressor`:
+        The shared block compressor.
+    """
+    global _compressor  # pylint: disable=global-statement
+    compressor = BlockCompressor(processes, block_size, level)
+    logging.info('Compressing %d byte blocks with %d processes', compressor.block_size, compressor.processes)
+    with _compressor_lock:
+        previous, _compressor = _compressor, compressor
+
+    if previous is not None:
+        previous.close()
+
+    return compressor
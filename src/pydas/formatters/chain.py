@@ -0,0 +1,134 @@
+from datetime import datetime
+import re
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from pydas.formatters.base import BaseFormatter
+from pydas.formatters.compression import CompressionType
+
+# Separator of the stages of a chained output format, e.g. ``csv+gzip``. An unescaped ``+`` in
+# a query string is decoded as a space, so stages may also be separated by spaces.
+STAGE_SEPARATOR = '+'
+
+_STAGE_SEPARATORS = re.compile(r'[+\s]+')
+
+
+def get_stages(output_format: str) -> List[str]:
+    """Returns the lower-case names of the stages of an output format, e.g. ``['csv', 'gzip']``."""
+    return _STAGE_SEPARATORS.split(output_format.strip().lower())
+
+
+class FormatterChain(BaseFormatter):
+    """
+    Data formatter that composes several formatters into a single-pass pipeline, e.g.
+    ``csv+gzip`` or ``ndjson+zip``.
+
+    The first stage transforms a merged dataset into chunks of text, e.g. the chunks of a
+    delimited file or NDJSON lines, and each following stage consumes the chunks of the
+    previous stage as they are produced, e.g. to compress them. The formatted dataset is
+    therefore never held in memory as a whole, nor written to disk uncompressed.
+
+    Chains are created by :class:`pydas.formatters.FormatterFactory` for output formats
+    containing a ``+``.
+
+    Attributes
+    ----------
+    stages: list[tuple[str, BaseFormatter]]
+        Name and formatter of each stage, in pipeline order. The first stage must declare the
+        ``extension`` and ``content_type`` of its output, and every following stage must
+        provide a ``stream`` method that consumes and returns an iterator of bytes.
+    """
+
+    attachment = True
+
+    def __init__(self, stages: List[Tuple[str, BaseFormatter]]):
+        if len(stages) < 2:
+            raise ValueError('A formatter chain requires at least two stages')
+
+        if not hasattr(stages[0][1], 'extension'):
+            raise KeyError(f'Unsupported formatter chain stage: "{stages[0][0]}".')
+
+        for name, formatter in stages[1:]:
+            if not callable(getattr(formatter, 'stream', None)):
+                raise KeyError(f'Unsupported formatter chain stage: "{name}".')
+
+        self.stages = stages
+
+    @classmethod
+    def can_handle(cls, output_format: str) -> bool:
+        return False
+
+    @property
+    def content_type(self) -> str:
+        """Returns the media type of the output of the last stage."""
+        return _get_stage_type(self.stages[-1]).content_type
+
+    def get_filename(self) -> str:
+        """Returns the timestamped file name of the chain's output, e.g. ``data_<date>.csv.gz``."""
+        filename = f'data_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+        for stage in self.stages:
+            filename += f'.{_get_stage_type(stage).extension}'
+
+        return filename
+
+    def transform(self, data: dict, **format_options) -> Any:
+        """
+        Transform a merged dataset through every stage of the chain.
+
+        Parameters
+        ----------
+        data: dict
+            Merged dataset accepted by the first stage.
+
+        format_options: dict
+            Additional formatting options, passed to every stage.
+
+        Returns
+        -------
+        Iterator[bytes]:
+            Generator of the chunks of the output of the last stage.
+        """
+        name, formatter = self.stages[0]
+        return self.pipe(formatter.transform(data, **dict(format_options, output_format=name)),
+                         **format_options)
+
+    def pipe(self, chunks: Iterable, **format_options) -> Iterator[bytes]:
+        """
+        Streams chunks produced by the first stage through the following stages, e.g. NDJSON
+        lines written while the features of a dataset are acquired.
+
+        Parameters
+        ----------
+        chunks: Iterable
+            Chunks of text or bytes produced by the first stage.
+
+        format_options: dict
+            Additional formatting options, passed to every stage.
+
+        Returns
+        -------
+        Iterator[bytes]:
+            Generator of the chunks of the output of the last stage.
+        """
+        stream = _encode(chunks)
+        filename = self.get_filename()
+        for i, (name, formatter) in enumerate(self.stages[1:], start=1):
+            # Archives name their contents after the output of the previous stages
+            stream = formatter.stream(stream,
+                                      **dict(format_options,
+                                             output_format=name,
+                                             filename=filename.rsplit('.', len(self.stages) - i)[0]))
+
+        return stream
+
+
+def _encode(chunks: Iterable) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def _get_stage_type(stage: Tuple[str, BaseFormatter]):
+    name, formatter = stage
+    try:
+        return CompressionType.get_compression_type(name)
+    except KeyError:
+        return formatter
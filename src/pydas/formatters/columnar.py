@@ -0,0 +1,437 @@
+"""
+Compact, self-describing columnar dataset format, and a reader for partial reads of archived
+datasets.
+
+A columnar file stores a merged dataset in chunks of rows. Within each chunk every column
+is stored separately with an encoding chosen for its type, so a reader only touches the
+bytes of the columns and chunks that it needs:
+
+* ``date`` columns of ISO dates are delta encoded, as the narrowest integers that hold the
+  difference in days between each date and the first date of the chunk.
+* ``int64`` columns are stored as the narrowest integers that hold their values.
+* ``float64`` columns are stored as doubles, with ``NaN`` for missing values.
+* ``string`` columns, e.g. news summaries, and ``json`` columns of any other values are
+  dictionary encoded, as the distinct values of the chunk followed by the narrowest
+  integer code of each row's value.
+
+A file is laid out as the ``PDC1`` magic number, the column chunks, a UTF-8 JSON footer that
+describes the columns and indexes the offset, encoding and date range of every column chunk,
+the length of the footer as a little-endian 32-bit integer, and the magic number again.
+"""
+from array import array
+from datetime import date, datetime, timedelta
+import json
+import math
+import mmap
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from pydas.constants import SdasConstants, UtilityConstants
+from pydas.formatters.base import BaseFormatter
+
+MAGIC = b'PDC1'
+VERSION = 1
+
+# Number of rows stored in each chunk of a columnar file.
+DEFAULT_CHUNK_ROWS = 16384
+
+_EPOCH = date(1970, 1, 1)
+_FOOTER_LENGTH = struct.Struct('<I')
+# Array type codes of 1, 2, 4 and 8 byte integers.
+_SIGNED_CODES = 'bhiq'
+_UNSIGNED_CODES = 'BHIQ'
+
+
+class ColumnarFormatter(BaseFormatter):
+    """
+    Data formatter for converting a merged dataset into a columnar file, which is read by
+    :class:`pydas.formatters.ColumnarReader` without loading the rest of the file.
+
+    The type of each column is inferred from all of its values. The ``date`` column is
+    stored as dates if every value is an ISO date and as strings otherwise. Missing values
+    of numeric features are stored as ``NaN``.
+    """
+
+    content_type = 'application/octet-stream'
+    extension = 'pdc'
+    attachment = True
+
+    @classmethod
+    def can_handle(cls, output_format: str) -> bool:
+        return output_format.lower() in ('pdc', 'columnar')
+
+    def transform(self, data: dict, chunk_rows: int = DEFAULT_CHUNK_ROWS, **format_options) -> Iterator[bytes]:
+        """
+        Transform a merged dataset into a columnar file.
+
+        Parameters
+        ----------
+        data: dict
+            Merged dataset with a ``header`` and ``values``, as returned by
+            :class:`pydas.formatters.JsonFormatter`.
+
+        chunk_rows: int
+            Number of rows stored in each chunk. Default: ``16384``.
+
+        format_options: dict
+            Additional formatting options.
+
+        Returns
+        -------
+        Iterator[bytes]:
+            Generator of the chunks of the file.
+        """
+        header = data[SdasConstants.header_property]
+        rows = data[SdasConstants.multi_value_property]
+        columns = list(zip(*rows)) if rows else [()] * len(header)
+        types = [get_column_type(column, is_date=i == 0) for i, column in enumerate(columns)]
+        footer = {
+            'version': VERSION,
+            'rows': len(rows),
+            'columns': [{'name': name, 'type': column_type, 'encoding': _ENCODINGS[column_type]}
+                        for name, column_type in zip(header, types)],
+            'chunks': []
+        }
+
+        offset = len(MAGIC)
+        yield MAGIC
+        for start in range(0, len(rows), chunk_rows):
+            chunk = {'rows': min(chunk_rows, len(rows) - start), 'columns': []}
+            for i, (column, column_type) in enumerate(zip(columns, types)):
+                values = column[start:start + chunk_rows]
+                encoded, metadata = _ENCODERS[column_type](values)
+                chunk['columns'].append(dict(metadata, offset=offset, length=len(encoded)))
+                if i == 0 and values and column_type in ('date', 'string'):
+                    chunk['dates'] = [min(values), max(values)]
+
+                offset += len(encoded)
+                yield encoded
+
+            footer['chunks'].append(chunk)
+
+        encoded_footer = json.dumps(footer, separators=(',', ':')).encode('utf-8')
+        yield encoded_footer + _FOOTER_LENGTH.pack(len(encoded_footer)) + MAGIC
+
+    @staticmethod
+    def get_filename() -> str:
+        """Returns the timestamped name of a columnar file created now."""
+        return f'data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdc'
+
+
+class ColumnarReader:
+    """
+    Reads columns and date ranges of a columnar file written by
+    :class:`pydas.formatters.ColumnarFormatter`.
+
+    The file is memory-mapped, and only the footer and the column chunks needed by each read
+    are paged in, so that small parts of very large archived datasets are read quickly.
+
+    Example
+    -------
+    ::
+
+        with ColumnarReader('data.pdc') as reader:
+            dataset = reader.read(['close'], start_date='2021-01-01', end_date='2021-03-31')
+
+    Attributes
+    ----------
+    header: list[str]
+        Names of the columns of the file, starting with the ``date`` column.
+
+    types: list[str]
+        Types of the columns of the file, in header order.
+
+    rows: int
+        Number of rows in the file.
+
+    Raises
+    ------
+    ValueError:
+        Thrown if the file isn't a columnar file.
+    """
+
+    def __init__(self, filename: str):
+        self._file = open(filename, 'rb')  # pylint: disable=consider-using-with
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            footer = self._read_footer()
+        except Exception:
+            self.close()
+            raise
+
+        self.header: List[str] = [column['name'] for column in footer['columns']]
+        self.types: List[str] = [column['type'] for column in footer['columns']]
+        self.rows: int = footer['rows']
+        self._chunks: List[dict] = footer['chunks']
+
+    def __enter__(self) -> 'ColumnarReader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read_columns(self,
+                     columns: List[str] = None,
+                     start_date: Union[str, date] = None,
+                     end_date: Union[str, date] = None) -> Dict[str, list]:
+        """
+        Reads the values of columns, optionally limited to a range of dates.
+
+        Parameters
+        ----------
+        columns: list[str]
+            Names of the columns to read. Default: every column.
+
+        start_date: str | date
+            First date of the range to read, inclusive. Default: the first date in the file.
+
+        end_date: str | date
+            Last date of the range to read, inclusive. Default: the last date in the file.
+
+        Returns
+        -------
+        dict[str, list]:
+            Values of each column, in file order. Dates are returned as ISO strings.
+
+        Raises
+        ------
+        KeyError:
+            Thrown if a column isn't in the file.
+        """
+        positions = [self._get_position(name) for name in (columns or self.header)]
+        start = _get_date_key(start_date)
+        end = _get_date_key(end_date)
+        result = {self.header[position]: [] for position in positions}
+        for chunk in self._chunks:
+            indexes = None
+            if start is not None or end is not None:
+                first, last = chunk.get('dates', (None, None))
+                if first is not None and ((start is not None and last < start) or (end is not None and first > end)):
+                    continue
+
+                if first is None or (start is not None and first < start) or (end is not None and last > end):
+                    indexes = [i for i, value in enumerate(self._decode(chunk, 0))
+                               if (start is None or value >= start) and (end is None or value <= end)]
+
+            for position in positions:
+                values = self._decode(chunk, position)
+                result[self.header[position]].extend(values if indexes is None else [values[i] for i in indexes])
+
+        return result
+
+    def read(self,
+             columns: List[str] = None,
+             start_date: Union[str, date] = None,
+             end_date: Union[str, date] = None) -> dict:
+        """
+        Reads a merged dataset with a ``header`` and ``values`` from the file, as returned by
+        :class:`pydas.formatters.JsonFormatter`. The ``date`` column is always read.
+
+        See :meth:`read_columns` for a description of the parameters.
+        """
+        names = [self.header[0]] + [name for name in (columns or self.header[1:]) if name != self.header[0]]
+        values = self.read_columns(names, start_date, end_date)
+        return {
+            SdasConstants.header_property: names,
+            SdasConstants.multi_value_property: list(map(list, zip(*(values[name] for name in names))))
+        }
+
+    def close(self):
+        """Closes the file."""
+        buffer = getattr(self, '_buffer', None)
+        if buffer is not None:
+            buffer.close()
+            self._buffer = None
+
+        self._file.close()
+
+    def _read_footer(self) -> dict:
+        trailer = len(MAGIC) + _FOOTER_LENGTH.size
+        if len(self._buffer) < len(MAGIC) + trailer \
+                or self._buffer[:len(MAGIC)] != MAGIC or self._buffer[-len(MAGIC):] != MAGIC:
+            raise ValueError('Not a columnar file')
+
+        length, = _FOOTER_LENGTH.unpack_from(self._buffer, len(self._buffer) - trailer)
+        footer = json.loads(self._buffer[-trailer - length:-trailer].decode('utf-8'))
+        if footer.get('version') != VERSION:
+            raise ValueError(f'Unsupported columnar file version: {footer.get("version")}')
+
+        return footer
+
+    def _get_position(self, name: str) -> int:
+        try:
+            return self.header.index(name)
+        except ValueError:
+            raise KeyError(f'Column "{name}" is not in the file') from None
+
+    def _decode(self, chunk: dict, position: int) -> list:
+        metadata = chunk['columns'][position]
+        data = memoryview(self._buffer)[metadata['offset']:metadata['offset'] + metadata['length']]
+        try:
+            return _DECODERS[self.types[position]](data, metadata, chunk['rows'])
+        finally:
+            data.release()
+
+
+def get_column_type(values: tuple, is_date: bool = False) -> str:
+    """
+    Returns the columnar type that stores every value of a column.
+
+    Parameters
+    ----------
+    values: tuple
+        Values of the column.
+
+    is_date: bool
+        Flag indicating whether the column is the ``date`` column of a dataset.
+
+    Returns
+    -------
+    str:
+        ``date``, ``int64``, ``float64``, ``string`` or ``json``.
+    """
+    if is_date:
+        try:
+            for value in values:
+                date.fromisoformat(value)
+            return 'date'
+        except (TypeError, ValueError):
+            pass
+
+    kinds = set(map(type, values))
+    if kinds <= {int}:
+        return 'int64' if values else 'float64'
+
+    if kinds <= {int, float, str, type(None)} \
+            and all(not isinstance(value, str) or value == UtilityConstants.str_empty for value in values):
+        return 'float64'
+
+    return 'string' if kinds <= {str} else 'json'
+
+
+def _get_date_key(value: Optional[Union[str, date]]) -> Optional[str]:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _get_integer_code(codes: str, low: int, high: int) -> str:
+    for code in codes:
+        bits = array(code).itemsize * 8
+        if code in _SIGNED_CODES and -(1 << bits - 1) <= low and high < 1 << bits - 1:
+            return code
+
+        if code in _UNSIGNED_CODES and low >= 0 and high < 1 << bits:
+            return code
+
+    raise OverflowError(f'Integers between {low} and {high} are out of range')
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_bytes(code: str, data: memoryview) -> array:
+    values = array(code)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def _encode_dates(values: tuple) -> Tuple[bytes, dict]:
+    days = [(date.fromisoformat(value) - _EPOCH).days for value in values]
+    base = days[0] if days else 0
+    deltas = [day - base for day in days]
+    code = _get_integer_code(_SIGNED_CODES, min(deltas, default=0), max(deltas, default=0))
+    return _to_bytes(array(code, deltas)), {'base': base, 'width': code}
+
+
+def _decode_dates(data: memoryview, metadata: dict, rows: int) -> List[str]:
+    base = _EPOCH + timedelta(days=metadata['base'])
+    cache = {}
+    result = []
+    for delta in _from_bytes(metadata['width'], data):
+        value = cache.get(delta)
+        if value is None:
+            value = cache[delta] = (base + timedelta(days=delta)).isoformat()
+        result.append(value)
+
+    return result
+
+
+def _encode_integers(values: tuple) -> Tuple[bytes, dict]:
+    code = _get_integer_code(_SIGNED_CODES, min(values, default=0), max(values, default=0))
+    return _to_bytes(array(code, values)), {'width': code}
+
+
+def _decode_integers(data: memoryview, metadata: dict, rows: int) -> List[int]:
+    return _from_bytes(metadata['width'], data).tolist()
+
+
+def _encode_floats(values: tuple) -> Tuple[bytes, dict]:
+    return _to_bytes(array('d', (math.nan if value in (UtilityConstants.str_empty, None) else value
+                                 for value in values))), {}
+
+
+def _decode_floats(data: memoryview, metadata: dict, rows: int) -> List[float]:
+    return _from_bytes('d', data).tolist()
+
+
+def _encode_dictionary(values: tuple) -> Tuple[bytes, dict]:
+    codes = {}
+    row_codes = [codes.setdefault(value, len(codes)) for value in values]
+    entries = [value.encode('utf-8') for value in codes]
+    offsets = [0]
+    for entry in entries:
+        offsets.append(offsets[-1] + len(entry))
+
+    offset_code = _get_integer_code(_UNSIGNED_CODES, 0, offsets[-1])
+    row_code = _get_integer_code(_UNSIGNED_CODES, 0, max(len(codes) - 1, 0))
+    return (_to_bytes(array(offset_code, offsets)) + b''.join(entries) + _to_bytes(array(row_code, row_codes)),
+            {'entries': len(entries), 'offsets': offset_code, 'width': row_code})
+
+
+def _decode_dictionary(data: memoryview, metadata: dict, rows: int, decode=lambda value: value) -> list:
+    offsets_length = (metadata['entries'] + 1) * array(metadata['offsets']).itemsize
+    offsets = _from_bytes(metadata['offsets'], data[:offsets_length])
+    codes_start = offsets_length + offsets[-1]
+    blob = data[offsets_length:codes_start]
+    entries = [decode(str(blob[offsets[i]:offsets[i + 1]], 'utf-8')) for i in range(metadata['entries'])]
+    return [entries[code] for code in _from_bytes(metadata['width'], data[codes_start:])]
+
+
+def _encode_json(values: tuple) -> Tuple[bytes, dict]:
+    return _encode_dictionary(tuple(map(json.dumps, values)))
+
+
+def _decode_json(data: memoryview, metadata: dict, rows: int) -> list:
+    return _decode_dictionary(data, metadata, rows, decode=json.loads)
+
+
+_ENCODINGS: Dict[str, str] = {
+    'date': 'delta',
+    'int64': 'plain',
+    'float64': 'plain',
+    'string': 'dictionary',
+    'json': 'dictionary'
+}
+
+_ENCODERS = {
+    'date': _encode_dates,
+    'int64': _encode_integers,
+    'float64': _encode_floats,
+    'string': _encode_dictionary,
+    'json': _encode_json
+}
+
+_DECODERS: Dict[str, Any] = {
+    'date': _decode_dates,
+    'int64': _decode_integers,
+    'float64': _decode_floats,
+    'string': _decode_dictionary,
+    'json': _decode_json
+}
@@ -1,13 +1,13 @@
 from datetime import datetime
 from enum import Enum
-import gzip
 from os import path
 from pathlib import Path
-import shutil
-from typing import Any
-from zipfile import ZipFile
+import tarfile
+from tempfile import SpooledTemporaryFile
+from typing import Any, Iterable, Iterator
 
 from pydas.formatters.base import BaseFormatter
+from pydas.formatters.blocks import ZipStreamWriter, get_compressor, iter_blocks, iter_file_blocks
 
 
 class CompressionType(Enum):
@@ -29,6 +29,20 @@ class CompressionType(Enum):
     ZIP = 2
     TAR = 3
 
+    @property
+    def extension(self) -> str:
+        """Returns the file extension of archives of this compression type."""
+        return {CompressionType.GZIP: 'gz',
+                CompressionType.ZIP: 'zip',
+                CompressionType.TAR: 'tar'}[self]
+
+    @property
+    def content_type(self) -> str:
+        """Returns the media type of archives of this compression type."""
+        return {CompressionType.GZIP: 'application/gzip',
+                CompressionType.ZIP: 'application/zip',
+                CompressionType.TAR: 'application/x-tar'}[self]
+
     @classmethod
     def get_compression_type(cls, output_format: str):
         """
@@ -63,6 +77,14 @@ class CompressionType(Enum):
 
 
 class CompressionFormatter(BaseFormatter):
+    """
+    Data formatter for compressing files into archives, or compressing the output of another
+    formatter as it is streamed when used as a stage of a :class:`pydas.formatters.FormatterChain`.
+
+    Gzip and zip archives are compressed in independent blocks across the worker processes of
+    the shared :class:`pydas.formatters.blocks.BlockCompressor`. Tarballs are uncompressed.
+    """
+
     @classmethod
     def can_handle(cls, output_format: str) -> bool:
         try:
@@ -77,16 +99,18 @@ class CompressionFormatter(BaseFormatter):
 
         Parameters
         ----------
-        data: any
-            Data to be formatted.
+        data: dict[str, list[str]]
+            Paths of the files to archive, keyed by the name of the archive to create.
 
         format_options: dict
-            Additional formatting options.
+            Additional formatting options. The ``output_format`` determines the compression
+            type, and archives are created in the directory at ``path``.
 
         Returns
         -------
-        str:
-            Local filepath to the formatted data file.
+        list[tuple[str, str]]:
+            Key and local filepath of each archive. Zip archives and tarballs contain each
+            file as a separate entry, and gzip archives contain the files concatenated.
         """
         if 'output_format' not in format_options:
             raise KeyError(
@@ -95,26 +119,88 @@ class CompressionFormatter(BaseFormatter):
         output_format = format_options['output_format']
         output_path = format_options['path']
         compression_type = CompressionType.get_compression_type(output_format)
+        compressor = get_compressor()
         archives: list = []
 
         for key, files in data.items():
             filename = f'{key}_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
-            if compression_type == CompressionType.ZIP:
-                archive_name = path.join(output_path, f'{filename}.zip')
-                with ZipFile(archive_name, 'w') as zipfile:
+            archive_name = path.join(output_path, f'{filename}.{compression_type.extension}')
+            if compression_type == CompressionType.TAR:
+                with tarfile.open(archive_name, 'w') as tarball:
                     for file in files:
-                        archive_filename = Path(file)
-                        zipfile.write(file,
-                                      arcname=archive_filename.name)
+                        tarball.add(file, arcname=Path(file).name)
+            else:
+                with open(archive_name, 'wb') as archive:
+                    if compression_type == CompressionType.ZIP:
+                        writer = ZipStreamWriter(compressor)
+                        for file in files:
+                            archive.writelines(writer.write_entry(
+                                Path(file).name, iter_file_blocks(file, compressor.block_size)))
+
+                        archive.writelines(writer.close())
+                    else:
+                        archive.writelines(compressor.gzip(
+                            block for file in files
+                            for block in iter_file_blocks(file, compressor.block_size)))
+
+            archives.append((key, archive_name))
 
-                archives.append((key, archive_name))
+        return archives
 
-            if compression_type == CompressionType.GZIP:
-                archive_name = path.join(output_path, f'{filename}.gz')
-                with gzip.open(archive_name, 'wb') as gzipfile:
-                    for file in files:
-                        shutil.copyfileobj(file, gzipfile)
+    def stream(self, chunks: Iterable[bytes], **format_options) -> Iterator[bytes]:
+        """
+        Compresses a stream of bytes as it is consumed.
 
-                archives.append((key, archive_name))
+        Parameters
+        ----------
+        chunks: Iterable[bytes]
+            Chunks of the data to compress.
 
-        return archives
+        format_options: dict
+            Additional formatting options. The ``output_format`` determines the compression
+            type, and the ``filename`` names the archived file within a zip archive or tarball.
+
+        Returns
+        -------
+        Iterator[bytes]:
+            Generator of the chunks of the archive.
+        """
+        compression_type = CompressionType.get_compression_type(format_options['output_format'])
+        filename = format_options.get('filename', 'data')
+        compressor = get_compressor()
+        if compression_type == CompressionType.GZIP:
+            return compressor.gzip(iter_blocks(chunks, compressor.block_size))
+
+        if compression_type == CompressionType.ZIP:
+            return _stream_zip(compressor, chunks, filename)
+
+        return _stream_tar(chunks, filename, compressor.block_size)
+
+
+def _stream_zip(compressor, chunks: Iterable[bytes], filename: str) -> Iterator[bytes]:
+    writer = ZipStreamWriter(compressor)
+    yield from writer.write_entry(filename, iter_blocks(chunks, compressor.block_size))
+    yield from writer.close()
+
+
+def _stream_tar(chunks: Iterable[bytes], filename: str, block_size: int) -> Iterator[bytes]:
+    # A tar header records the size of its file, so the file is spooled before it is written
+    with SpooledTemporaryFile(max_size=block_size) as spool:
+        for chunk in chunks:
+            spool.write(chunk)
+
+        info = tarfile.TarInfo(filename)
+        info.size = spool.tell()
+        info.mtime = int(datetime.now().timestamp())
+        info.mode = 0o644
+        header = info.tobuf(format=tarfile.PAX_FORMAT)
+        yield header
+
+        spool.seek(0)
+        yield from iter(lambda: spool.read(block_size), b'')
+
+    # Pad the file to a whole tar block, then end the archive with two empty blocks, padded
+    # to a whole record
+    padding = -info.size % tarfile.BLOCKSIZE + 2 * tarfile.BLOCKSIZE
+    padding += -(len(header) + info.size + padding) % tarfile.RECORDSIZE
+    yield tarfile.NUL * padding
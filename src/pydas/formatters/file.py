@@ -1,14 +1,26 @@
 from datetime import datetime
+from typing import IO, Iterator
 
 from pydas.formatters.base import BaseFormatter
 
+DEFAULT_CHUNK_ROWS = 1024
+
 
 class FileFormatter(BaseFormatter):
-    """Data formatter for converting an in-memory data object into a delimited file"""
+    """
+    Data formatter for converting an in-memory data object into a delimited file
+
+    Rows are encoded in buffered chunks, which are either written to a file in the output
+    path, written to any writable, or streamed directly into an HTTP response.
+    """
+
+    content_type = 'text/csv'
+    extension = 'csv'
+    attachment = True
 
     @classmethod
     def can_handle(cls, output_format: str) -> bool:
-        return output_format.lower() == 'file'
+        return output_format.lower() in ('file', 'csv')
 
     def transform(self, data: dict, **format_options):
         """
@@ -20,32 +32,86 @@ class FileFormatter(BaseFormatter):
             Data for be formatted.
 
         format_options: dict
-            Additional formatting options.
+            Additional formatting options. If an ``output_path`` is given the file is written
+            to that directory, otherwise the file is returned as chunks of delimited text.
 
         Returns
         -------
         str:
-            Local filepath to the formatted data file.
+            Local filepath to the formatted data file, if an ``output_path`` is given.
+
+        Iterator[str]:
+            Generator of the chunks of the delimited file, if no ``output_path`` is given.
         """
+        if not format_options.get('output_path'):
+            return self.encode(data, **format_options)
 
-        filename = f'data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-        full_filename = f'{format_options["output_path"]}/{filename}'
+        full_filename = f'{format_options["output_path"]}/{self.get_filename()}'
 
         with open(full_filename, 'w') as file:
-            if format_options['include_headers'] in ['True', 'true']:
-                file.write(
-                    format_options['field_delimiter'].join(data['header']))
-                file.write(self.__get_control_character(
-                    format_options['row_delimiter']))
-
-            for row in data['values']:
-                file.write(format_options['field_delimiter'].join(
-                    str(field) for field in row))
-                file.write(self.__get_control_character(
-                    format_options['row_delimiter']))
+            self.write(data, file, **format_options)
 
         return full_filename
 
+    def encode(self, data: dict, chunk_rows: int = DEFAULT_CHUNK_ROWS, **format_options) -> Iterator[str]:
+        """
+        Encodes a data object into chunks of delimited text.
+
+        Parameters
+        ----------
+        data: dict
+            Merged dataset with a ``header`` and ``values``.
+
+        chunk_rows: int
+            Number of rows encoded into each chunk. Default: ``1024``.
+
+        format_options: dict
+            The ``field_delimiter``, ``row_delimiter`` and ``include_headers`` options.
+
+        Returns
+        -------
+        Iterator[str]:
+            Generator of chunks of delimited text, in row order.
+        """
+        field_delimiter = format_options['field_delimiter']
+        row_delimiter = self.__get_control_character(format_options['row_delimiter'])
+
+        if format_options['include_headers'] in ['True', 'true']:
+            yield field_delimiter.join(data['header']) + row_delimiter
+
+        buffer = []
+        for row in data['values']:
+            buffer.append(field_delimiter.join(map(str, row)))
+            if len(buffer) >= chunk_rows:
+                yield row_delimiter.join(buffer) + row_delimiter
+                buffer = []
+
+        if buffer:
+            yield row_delimiter.join(buffer) + row_delimiter
+
+    def write(self, data: dict, writable: IO[str], **format_options) -> int:
+        """
+        Writes a data object as delimited text to a writable, e.g. an open file.
+
+        See :meth:`encode` for a description of the parameters.
+
+        Returns
+        -------
+        int:
+            Number of characters written.
+        """
+        written = 0
+        for chunk in self.encode(data, **format_options):
+            writable.write(chunk)
+            written += len(chunk)
+
+        return written
+
+    @staticmethod
+    def get_filename() -> str:
+        """Returns the timestamped name of a delimited file created now."""
+        return f'data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+
     def __get_control_character(self, value):
         ctrl_char_map = {
             "\\n": "\n",
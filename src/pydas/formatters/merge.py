@@ -0,0 +1,134 @@
+"""
+Merge engine that joins the data of several features into a single date-indexed table.
+
+Each date is mapped to its row number in a hash index, and each feature's values are kept
+in their own column until the table is built, so merging ``F`` features of ``N`` dates takes
+``O(F·N)`` time rather than scanning the table for every value. Features acquired for the
+same dates as the table, which is the common case, are merged as whole columns.
+
+Most of the time spent merging a large dataset goes into building its rows, one Python list
+per date, rather than into merging the columns. Features given as ``(value, date)`` tuples
+rather than :class:`pydas.columns.FeatureColumns` take a few times longer to merge, as each
+value is looked up in the index.
+"""
+from typing import Any, Dict, Iterable, Iterator, List
+
+from pydas.columns import FeatureColumns, iter_points
+from pydas.constants import SdasConstants, UtilityConstants
+
+
+class DatasetMerger:
+    """
+    Merges feature data into rows keyed by date, in the order each date is first merged.
+
+    Attributes
+    ----------
+    header: list[str]
+        Header of the merged dataset, starting with ``date``, followed by the feature names.
+    """
+
+    def __init__(self, feature_names: Iterable[str] = None):
+        self.header = [SdasConstants.date_property]
+        self._dates: List[str] = []
+        self._index: Dict[str, int] = dict()
+        self._columns: List[list] = []
+        self._positions: Dict[str, int] = dict()
+        for name in feature_names or []:
+            self.add_feature(name)
+
+    def add_feature(self, name: str) -> int:
+        """Adds a feature column to the header, returning the index of its column."""
+        position = self._positions.get(name)
+        if position is None:
+            position = len(self._columns)
+            self._positions[name] = position
+            self._columns.append([])
+            self.header.append(name)
+
+        return position
+
+    def merge(self, name: str, values: Iterable):
+        """
+        Merges the data of a feature into its column, adding rows for any new dates.
+
+        Parameters
+        ----------
+        name: str
+            Name of the feature, which is added to the header if it isn't already.
+
+        values: Iterable
+            The feature's :class:`pydas.columns.FeatureColumns`, or its collection of
+            ``(value, date)`` tuples. If a date appears more than once, its last value is kept.
+            The extra series of feature columns are merged into their own columns, which are
+            added to the header if they aren't already.
+        """
+        self._merge(self.add_feature(name), values)
+        if isinstance(values, FeatureColumns):
+            for extra_name, extra_values in values.get_extra_columns():
+                self._merge(self.add_feature(extra_name), extra_values)
+
+    def get_rows(self) -> List[list]:
+        """Returns the merged rows, leaving the values of features missing a date empty."""
+        return list(self.iter_rows())
+
+    def iter_rows(self) -> Iterator[list]:
+        """Returns a generator of the merged rows, which are built one at a time."""
+        columns = [self._pad(column) for column in self._columns]
+        return map(list, zip(self._dates, *columns))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the merged dataset with its ``header`` and ``values``."""
+        return {
+            SdasConstants.header_property: list(self.header),
+            SdasConstants.multi_value_property: self.get_rows()
+        }
+
+    def _merge(self, position: int, values: Iterable):
+        if isinstance(values, FeatureColumns) and self._merge_columns(position, values):
+            return
+
+        if isinstance(values, FeatureColumns):
+            dates, values = values.dates, values.get_values()
+        else:
+            points = list(iter_points(values))
+            dates = [point[0] for point in points]
+            values = [point[1] for point in points]
+
+        column = self._pad(self._columns[position])
+        start = self._index.get(dates[0]) if dates else None
+        if start is not None and self._dates[start:start + len(dates)] == dates:
+            # The dates are a contiguous run of the table's rows, e.g. a shorter range
+            column[start:start + len(dates)] = values
+            return
+
+        rows = self._get_rows(dates)
+        self._pad(column)
+        for row, value in zip(rows, values):
+            column[row] = value
+
+    def _merge_columns(self, position: int, columns: FeatureColumns) -> bool:
+        """Merges feature columns as a whole if their dates match the table's dates."""
+        if not self._dates and len(set(columns.dates)) == len(columns.dates):
+            self._dates.extend(columns.dates)
+            self._index.update(zip(columns.dates, range(len(columns.dates))))
+        elif columns.dates != self._dates:
+            return False
+
+        self._columns[position] = columns.get_values()
+        return True
+
+    def _get_rows(self, dates: List[str]) -> List[int]:
+        """Returns the row number of each date, adding rows for the dates without one."""
+        rows = list(map(self._index.get, dates))
+        if None in rows:
+            for i, date in enumerate(dates):
+                if rows[i] is None:
+                    rows[i] = self._index.setdefault(date, len(self._dates))
+                    if rows[i] == len(self._dates):
+                        self._dates.append(date)
+
+        return rows
+
+    def _pad(self, column: list) -> list:
+        column.extend([UtilityConstants.str_empty] * (len(self._dates) - len(column)))
+        return column
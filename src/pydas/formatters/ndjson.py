@@ -0,0 +1,96 @@
+import json
+import logging
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from pydas.constants import SdasConstants
+from pydas.formatters.base import BaseFormatter
+from pydas.formatters.merge import DatasetMerger
+
+
+class NdjsonFormatter(BaseFormatter):
+    """
+    Data formatter for converting a dataset into newline-delimited JSON (NDJSON).
+
+    The first line is an object containing the ``header`` of the dataset, followed by one
+    array per row. If any errors were reported for the dataset, they are written as a final
+    object containing the ``errors``.
+    """
+
+    content_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    @classmethod
+    def can_handle(cls, output_format: str) -> bool:
+        return output_format.lower() == 'ndjson'
+
+    def transform(self, data: dict, **format_options) -> Any:
+        """
+        Transform a merged dataset into NDJSON lines.
+
+        Parameters
+        ----------
+        data: dict
+            Merged dataset with a ``header`` and ``values``, as returned by
+            :class:`pydas.formatters.JsonFormatter`.
+
+        format_options: dict
+            Additional formatting options.
+
+        Returns
+        -------
+        Iterator[str]:
+            Generator of NDJSON lines, each terminated with a newline.
+        """
+        yield self.encode({SdasConstants.header_property: data[SdasConstants.header_property]})
+        for row in data[SdasConstants.multi_value_property]:
+            yield self.encode(row)
+
+        if data.get('errors'):
+            yield self.encode({'errors': data['errors']})
+
+    def stream(self,
+               feature_names: List[str],
+               feature_values: Iterable[Tuple[str, list]],
+               errors: dict = None) -> Iterator[str]:
+        """
+        Merges feature data into NDJSON rows.
+
+        A row needs the values of every feature for its date, and the header needs the extra
+        series of every feature, so lines are only written once every feature has been
+        consumed and merged into a date-indexed table. Each row is then built and encoded one
+        at a time from the table's columns.
+
+        Parameters
+        ----------
+        feature_names: list[str]
+            Names of the features, in the order their columns appear in each row.
+
+        feature_values: Iterable[tuple]
+            Pairs of a feature name and its :class:`pydas.columns.FeatureColumns`, or its
+            collection of ``(value, date)`` tuples.
+
+        errors: dict
+            Errors reported while consuming ``feature_values``. If the dict isn't empty once
+            every feature has been consumed, it is written as the final line.
+
+        Returns
+        -------
+        Iterator[str]:
+            Generator of NDJSON lines, each terminated with a newline.
+        """
+        merger = DatasetMerger(feature_names)
+        for name, values in feature_values:
+            logging.debug('Merging feature "%s" into streamed output...', name)
+            merger.merge(name, values)
+
+        yield self.encode({SdasConstants.header_property: merger.header})
+        for row in merger.iter_rows():
+            yield self.encode(row)
+
+        if errors:
+            yield self.encode({'errors': errors})
+
+    @staticmethod
+    def encode(line) -> str:
+        """Returns the JSON encoding of a single NDJSON line."""
+        return json.dumps(line, default=str) + '\n'
@@ -0,0 +1,64 @@
+import logging
+from typing import Any
+
+from pydas.constants import SdasConstants, UtilityConstants
+from pydas.formatters.base import BaseFormatter
+from pydas.formatters.json import JsonFormatter
+
+
+class PanelFormatter(BaseFormatter):
+    """
+    Data formatter for merging the feature data of several entities into a single panel
+    dataset, where each row is keyed by the entity identifier and date.
+    """
+
+    @classmethod
+    def can_handle(cls, output_format: str) -> bool:
+        return output_format == 'panel'
+
+    def transform(self, data: dict, **format_options) -> Any:
+        """
+        Transform the feature data of several entities into a panel dataset.
+
+        Parameters
+        ----------
+        data: dict[str, dict]
+            Feature data for each entity, keyed by the entity identifier. The feature data
+            follows the form accepted by :class:`pydas.formatters.JsonFormatter`.
+
+        format_options: dict
+            Additional formatting options.
+
+        Returns
+        -------
+        dict:
+            Merged dataset with a ``header`` starting with ``entity`` and ``date``, followed by
+            every feature acquired for any of the entities. Features that weren't acquired for an
+            entity are left empty in that entity's rows.
+        """
+        output = {
+            SdasConstants.header_property: ['entity', SdasConstants.date_property],
+            SdasConstants.multi_value_property: []
+        }
+
+        merged_entities = []
+        for identifier, features in data.items():
+            merged = JsonFormatter().transform(features)
+            merged_entities.append((identifier, merged))
+            for feature_name in merged[SdasConstants.header_property][1:]:
+                if feature_name not in output[SdasConstants.header_property]:
+                    output[SdasConstants.header_property].append(feature_name)
+
+        columns = {name: i for i, name in enumerate(output[SdasConstants.header_property])}
+        for identifier, merged in merged_entities:
+            logging.debug('Merging entity "%s" into panel output...', identifier)
+            positions = [columns[name] for name in merged[SdasConstants.header_property]]
+            for values in merged[SdasConstants.multi_value_property]:
+                row = [UtilityConstants.str_empty] * len(columns)
+                row[0] = identifier
+                for position, value in zip(positions, values):
+                    row[position] = value
+
+                output[SdasConstants.multi_value_property].append(row)
+
+        return output
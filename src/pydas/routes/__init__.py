@@ -6,6 +6,7 @@ from .entity import entity_bp
 from .configuration import configuration_bp
 from .feature import feature_bp
 from .handler import handler_bp
+from .jobs import jobs_bp
 from .option import option_bp
 from .statistics import statistics_bp
 from .swagger import swaggerui_bp
@@ -1,24 +1,42 @@
 from datetime import datetime
-from functools import reduce
+from functools import partial, reduce
 import logging
+from typing import Callable
 
 from dependency_injector.wiring import inject, Provide
-from flask import Blueprint, current_app, make_response, jsonify, request, send_file
+from flask import (Blueprint, Response, current_app, make_response, jsonify, request,
+                   stream_with_context)
 from sqlalchemy.orm.exc import NoResultFound
 
 from pydas_auth import scopes
 from pydas_auth.scopes import verify_scopes
 
-from pydas_metadata import json
 from pydas_metadata.contexts import BaseContext
-from pydas_metadata.models import Entity, Option
 
 from pydas import constants
+from pydas.acquisition import (CoalescingClient,
+                              EntityRequest,
+                              FeatureResult,
+                              IncrementalFetch,
+                              MarketBatchClient,
+                              PlanCache,
+                              ResultCache,
+                              SingleFlight,
+                              iter_entities,
+                              iter_features)
 from pydas.clients.iex import IexClient
+from pydas.clients.iex_async import AsyncIexClient
 from pydas.constants import FeatureToggles
 from pydas.containers import ApplicationContainer
-from pydas.formatters import BaseFormatter, FormatterFactory
+from pydas.formatters import FormatterFactory, get_stages
+from pydas.routes.formatting import (format_output,
+                                    is_file_output,
+                                    is_save_requested,
+                                    send_output,
+                                    stream_file)
 from pydas.signals import SignalFactory
+from pydas.transformers.aio import EventLoopThread
+from pydas.transformers.sessions import HttpSession
 
 # Disable the call to current_app._get_current_object as it's recommended by Flask
 # pylint: disable=protected-access
@@ -34,7 +52,15 @@ acquire_bp = Blueprint('acquire',
                request)
 @inject
 def acquire(company_symbol,
-            metadata_context: BaseContext = Provide[ApplicationContainer.context_factory]):
+            metadata_context: BaseContext = Provide[ApplicationContainer.context_factory],
+            max_workers: int = Provide[ApplicationContainer.config.acquisition.max_workers],
+            plan_cache: PlanCache = Provide[ApplicationContainer.plan_cache],
+            incremental_fetch: IncrementalFetch = Provide[ApplicationContainer.incremental_fetch],
+            result_cache: ResultCache = Provide[ApplicationContainer.result_cache],
+            entity_flight: SingleFlight = Provide[ApplicationContainer.entity_flight],
+            feature_flight: SingleFlight = Provide[ApplicationContainer.feature_flight],
+            http_session: HttpSession = Provide[ApplicationContainer.http_session],
+            event_loop: EventLoopThread = Provide[ApplicationContainer.event_loop]):
     """
     Provides API function for dataset generation.
 
@@ -43,12 +69,64 @@ def acquire(company_symbol,
     company_symbol: str
         Symbol for the company to acquire data for.
 
+    max_workers: int
+        Maximum number of features acquired concurrently, configured with
+        ``acquisition.max_workers``.
+
+    plan_cache: :class:`pydas.acquisition.PlanCache`
+        Cache of compiled acquisition plans, so a warm acquisition makes no
+        metadata queries for the entity, its features or their options.
+
+    incremental_fetch: :class:`pydas.acquisition.IncrementalFetch`
+        Fetch function that only requests the data acquired since each
+        feature's watermark. The full range of every feature is requested
+        if the ``refresh=true`` query parameter is given.
+
+    result_cache: :class:`pydas.acquisition.ResultCache`
+        Cache of acquired datasets. Datasets acquired without errors are
+        cached until the shortest time-to-live of their feature handlers
+        expires. The ``cache=refresh`` query parameter, or a
+        ``Cache-Control: no-cache`` header, skips cached datasets and
+        ``cache=bypass`` doesn't cache the acquired dataset either.
+
+    entity_flight: :class:`pydas.acquisition.SingleFlight`
+        Single-flight group that concurrent acquisitions of the same dataset
+        share, so only one of them acquires it.
+
+    feature_flight: :class:`pydas.acquisition.SingleFlight`
+        Single-flight group that concurrent identical feature data requests
+        share, including those made by batch acquisitions and jobs.
+
+    http_session: :class:`pydas.transformers.sessions.HttpSession`
+        Pooled HTTP session that feature data is requested through, configured
+        with ``acquisition.http``.
+
+    event_loop: :class:`pydas.transformers.aio.EventLoopThread`
+        Event loop that feature data requests are awaited on, or ``None`` if
+        ``acquisition.aio.enabled`` isn't configured.
+
     Returns
     -------
     flask.Response:
         HTTP response with dataset as a JSON payload or delimited file.
         This is determined from whether a query parameter is provided
-        that specifies a file output formatter.
+        that specifies a file output formatter. Features that could not be
+        acquired are reported in the ``errors`` property of a JSON response.
+
+        If the ``ndjson`` format is requested, the dataset is returned as
+        newline-delimited JSON. Nothing is sent until every feature has been
+        acquired and merged, as the header needs the extra columns of every
+        feature and each row the values of every feature. The lines are then
+        encoded one at a time rather than as a single JSON document.
+
+        Formats may be chained with a ``+``, e.g. ``csv+gzip`` or ``ndjson+zip``,
+        to download the dataset as a compressed file, which is compressed as it
+        is streamed.
+
+        File output is streamed without being written to disk, unless the
+        ``save=true`` query parameter is given with the ``file`` or ``csv``
+        format, in which case the file is saved to the configured
+        ``OutputFilePath`` and sent from there.
 
     Raises
     ------
@@ -64,10 +142,9 @@ def acquire(company_symbol,
             company_symbol=company_symbol,
             start_date=datetime.now().isoformat())
 
-    results = dict()
     api_key = metadata_context.get_configuration('apiKey')
     logging.debug("Creating IEX client with API Key: %s", api_key)
-    client = IexClient(api_key)
+    client = CoalescingClient(__get_client(api_key, http_session, event_loop), feature_flight)
 
     try:
         if should_handle_events:
@@ -76,94 +153,52 @@ def acquire(company_symbol,
                 company_symbol=company_symbol,
                 start_date=datetime.now().isoformat())
 
-        with metadata_context.get_session() as session:
-            entity = session.query(Entity).filter(
-                Entity.identifier == company_symbol).one()
-
-            for feature in entity.features:
-                if should_handle_events:
-                    logging.info(
-                        "Signalling pre-feature event handlers")
-                    SignalFactory.pre_feature.send(
-                        company_symbol=company_symbol,
-                        feature_name=feature.name,
-                        start_date=datetime.now().isoformat())
-
-                feature_option = session.query(Option).filter(Option.company_symbol == company_symbol,
-                                                              Option.feature_name == feature.name).all()
-                option = [json(option) for option in feature_option]
-                logging.info(
-                    'Retrieved mapped options: [%s]',
-                    (" ").join([json(option, True) for option in feature_option]))
-
-                # TODO: Determine if this could/should be moved into source-aware code
-                if feature.handler_metadata.name == "tech_indicators_handler" and not option:
-                    logging.info(
-                        'Adding missing option on technical indicator')
-                    option.append({"feature_name": feature.name,
-                                   "name": "range",
-                                   "value": "1m"})
-
-                logging.info('Acquiring feature data')
-                data = client.get_feature_data(feature, entity, option)
-                if isinstance(data, list):
-                    results[feature.name] = feature.get_values(data)
-                elif isinstance(data, dict):
-                    results[feature.name] = [feature.get_value(data)]
-                logging.info(
-                    "Acquired %d rows", len(results[feature.name]))
-
-                if should_handle_events:
-                    logging.info(
-                        "Signalling post-feature event handlers")
-                    SignalFactory.post_feature.send(
-                        company_symbol=company_symbol,
-                        feature_name=feature.name,
-                        feature_rows=len(results[feature.name]),
-                        end_date=datetime.now().isoformat())
-
-        results = __format_output(results, 'json')
-        if should_handle_events:
-            logging.info("Signalling post-company event handlers")
-            count = reduce(lambda total, iter: total + len(iter),
-                           results['values'],
-                           0)
-            SignalFactory.post_company.send(
-                company_symbol=company_symbol,
-                data=results,
-                total_rows=count,
-                end_date=datetime.now().isoformat())
+        plan = plan_cache.get_plan(metadata_context, company_symbol)
+        if plan is None:
+            raise NoResultFound(f'Cannot find entity "{company_symbol}"')
+
+        fetch = __get_fetch(incremental_fetch)
+        cache_key = result_cache.get_key(plan, 'json')
+        results = result_cache.get(cache_key) if __get_cache_control() == 'use' else None
+        if results is not None:
+            logging.info('Serving cached dataset for "%s"', company_symbol)
+            if request.args.get('format', '').lower() == 'ndjson':
+                __signal_post_acquisition(company_symbol, should_handle_events)
+                formatter = FormatterFactory.get_formatter('ndjson')
+                return Response(formatter.transform(results), mimetype=formatter.content_type)
+        elif get_stages(request.args.get('format', ''))[0] == 'ndjson':
+            return __stream_acquisition(plan,
+                                        client,
+                                        max_workers,
+                                        fetch,
+                                        should_handle_events,
+                                        request.args['format'])
+        else:
+            # A refresh mustn't be served the result of an acquisition that didn't refresh
+            results = entity_flight.do(cache_key + (__is_refresh(),),
+                                       __acquire_dataset,
+                                       plan,
+                                       client,
+                                       max_workers,
+                                       fetch,
+                                       should_handle_events)
+            if 'errors' not in results and __get_cache_control() != 'bypass':
+                result_cache.put(cache_key, results, result_cache.get_ttl(plan))
 
         if 'format' in request.args:
             try:
-                format_result = __format_output(
-                    results, request.args['format'])
+                format_result = format_output(
+                    results, request.args['format'], is_save_requested())
             except Exception as exc:
                 response = make_response(str(exc), 400)
                 return response
 
-            if request.args['format'].lower() == 'file':
-                if should_handle_events:
-                    logging.info(
-                        "Signalling post-acquisition event handlers")
-                    SignalFactory.post_acquisition.send(
-                        company_symbol=company_symbol,
-                        end_date=datetime.now().isoformat(),
-                        message='Completed data acquisition!',
-                        uri=request.path,
-                        type='INFO')
+            if is_file_output(request.args['format']):
+                __signal_post_acquisition(company_symbol, should_handle_events)
 
-                return send_file(format_result, as_attachment=True, cache_timeout=0)
+                return send_output(format_result, request.args['format'])
 
-        if should_handle_events:
-            logging.info(
-                "Signalling post-acquisition event handlers")
-            SignalFactory.post_acquisition.send(
-                company_symbol=company_symbol,
-                end_date=datetime.now().isoformat(),
-                message='Completed data acquisition!',
-                uri=request.path,
-                type='INFO')
+        __signal_post_acquisition(company_symbol, should_handle_events)
 
         return jsonify(results)
     except NoResultFound:
@@ -171,47 +206,309 @@ def acquire(company_symbol,
         return response
 
 
-def __format_output(raw_results: dict,
-                    format_output: str):
-    logging.info('Applying additional output formatting with type %s',
-                 format_output)
-    formatter: BaseFormatter = FormatterFactory.get_formatter(format_output)
-    format_options = dict()
+@acquire_bp.route(constants.BASE_PATH, methods=[constants.HTTP_POST])
+@verify_scopes({constants.HTTP_POST: scopes.ACQUIRE_READ},
+               current_app,
+               request)
+@inject
+def acquire_batch(metadata_context: BaseContext = Provide[ApplicationContainer.context_factory],
+                  max_workers: int = Provide[ApplicationContainer.config.acquisition.max_workers],
+                  plan_cache: PlanCache = Provide[ApplicationContainer.plan_cache],
+                  incremental_fetch: IncrementalFetch = Provide[ApplicationContainer.incremental_fetch],
+                  feature_flight: SingleFlight = Provide[ApplicationContainer.feature_flight],
+                  http_session: HttpSession = Provide[ApplicationContainer.http_session],
+                  event_loop: EventLoopThread = Provide[ApplicationContainer.event_loop]):
+    """
+    Provides API function for generating a single panel dataset for several entities.
 
-    if format_output == 'file':
-        format_options['output_path'] = __get_output_configuration(
-            dict(), '', 'OutputFilePath')
+    The request body is a JSON object with an ``identifiers`` array containing the
+    identifiers of the entities to acquire data for. The acquisition plans of all
+    uncached entities are loaded from the metadata store at once, and every entity
+    shares a single data client, with feature acquisition fanned out across a
+    bounded pool of workers shared by every entity. Features shared by several
+    entities are requested through IEX market batch requests for up to 100
+    entities at a time.
 
-        if format_options['output_path'] is None:
-            raise ValueError('Error: The output file path is not set!')
+    Parameters
+    ----------
+    max_workers: int
+        Maximum number of features acquired concurrently, configured with
+        ``acquisition.max_workers``.
 
-        logging.info('Formatted output will be saved to %s',
-                     format_options['output_path'])
-        format_options['row_delimiter'] = __get_output_configuration(
-            format_options,
-            'rowDelimiter',
-            'OutputFileRowDelimiter')
+    plan_cache: :class:`pydas.acquisition.PlanCache`
+        Cache of compiled acquisition plans, so a warm acquisition makes no
+        metadata queries for the entity, its features or their options.
 
-        format_options['field_delimiter'] = __get_output_configuration(
-            format_options,
-            'fieldDelimiter',
-            'OutputFileFieldDelimiter')
+    incremental_fetch: :class:`pydas.acquisition.IncrementalFetch`
+        Fetch function that only requests the data acquired since each
+        feature's watermark. The full range of every feature is requested
+        if the ``refresh=true`` query parameter is given.
 
-        format_options['include_headers'] = __get_output_configuration(
-            format_options,
-            'header',
-            'OutputFileHasHeaderRow')
+    feature_flight: :class:`pydas.acquisition.SingleFlight`
+        Single-flight group that concurrent identical feature data requests
+        share, including those made by single acquisitions and jobs.
 
-    return formatter.transform(raw_results, **format_options)
+    http_session: :class:`pydas.transformers.sessions.HttpSession`
+        Pooled HTTP session that feature data is requested through, configured
+        with ``acquisition.http``.
 
+    event_loop: :class:`pydas.transformers.aio.EventLoopThread`
+        Event loop that feature data requests are awaited on, or ``None`` if
+        ``acquisition.aio.enabled`` isn't configured.
 
-@inject
-def __get_output_configuration(config: dict,
-                               attribute: str,
-                               option: str,
-                               context: BaseContext = Provide[ApplicationContainer.context_factory]):
-    if attribute in config:
-        return config[attribute]
-
-    config = context.get_configuration(option)
-    return '' if config is None else config
+    Returns
+    -------
+    flask.Response:
+        HTTP response with a panel dataset, keyed by entity and date, as a JSON payload,
+        newline-delimited JSON if the ``ndjson`` format is requested, or delimited file.
+        Entities that cannot be found, and features that could not be acquired, are reported
+        in the ``errors`` property of a JSON response, or the final line of an NDJSON response.
+
+    Raises
+    ------
+    sqlalchemy.exc.OperationalError:
+        Thrown if there is an issue communicating with the metadata database.
+    """
+    request_body = request.get_json(silent=True) or dict()
+    identifiers = request_body.get('identifiers')
+    if not isinstance(identifiers, list) or not identifiers:
+        return make_response('Error: Request body must include a list of identifiers', 400)
+
+    identifiers = list(dict.fromkeys(identifiers))
+    company_symbols = (',').join(identifiers)
+    should_handle_events = metadata_context.get_feature_toggle(
+        FeatureToggles.event_handlers)
+
+    if should_handle_events:
+        logging.info("Signalling pre-acquisition event handlers")
+        SignalFactory.pre_acquisition.send(
+            company_symbol=company_symbols,
+            start_date=datetime.now().isoformat())
+
+    entity_results = dict()
+    errors = dict()
+    plans = plan_cache.get_plans(metadata_context, identifiers)
+    if not plans:
+        return make_response('Cannot find any of the requested entities', 404)
+
+    for identifier in identifiers:
+        if identifier not in plans:
+            logging.warning('Cannot find entity "%s"', identifier)
+            errors[identifier] = 'Cannot find entity'
+
+    entity_requests = [plans[identifier] for identifier in identifiers if identifier in plans]
+    api_key = metadata_context.get_configuration('apiKey')
+    logging.debug("Creating IEX client with API Key: %s", api_key)
+    client = CoalescingClient(MarketBatchClient(__get_client(api_key, http_session, event_loop), entity_requests),
+                              feature_flight)
+
+    for entity_request in entity_requests:
+        if should_handle_events:
+            logging.info("Signalling pre-company event handlers")
+            SignalFactory.pre_company.send(
+                company_symbol=entity_request.entity.identifier,
+                start_date=datetime.now().isoformat())
+
+        __signal_pre_features(entity_request.entity.identifier,
+                              entity_request.requests,
+                              should_handle_events)
+
+    fetch = __get_fetch(incremental_fetch)
+    for entity, feature_results in iter_entities(client, entity_requests, max_workers, fetch):
+        results, feature_errors = __collect_results(entity.identifier,
+                                                    feature_results,
+                                                    should_handle_events)
+        entity_results[entity.identifier] = results
+        if feature_errors:
+            errors[entity.identifier] = feature_errors
+
+        if should_handle_events:
+            logging.info("Signalling post-company event handlers")
+            SignalFactory.post_company.send(
+                company_symbol=entity.identifier,
+                data=format_output(results, 'json'),
+                total_rows=sum(len(values) for values in results.values()),
+                end_date=datetime.now().isoformat())
+
+    results = format_output(entity_results, 'panel')
+    if errors:
+        results['errors'] = errors
+
+    if 'format' in request.args:
+        try:
+            format_result = format_output(results, request.args['format'], is_save_requested())
+        except Exception as exc:
+            response = make_response(str(exc), 400)
+            return response
+
+        if is_file_output(request.args['format']):
+            __signal_post_acquisition(company_symbols, should_handle_events)
+
+            return send_output(format_result, request.args['format'])
+
+        if request.args['format'].lower() == 'ndjson':
+            __signal_post_acquisition(company_symbols, should_handle_events)
+
+            return Response(format_result,
+                            mimetype=FormatterFactory.get_formatter('ndjson').content_type)
+
+    __signal_post_acquisition(company_symbols, should_handle_events)
+
+    return jsonify(results)
+
+
+def __signal_post_acquisition(company_symbol, should_handle_events: bool):
+    if should_handle_events:
+        logging.info(
+            "Signalling post-acquisition event handlers")
+        SignalFactory.post_acquisition.send(
+            company_symbol=company_symbol,
+            end_date=datetime.now().isoformat(),
+            message='Completed data acquisition!',
+            uri=request.path,
+            type='INFO')
+
+
+def __signal_pre_features(company_symbol: str, feature_requests: list, should_handle_events: bool):
+    if not should_handle_events:
+        return
+
+    for feature_request in feature_requests:
+        logging.info("Signalling pre-feature event handlers")
+        SignalFactory.pre_feature.send(
+            company_symbol=company_symbol,
+            feature_name=feature_request.feature.name,
+            start_date=datetime.now().isoformat())
+
+
+def __collect_results(company_symbol: str, feature_results, should_handle_events: bool):
+    results = dict()
+    errors = dict()
+    for result in feature_results:
+        __signal_feature_result(company_symbol, result, errors, should_handle_events)
+        results[result.feature_name] = result.columns
+
+    return results, errors
+
+
+def __signal_feature_result(company_symbol: str, result, errors: dict, should_handle_events: bool):
+    if not result.succeeded:
+        errors[result.feature_name] = str(result.error)
+        if should_handle_events:
+            logging.info("Signalling on-error event handlers")
+            SignalFactory.on_error.send(
+                uri=request.path,
+                type='ERROR',
+                exception=result.error)
+
+    if should_handle_events:
+        logging.info(
+            "Signalling post-feature event handlers")
+        SignalFactory.post_feature.send(
+            company_symbol=company_symbol,
+            feature_name=result.feature_name,
+            feature_rows=len(result.columns),
+            end_date=datetime.now().isoformat())
+
+
+def __acquire_dataset(plan: EntityRequest,
+                      client: IexClient,
+                      max_workers: int,
+                      fetch: Callable[..., FeatureResult],
+                      should_handle_events: bool) -> dict:
+    company_symbol = plan.entity.identifier
+    __signal_pre_features(company_symbol, plan.requests, should_handle_events)
+    results, errors = __collect_results(company_symbol,
+                                        iter_features(client,
+                                                      plan.entity,
+                                                      plan.requests,
+                                                      max_workers,
+                                                      fetch),
+                                        should_handle_events)
+
+    results = format_output(results, 'json')
+    if errors:
+        logging.warning('Unable to acquire %d of %d features',
+                        len(errors), len(results['header']) - 1)
+        results['errors'] = errors
+
+    if should_handle_events:
+        logging.info("Signalling post-company event handlers")
+        count = reduce(lambda total, iter: total + len(iter),
+                       results['values'],
+                       0)
+        SignalFactory.post_company.send(
+            company_symbol=company_symbol,
+            data=results,
+            total_rows=count,
+            end_date=datetime.now().isoformat())
+
+    return results
+
+
+def __get_client(api_key: str, http_session: HttpSession, event_loop: EventLoopThread) -> IexClient:
+    if event_loop is not None:
+        return AsyncIexClient(api_key, http_session, event_loop=event_loop)
+
+    return IexClient(api_key, http_session)
+
+
+def __get_cache_control() -> str:
+    """
+    Returns how the result cache is used by the request: ``"use"`` to read and write cached
+    datasets, ``"refresh"`` to only write them, or ``"bypass"`` to neither read nor write them.
+    """
+    cache_control = request.args.get('cache', '').lower()
+    if cache_control in ('refresh', 'bypass'):
+        return cache_control
+
+    if (__is_refresh()
+            or 'no-cache' in request.headers.get('Cache-Control', '').lower()):
+        return 'refresh'
+
+    return 'use'
+
+
+def __is_refresh() -> bool:
+    """Returns whether the request forces the full range of every feature to be refreshed."""
+    return request.args.get('refresh', '').lower() == 'true'
+
+
+def __get_fetch(incremental_fetch: IncrementalFetch) -> Callable[..., FeatureResult]:
+    if __is_refresh():
+        logging.info('Refreshing the full range of every feature')
+        return partial(incremental_fetch.acquire, refresh=True)
+
+    return incremental_fetch
+
+
+def __stream_acquisition(plan: EntityRequest,
+                         client: IexClient,
+                         max_workers: int,
+                         fetch: Callable[..., FeatureResult],
+                         should_handle_events: bool,
+                         output_format: str = 'ndjson'):
+    company_symbol = plan.entity.identifier
+    formatter = FormatterFactory.get_formatter('ndjson')
+
+    def generate():
+        __signal_pre_features(company_symbol, plan.requests, should_handle_events)
+        errors = dict()
+
+        def feature_values():
+            for result in iter_features(client, plan.entity, plan.requests, max_workers, fetch):
+                __signal_feature_result(company_symbol, result, errors, should_handle_events)
+                yield result.feature_name, result.columns
+
+        yield from formatter.stream([feature_request.feature.name
+                                     for feature_request in plan.requests],
+                                    feature_values(),
+                                    errors)
+
+        __signal_post_acquisition(company_symbol, should_handle_events)
+
+    if len(get_stages(output_format)) > 1:
+        # Compress the lines as they are written, e.g. for ndjson+gzip
+        return stream_file(FormatterFactory.get_formatter(output_format).pipe(generate()), output_format)
+
+    return Response(stream_with_context(generate()), mimetype=formatter.content_type)
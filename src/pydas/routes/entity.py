@@ -11,6 +11,7 @@ from pydas_metadata.contexts import BaseContext
 from pydas_metadata.models import Entity, Feature, Option
 
 from pydas import constants
+from pydas.acquisition import PlanCache
 from pydas.containers import ApplicationContainer
 
 entity_bp = Blueprint('entities',
@@ -18,6 +19,16 @@ entity_bp = Blueprint('entities',
                        url_prefix='/api/v1/entities')
 
 
+@entity_bp.after_request
+@inject
+def invalidate_plans(response, plan_cache: PlanCache = Provide[ApplicationContainer.plan_cache]):
+    """Invalidates the cached acquisition plan of an entity after its metadata changes."""
+    if request.method != constants.HTTP_GET and response.status_code < 400:
+        plan_cache.invalidate(request.view_args.get('entity_identifier'))
+
+    return response
+
+
 @entity_bp.route(constants.BASE_PATH, methods=[constants.HTTP_GET, constants.HTTP_POST])
 @verify_scopes({constants.HTTP_GET: scopes.COMPANIES_READ,
                 constants.HTTP_POST: scopes.COMPANIES_WRITE},
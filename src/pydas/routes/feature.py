@@ -11,6 +11,7 @@ from pydas_metadata.contexts import BaseContext
 from pydas_metadata.models import Feature, Handler
 
 from pydas import constants
+from pydas.acquisition import PlanCache
 from pydas.containers import ApplicationContainer
 
 feature_bp = Blueprint('features',
@@ -18,6 +19,16 @@ feature_bp = Blueprint('features',
                        url_prefix='/api/v1/features')
 
 
+@feature_bp.after_request
+@inject
+def invalidate_plans(response, plan_cache: PlanCache = Provide[ApplicationContainer.plan_cache]):
+    """Invalidates every cached acquisition plan after a feature changes."""
+    if request.method != constants.HTTP_GET and response.status_code < 400:
+        plan_cache.invalidate()
+
+    return response
+
+
 @feature_bp.route(constants.BASE_PATH,
                   methods=[constants.HTTP_GET, constants.HTTP_POST])
 @verify_scopes({constants.HTTP_GET: scopes.FEATURES_READ,
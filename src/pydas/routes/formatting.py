@@ -0,0 +1,126 @@
+'''Output formatting shared by the routes that return acquired datasets.'''
+import logging
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from flask import Response, request, send_file, stream_with_context
+
+from pydas_metadata.contexts import BaseContext
+
+from pydas.containers import ApplicationContainer
+from pydas.formatters import BaseFormatter, FormatterFactory, get_stages
+
+
+def format_output(raw_results: dict,
+                  output_format: str,
+                  save_file: bool = False):
+    """
+    Applies the output formatter registered for the given format to an acquired dataset.
+
+    Parameters
+    ----------
+    raw_results: dict
+        Acquired dataset to be formatted.
+
+    output_format: str
+        Name of the output format, e.g. ``"file"``, or a chain of formats, e.g. ``"csv+gzip"``.
+
+    save_file: bool
+        Flag indicating whether file output is written to the configured output file path,
+        rather than returned as chunks of delimited text to stream, e.g. if
+        :func:`is_save_requested`. Only unchained ``file`` and ``csv`` output can be saved.
+        Default: ``False``.
+
+    Returns
+    -------
+    any:
+        Formatted dataset, as returned by the output formatter.
+
+    Raises
+    ------
+    KeyError:
+        Thrown if there is no output formatter registered for the format.
+
+    ValueError:
+        Thrown if the output file path is not configured for saved file output.
+    """
+    logging.info('Applying additional output formatting with type %s',
+                 output_format)
+    formatter: BaseFormatter = FormatterFactory.get_formatter(output_format)
+    format_options = dict()
+
+    stages = get_stages(output_format)
+    if stages[0] in ('file', 'csv'):
+        if save_file and len(stages) == 1:
+            format_options['output_path'] = get_output_configuration(
+                dict(), '', 'OutputFilePath')
+
+            if not format_options['output_path']:
+                raise ValueError('Error: The output file path is not set!')
+
+            logging.info('Formatted output will be saved to %s',
+                         format_options['output_path'])
+
+        format_options['row_delimiter'] = get_output_configuration(
+            format_options,
+            'rowDelimiter',
+            'OutputFileRowDelimiter')
+
+        format_options['field_delimiter'] = get_output_configuration(
+            format_options,
+            'fieldDelimiter',
+            'OutputFileFieldDelimiter')
+
+        format_options['include_headers'] = get_output_configuration(
+            format_options,
+            'header',
+            'OutputFileHasHeaderRow')
+
+    return formatter.transform(raw_results, **format_options)
+
+
+def is_file_output(output_format: str) -> bool:
+    """Returns whether the given output format is downloaded as a file, e.g. ``csv+gzip``."""
+    return getattr(FormatterFactory.get_formatter(output_format), 'attachment', False)
+
+
+def is_save_requested() -> bool:
+    """Returns whether the request asks for file output to be saved to disk with ``save=true``."""
+    return request.args.get('save', '').lower() == 'true'
+
+
+def send_output(format_result, output_format: str) -> Response:
+    """
+    Returns a response with file output as an attachment, sending the file if it was saved to
+    disk, otherwise streaming its chunks with :func:`stream_file`.
+    """
+    if isinstance(format_result, str):
+        logging.info('Sending saved output file %s', format_result)
+        return send_file(format_result, as_attachment=True, max_age=0)
+
+    return stream_file(format_result, output_format)
+
+
+def stream_file(chunks: Iterable, output_format: str = 'file') -> Response:
+    """
+    Returns a response that streams the chunks of a file in the given output format to the
+    client as an attachment, without writing the file to disk.
+    """
+    formatter = FormatterFactory.get_formatter(output_format)
+    return Response(stream_with_context(chunks),
+                    mimetype=formatter.content_type,
+                    headers={'Content-Disposition': f'attachment; filename={formatter.get_filename()}',
+                             'Cache-Control': 'no-cache'})
+
+
+@inject
+def get_output_configuration(config: dict,
+                             attribute: str,
+                             option: str,
+                             context: BaseContext = Provide[ApplicationContainer.context_factory]):
+    """Returns the attribute from the given options, falling back to the metadata configuration."""
+    if attribute in config:
+        return config[attribute]
+
+    config = context.get_configuration(option)
+    return '' if config is None else config
@@ -0,0 +1,110 @@
+import json as j
+import logging
+from os import path
+
+from dependency_injector.wiring import inject, Provide
+from flask import Blueprint, Response, current_app, make_response, request
+from flask.json import jsonify
+
+from pydas_auth import scopes
+from pydas_auth.scopes import verify_scopes
+
+from pydas_metadata import json
+from pydas_metadata.models import JobStatus
+
+from pydas import constants
+from pydas.acquisition import JobManager
+from pydas.containers import ApplicationContainer
+from pydas.formatters import NdjsonFormatter
+from pydas.routes.formatting import format_output, is_file_output, is_save_requested, send_output
+
+jobs_bp = Blueprint('jobs',
+                    'pydas.routes.jobs',
+                    url_prefix='/api/v1/jobs')
+
+
+@jobs_bp.route(constants.BASE_PATH, methods=[constants.HTTP_POST])
+@verify_scopes({constants.HTTP_POST: scopes.ACQUIRE_READ},
+               current_app,
+               request)
+@inject
+def submit_job(job_manager: JobManager = Provide[ApplicationContainer.job_manager]):
+    """
+    Submits an acquisition to be executed in the background.
+
+    The request body is a JSON object with an ``identifiers`` array containing the
+    identifiers of the entities to acquire data for. A single identifier produces the
+    same dataset as ``GET /api/v1/acquire/<identifier>``, while several identifiers
+    produce a panel dataset keyed by entity and date.
+
+    Returns
+    -------
+    flask.Response:
+        HTTP 202 response with the pending job as a JSON payload.
+    """
+    request_body = request.get_json(silent=True) or dict()
+    identifiers = request_body.get('identifiers')
+    if not isinstance(identifiers, list) or not identifiers:
+        return make_response('Error: Request body must include a list of identifiers', 400)
+
+    job = job_manager.submit(list(dict.fromkeys(identifiers)))
+    response = make_response(jsonify(json(job)), 202)
+    response.headers['Location'] = f'{jobs_bp.url_prefix}/{job.id}'
+    return response
+
+
+@jobs_bp.route('/<job_id>', methods=[constants.HTTP_GET])
+@verify_scopes({constants.HTTP_GET: scopes.ACQUIRE_READ},
+               current_app,
+               request)
+@inject
+def job_index(job_id: str,
+              job_manager: JobManager = Provide[ApplicationContainer.job_manager]):
+    """Returns the status and progress of an acquisition job."""
+    job = job_manager.get_job(job_id)
+    if job is None:
+        return make_response('Cannot find job requested', 404)
+
+    return jsonify(json(job))
+
+
+@jobs_bp.route('/<job_id>/result', methods=[constants.HTTP_GET])
+@verify_scopes({constants.HTTP_GET: scopes.ACQUIRE_READ},
+               current_app,
+               request)
+@inject
+def job_result(job_id: str,
+               job_manager: JobManager = Provide[ApplicationContainer.job_manager]):
+    """
+    Returns the dataset acquired by a completed job, as a JSON payload or delimited file.
+    This is determined from whether a query parameter is provided that specifies a file
+    output formatter.
+    """
+    job = job_manager.get_job(job_id)
+    if job is None:
+        return make_response('Cannot find job requested', 404)
+
+    if JobStatus[job.status] != JobStatus.COMPLETED:
+        return make_response(f'Job is not complete, current status is {job.status}', 409)
+
+    if not job.result_path or not path.isfile(job.result_path):
+        return make_response('Result of job requested is no longer available', 410)
+
+    logging.info('Loading result of acquisition job %s', job_id)
+    with open(job.result_path) as file:
+        results = j.load(file)
+
+    if 'format' in request.args:
+        try:
+            format_result = format_output(results, request.args['format'], is_save_requested())
+        except Exception as exc:
+            response = make_response(str(exc), 400)
+            return response
+
+        if is_file_output(request.args['format']):
+            return send_output(format_result, request.args['format'])
+
+        if request.args['format'].lower() == 'ndjson':
+            return Response(format_result, mimetype=NdjsonFormatter.content_type)
+
+    return jsonify(results)
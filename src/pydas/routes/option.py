@@ -10,6 +10,7 @@ from pydas_metadata.contexts import BaseContext
 from pydas_metadata.models import Option
 
 from pydas import constants
+from pydas.acquisition import PlanCache
 from pydas.containers import ApplicationContainer
 
 option_bp = Blueprint('options',
@@ -17,6 +18,16 @@ option_bp = Blueprint('options',
                       url_prefix='/api/v1/options')
 
 
+@option_bp.after_request
+@inject
+def invalidate_plans(response, plan_cache: PlanCache = Provide[ApplicationContainer.plan_cache]):
+    """Invalidates every cached acquisition plan after an option changes."""
+    if request.method != constants.HTTP_GET and response.status_code < 400:
+        plan_cache.invalidate()
+
+    return response
+
+
 @option_bp.route(constants.BASE_PATH, methods=[constants.HTTP_GET, constants.HTTP_POST])
 @verify_scopes({constants.HTTP_GET: scopes.OPTIONS_READ,
                 constants.HTTP_POST: scopes.OPTIONS_WRITE},
@@ -12,7 +12,9 @@ from pydas_metadata.contexts import BaseContext
 from pydas_metadata.models import Statistics
 
 from pydas import constants
+from pydas.acquisition import ResultCache
 from pydas.containers import ApplicationContainer
+from pydas.transformers.sessions import HttpSession
 
 statistics_bp = Blueprint('statistics',
                           'pydas.routes.statistics',
@@ -115,3 +117,23 @@ def feature_stats(company_symbol: str,
         response = make_response(
             'Cannot find feature requested', 404)
         return response
+
+
+@statistics_bp.route('/cache')
+@verify_scopes({constants.HTTP_GET: scopes.STATISTICS_READ},
+               current_app,
+               request)
+@inject
+def cache_index(result_cache: ResultCache = Provide[ApplicationContainer.result_cache]):
+    """Returns the hit, miss and eviction counters of the acquired dataset cache."""
+    return jsonify(result_cache.get_statistics())
+
+
+@statistics_bp.route('/http')
+@verify_scopes({constants.HTTP_GET: scopes.STATISTICS_READ},
+               current_app,
+               request)
+@inject
+def http_index(http_session: HttpSession = Provide[ApplicationContainer.http_session]):
+    """Returns the request and connection reuse counters of the handlers' HTTP session."""
+    return jsonify(http_session.get_statistics())
@@ -0,0 +1,67 @@
+"""Local stores for the feature data acquired from data sources."""
+
+from typing import List
+
+from .base import BaseStore
+from .segment import SegmentStore
+from .sqlite import SqliteStore
+
+
+class StoreFactory:
+    """
+    Provides a centralized store for the local feature data store implementations.
+
+    The factory is pre-seeded with :class:`pydas.stores.SegmentStore`, for the ``file`` store
+    type, and :class:`pydas.stores.SqliteStore`, for the ``sqlite`` store type.
+
+    Attributes
+    ----------
+    stores: list[BaseStore]
+        Collection of supported store implementations.
+    """
+
+    stores: List[BaseStore] = [SegmentStore, SqliteStore]
+
+    @classmethod
+    def register_store(cls, store: BaseStore):
+        """
+        Registers a store implementation with the factory.
+
+        Parameters
+        ----------
+        store: any
+            Store implementation to register.
+
+        Raises
+        ------
+        TypeError:
+            Thrown if the store is ``NoneType``.
+        """
+        if store is None:
+            raise TypeError('store must not be None')
+
+        cls.stores.append(store)
+
+    @classmethod
+    def get_store(cls, store_type: str, **store_config) -> BaseStore:
+        """
+        Returns a store instance that supports the given store type.
+
+        Parameters
+        ----------
+        store_type: str
+            Name of the store type to construct, e.g. ``"file"``.
+
+        store_config: dict
+            Additional store configuration values, such as the ``path`` to store data in.
+
+        Raises
+        ------
+        ValueError:
+            Thrown if there is no registered store that supports the given type.
+        """
+        for store in cls.stores:
+            if store.can_handle(store_type):
+                return store(**store_config)
+
+        raise ValueError(f'Unsupported store type: "{store_type}".')
@@ -0,0 +1,92 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class BaseStore(metaclass=ABCMeta):
+    """
+    Local store of acquired feature data, keyed by entity, feature and date.
+
+    Each series of data points is identified by an entity identifier, a feature name and a key
+    distinguishing the options the feature was acquired with. Writing a data point for a date
+    that has already been stored replaces the stored value.
+    """
+
+    @classmethod
+    @abstractmethod
+    def can_handle(cls, store_type: str) -> bool:
+        """
+        Returns a value indicating whether this store supports the requested type.
+
+        Parameters
+        ----------
+        store_type: str
+            Name of the store being requested.
+
+        Returns
+        -------
+        bool:
+            Flag indicating whether the store supports the requested type.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def read(self,
+             entity_id: str,
+             feature_name: str,
+             key: str,
+             start: str = None) -> Dict[str, Any]:
+        """
+        Returns the stored data points of a series.
+
+        Parameters
+        ----------
+        entity_id: str
+            Identifier of the entity the data was acquired for.
+
+        feature_name: str
+            Name of the feature that was acquired.
+
+        key: str
+            Key distinguishing the options the feature was acquired with.
+
+        start: str
+            Earliest date to return data points for, in ISO format. Default: ``None``, which
+            returns every data point.
+
+        Returns
+        -------
+        dict[str, Any]:
+            Stored values keyed by date.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def write(self, entity_id: str, feature_name: str, key: str, points: Dict[str, Any]):
+        """
+        Stores data points of a series, replacing any values already stored for their dates.
+
+        Parameters
+        ----------
+        entity_id: str
+            Identifier of the entity the data was acquired for.
+
+        feature_name: str
+            Name of the feature that was acquired.
+
+        key: str
+            Key distinguishing the options the feature was acquired with.
+
+        points: dict[str, Any]
+            Values to store, keyed by date.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def last_date(self, entity_id: str, feature_name: str, key: str) -> Optional[str]:
+        """
+        Returns the latest date stored for a series, or ``None`` if the series is empty.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Releases any resources held by the store."""
@@ -0,0 +1,197 @@
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import tempfile
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from pydas.stores.base import BaseStore
+
+DEFAULT_SEGMENT_SIZE = 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 16
+
+
+class SegmentStore(BaseStore):
+    """
+    File store that appends data points to segment files, which are memory-mapped for reads.
+
+    Each series is kept in its own directory of segment files containing one JSON encoded
+    ``[date, value]`` record per line. Records are only ever appended to the newest segment,
+    and a new segment is started once it grows beyond :attr:`segment_size`. A manifest records
+    the size and date range of each segment, so reads can skip segments that end before the
+    requested start date and ignore any partially written records.
+
+    When a value is rewritten for a date, the newer record takes precedence. Once a series has
+    more than :attr:`max_segments` segments, it is compacted into at most half as many
+    segments holding one record per date.
+
+    Attributes
+    ----------
+    path: str
+        Directory that the series are stored in. Default: ``pydas-store`` in the system's
+        temporary directory.
+
+    segment_size: int
+        Size in bytes that a segment grows to before a new segment is started.
+
+    max_segments: int
+        Number of segments a series may have before it is compacted.
+    """
+
+    manifest_name = 'manifest.json'
+
+    def __init__(self,
+                 path: str = None,
+                 segment_size: int = None,
+                 max_segments: int = None,
+                 **kwargs):
+        self.path = path or os.path.join(tempfile.gettempdir(), 'pydas-store')
+        self.segment_size = segment_size or DEFAULT_SEGMENT_SIZE
+        self.max_segments = max_segments or DEFAULT_MAX_SEGMENTS
+        self._locks: Dict[str, Lock] = dict()
+        self._lock = Lock()
+
+    @classmethod
+    def can_handle(cls, store_type: str) -> bool:
+        return store_type.lower() == 'file'
+
+    def read(self,
+             entity_id: str,
+             feature_name: str,
+             key: str,
+             start: str = None) -> Dict[str, Any]:
+        series_path = self._get_path(entity_id, feature_name, key)
+        points = dict()
+        with self._get_lock(series_path):
+            for segment in self._load_manifest(series_path):
+                if start is not None and segment['end'] < start:
+                    continue
+
+                for date, value in self._read_segment(series_path, segment):
+                    if start is None or date >= start:
+                        points[date] = value
+
+        return points
+
+    def write(self, entity_id: str, feature_name: str, key: str, points: Dict[str, Any]):
+        if not points:
+            return
+
+        series_path = self._get_path(entity_id, feature_name, key)
+        with self._get_lock(series_path):
+            Path(series_path).mkdir(parents=True, exist_ok=True)
+            manifest = self._load_manifest(series_path)
+            if not manifest or manifest[-1]['size'] >= self.segment_size:
+                manifest.append(self._new_segment(manifest))
+
+            segment = manifest[-1]
+            records = b''.join(self._encode(date, value) for date, value in points.items())
+            with open(os.path.join(series_path, segment['name']), 'ab') as file:
+                # Discard any records that were written after the manifest was last saved
+                file.truncate(segment['size'])
+                file.write(records)
+
+            segment['size'] += len(records)
+            segment['start'] = min(filter(None, [segment['start'], *points]))
+            segment['end'] = max(segment['end'], *points)
+            if len(manifest) > self.max_segments:
+                manifest = self._compact(series_path, manifest)
+
+            self._save_manifest(series_path, manifest)
+
+    def last_date(self, entity_id: str, feature_name: str, key: str) -> Optional[str]:
+        series_path = self._get_path(entity_id, feature_name, key)
+        with self._get_lock(series_path):
+            manifest = self._load_manifest(series_path)
+
+        return max((segment['end'] for segment in manifest if segment['size']), default=None)
+
+    def _compact(self, series_path: str, manifest: List[dict]) -> List[dict]:
+        logging.debug('Compacting %d segments in "%s"', len(manifest), series_path)
+        points = dict()
+        for segment in manifest:
+            points.update(self._read_segment(series_path, segment))
+
+        records = [self._encode(date, points[date]) for date in sorted(points)]
+        # Compacted segments may outgrow the segment size, so that compacting leaves room for
+        # at least as many appended segments as there are compacted segments.
+        target_size = max(self.segment_size,
+                          sum(len(record) for record in records) // max(self.max_segments // 2, 1) + 1)
+        compacted = []
+        segment_records = []
+        size = 0
+        for record in records:
+            segment_records.append(record)
+            size += len(record)
+            if size >= target_size:
+                compacted.append(self._write_segment(series_path, manifest + compacted, segment_records))
+                segment_records = []
+                size = 0
+
+        if segment_records or not compacted:
+            compacted.append(self._write_segment(series_path, manifest + compacted, segment_records))
+
+        # Old segments are only removed once the manifest no longer references them
+        self._save_manifest(series_path, compacted)
+        for segment in manifest:
+            os.remove(os.path.join(series_path, segment['name']))
+
+        return compacted
+
+    def _write_segment(self, series_path: str, manifest: List[dict], records: List[bytes]) -> dict:
+        segment = self._new_segment(manifest)
+        data = b''.join(records)
+        with open(os.path.join(series_path, segment['name']), 'wb') as file:
+            file.write(data)
+
+        dates = [json.loads(record)[0] for record in (records[0], records[-1])] if records else ['', '']
+        segment.update(size=len(data), start=dates[0], end=dates[1])
+        return segment
+
+    def _read_segment(self, series_path: str, segment: dict):
+        if not segment['size']:
+            return
+
+        with open(os.path.join(series_path, segment['name']), 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                offset = 0
+                while offset < segment['size']:
+                    end = view.find(b'\n', offset, segment['size'])
+                    if end == -1:
+                        break
+
+                    yield json.loads(view[offset:end])
+                    offset = end + 1
+
+    def _get_lock(self, series_path: str) -> Lock:
+        with self._lock:
+            return self._locks.setdefault(series_path, Lock())
+
+    def _get_path(self, entity_id: str, feature_name: str, key: str) -> str:
+        return os.path.join(self.path, entity_id, f'{feature_name}-{key}')
+
+    def _load_manifest(self, series_path: str) -> List[dict]:
+        manifest_path = os.path.join(series_path, self.manifest_name)
+        if not os.path.exists(manifest_path):
+            return []
+
+        with open(manifest_path) as file:
+            return json.load(file)
+
+    def _save_manifest(self, series_path: str, manifest: List[dict]):
+        manifest_path = os.path.join(series_path, self.manifest_name)
+        with open(manifest_path + '.tmp', 'w') as file:
+            json.dump(manifest, file)
+
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    @staticmethod
+    def _new_segment(manifest: List[dict]) -> dict:
+        number = int(manifest[-1]['name'].split('.')[0]) + 1 if manifest else 1
+        return {'name': f'{number:08d}.seg', 'size': 0, 'start': '', 'end': ''}
+
+    @staticmethod
+    def _encode(date: str, value: Any) -> bytes:
+        return (json.dumps([date, value], default=str) + '\n').encode('utf-8')
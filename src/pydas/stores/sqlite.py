@@ -0,0 +1,75 @@
+import json
+import os
+from pathlib import Path
+import sqlite3
+import tempfile
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from pydas.stores.base import BaseStore
+
+
+class SqliteStore(BaseStore):
+    """
+    Store that keeps every series in a single SQLite database file.
+
+    Attributes
+    ----------
+    path: str
+        Directory containing the ``points.sqlite`` database file. Default: ``pydas-store`` in
+        the system's temporary directory.
+    """
+
+    database_name = 'points.sqlite'
+
+    def __init__(self, path: str = None, **kwargs):
+        self.path = path or os.path.join(tempfile.gettempdir(), 'pydas-store')
+        Path(self.path).mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(self.path, self.database_name),
+                                           check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS FeaturePoint ('
+                                     'EntityID TEXT NOT NULL, '
+                                     'FeatureName TEXT NOT NULL, '
+                                     'OptionsHashTXT TEXT NOT NULL, '
+                                     'PointDT TEXT NOT NULL, '
+                                     'ValueJSON TEXT, '
+                                     'PRIMARY KEY (EntityID, FeatureName, OptionsHashTXT, PointDT))')
+
+    @classmethod
+    def can_handle(cls, store_type: str) -> bool:
+        return store_type.lower() == 'sqlite'
+
+    def read(self,
+             entity_id: str,
+             feature_name: str,
+             key: str,
+             start: str = None) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._connection.execute('SELECT PointDT, ValueJSON FROM FeaturePoint '
+                                            'WHERE EntityID = ? AND FeatureName = ? '
+                                            'AND OptionsHashTXT = ? AND PointDT >= ?',
+                                            (entity_id, feature_name, key, start or '')).fetchall()
+
+        return {date: json.loads(value) for date, value in rows}
+
+    def write(self, entity_id: str, feature_name: str, key: str, points: Dict[str, Any]):
+        with self._lock, self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO FeaturePoint VALUES (?, ?, ?, ?, ?)',
+                                         [(entity_id, feature_name, key, date,
+                                           json.dumps(value, default=str))
+                                          for date, value in points.items()])
+
+    def last_date(self, entity_id: str, feature_name: str, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute('SELECT MAX(PointDT) FROM FeaturePoint '
+                                           'WHERE EntityID = ? AND FeatureName = ? '
+                                           'AND OptionsHashTXT = ?',
+                                           (entity_id, feature_name, key)).fetchone()
+
+        return row[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -5,7 +5,7 @@ Each handler function follows the general form of:
 
 .. code-block:: python
 
-   def name_handler(uri: str, options: dict, api_key: str) -> list:
+   def name_handler(uri: str, options: dict, api_key: str, session: HttpSession = None) -> list:
      # function logic...
 
 
@@ -21,6 +21,15 @@ implement an API key, this will obviously be an optional parameter.
 All handlers should return a list containing all data acquired from
 the resource. The list does not enforce any internal data types, so
 type validation or processing may be required afterwards.
+
+Handlers may also provide an asynchronous variant with the same name in
+:mod:`pydas.transformers.aio`, which :class:`pydas.clients.AsyncIexClient`
+awaits instead of running the blocking handler on an executor.
+
+Handlers that make HTTP requests should send them through the pooled
+:class:`pydas.transformers.sessions.HttpSession` they are given, which
+the data clients obtain from the application container, so that
+connections are reused across requests and worker threads.
 """
 
 from .iex_handlers import batch_handler
@@ -0,0 +1,251 @@
+"""
+Asynchronous IEX Cloud API handler functions.
+
+Each asynchronous handler follows the general form of:
+
+.. code-block:: python
+
+   async def name_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
+     # function logic...
+
+with the same parameters and return value as the blocking handler of the same name in
+:mod:`pydas.transformers`. Requests are sent through the HTTP client opened with
+:func:`open_session` for the current task, so hundreds of concurrent requests can be awaited
+on a single event loop while sharing a pool of keep-alive connections. Handlers without an
+asynchronous variant are run on an executor by :class:`pydas.clients.AsyncIexClient`.
+
+Blocking code, e.g. the worker threads of the acquisition pipeline, runs handlers on the
+:class:`EventLoopThread` opened with :func:`open_event_loop`, so the upstream requests of
+every worker thread are awaited on the same event loop.
+
+Retries and concurrency follow the configuration of the blocking
+:class:`pydas.transformers.sessions.HttpSession` that the handler is given.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import datetime as dt
+import inspect
+import logging
+import threading
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+import httpx
+
+from pydas.constants import SdasConstants, UtilityConstants
+from pydas.transformers.planner import plan_range_request, slice_range_response
+from pydas.transformers.sessions import DEFAULT_TIMEOUT, HttpSession, is_transient_status
+from pydas.transformers.utils import build_query, get_query_options, get_range_dates
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar('pydas_async_client', default=None)
+
+T = TypeVar('T')
+
+
+@asynccontextmanager
+async def open_session(max_connections: int = None,
+                       timeout: float = None) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Opens the HTTP client that asynchronous handlers send their requests through within the
+    context, including from the tasks it creates.
+
+    Parameters
+    ----------
+    max_connections: int
+        Maximum number of connections open at the same time. Default: ``100``.
+
+    timeout: float
+        Seconds to wait for a server to connect or respond. Default: ``30``.
+    """
+    async with _create_client(max_connections, timeout) as client:
+        token = _client.set(client)
+        try:
+            yield client
+        finally:
+            _client.reset(token)
+
+
+class EventLoopThread:
+    """
+    Event loop running on a background thread, which blocking code submits coroutines to.
+
+    Coroutines submitted with :meth:`run` send their requests through the HTTP client of the
+    event loop, so the requests of every thread that submits coroutines share a single pool of
+    keep-alive connections.
+
+    Attributes
+    ----------
+    loop: :class:`asyncio.AbstractEventLoop`
+        Event loop that coroutines are run on.
+
+    client: :class:`httpx.AsyncClient`
+        HTTP client that asynchronous handlers send their requests through.
+    """
+
+    def __init__(self, max_connections: int = None, timeout: float = None):
+        self.client = _create_client(max_connections, timeout)
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name='pydas-event-loop',
+                                        daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Runs a coroutine on the event loop and returns its result, blocking the calling thread
+        until it completes. Must not be called from the event loop's own thread.
+        """
+        return asyncio.run_coroutine_threadsafe(self._run(coroutine), self.loop).result()
+
+    def close(self):
+        """Closes the HTTP client and stops the event loop."""
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        self.loop.close()
+
+    async def _run(self, coroutine: Awaitable[T]) -> T:
+        token = _client.set(self.client)
+        try:
+            return await coroutine
+        finally:
+            _client.reset(token)
+
+
+def open_event_loop(enabled: bool = False,
+                    max_connections: int = None,
+                    timeout: float = None) -> Iterator[Optional[EventLoopThread]]:
+    """
+    Opens the event loop that the application container provides to the data clients, closing
+    it when the container's resources are shut down.
+
+    Parameters
+    ----------
+    enabled: bool
+        Flag indicating whether upstream requests are awaited on an event loop. If ``False``,
+        no event loop is opened and ``None`` is yielded instead. Default: ``False``.
+
+    max_connections: int
+        Maximum number of connections open at the same time. Default: ``100``.
+
+    timeout: float
+        Seconds to wait for a server to connect or respond. Default: ``30``.
+
+    Returns
+    -------
+    Iterator[:class:`EventLoopThread`]:
+        Generator yielding the event loop, which is closed once the generator resumes.
+    """
+    if not enabled:
+        yield None
+        return
+
+    event_loop = EventLoopThread(max_connections, timeout)
+    logging.info('Awaiting upstream requests on an event loop')
+    try:
+        yield event_loop
+    finally:
+        event_loop.close()
+
+
+def get_handler(handler_name: str) -> Optional[Callable[..., Awaitable[list]]]:
+    """
+    Returns the asynchronous variant of a handler function, or ``None`` if the handler only has
+    a blocking implementation.
+    """
+    handler = globals().get(handler_name) if handler_name.endswith('_handler') else None
+    return handler if inspect.iscoroutinefunction(handler) else None
+
+
+async def batch_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
+    """Asynchronous variant of :func:`pydas.transformers.batch_handler`."""
+    _validate(uri, api_key)
+    logging.info('Requesting data from endpoint: "%s"', uri)
+    response = await _get(session or HttpSession(), uri + build_query(options, api_key), uri)
+    return response.json()
+
+
+async def range_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
+    """
+    Asynchronous variant of :func:`pydas.transformers.range_handler`.
+
+    The trading days that can't be requested as a chart range are requested concurrently, up
+    to the HTTP session's ``max_in_flight`` requests at a time.
+    """
+    _validate(uri, api_key)
+    session = session or HttpSession()
+    dates = get_range_dates(options)
+    if not dates:
+        return []
+
+    points = dict()
+    remaining = dates
+    range_uri = plan_range_request(uri, dates, dt.date.today())
+    if range_uri is not None:
+        logging.info('Requesting %d days as a single range from "%s"', len(dates), range_uri)
+        response = await _get(session, range_uri + build_query(get_query_options(options), api_key), range_uri)
+        points, remaining = slice_range_response(response.json(), dates)
+
+    if remaining:
+        semaphore = asyncio.Semaphore(session.max_in_flight)
+
+        async def get_day(t_date: dt.date) -> dict:
+            async with semaphore:
+                query = build_query(get_query_options(options)
+                                    + [{'name': 'exactDate', 'value': t_date.strftime('%Y%m%d')}],
+                                    api_key)
+                point = (await _get(session, uri + query, t_date.strftime('%Y-%m-%d'))).json()
+
+            if SdasConstants.date_property not in point:
+                point[SdasConstants.date_property] = t_date.strftime('%Y-%m-%d')
+
+            return point
+
+        points.update(zip(remaining, await asyncio.gather(*(get_day(t_date) for t_date in remaining))))
+
+    return [points[t_date] for t_date in dates if t_date in points]
+
+
+async def _get(session: HttpSession, url: str, description: str) -> httpx.Response:
+    """Sends a GET request, retrying transient failures as configured by the session."""
+    client = _client.get()
+    if client is None:
+        async with open_session(max_connections=1):
+            return await _get(session, url, description)
+
+    for attempt in range(session.retries + 1):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as exc:
+            if attempt == session.retries or not _is_transient(exc):
+                raise
+
+            delay = session.retry_backoff * 2 ** attempt
+            logging.warning('Retrying request for %s in %.1fs: %s', description, delay, exc)
+            await asyncio.sleep(delay)
+
+
+def _is_transient(exc: httpx.HTTPError) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return is_transient_status(exc.response.status_code)
+
+    return isinstance(exc, httpx.TransportError)
+
+
+def _validate(uri: str, api_key: str):
+    if uri is None or uri.strip() == UtilityConstants.str_empty:
+        raise ValueError('Invalid URI for feature')
+
+    if api_key is None or api_key.strip() == UtilityConstants.str_empty:
+        raise ValueError('Invalid API key provided')
+
+
+def _create_client(max_connections: Optional[int], timeout: Optional[float]) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=max_connections or DEFAULT_MAX_CONNECTIONS,
+                          max_keepalive_connections=max_connections or DEFAULT_MAX_CONNECTIONS)
+    return httpx.AsyncClient(limits=limits, timeout=timeout or DEFAULT_TIMEOUT)
@@ -1,15 +1,22 @@
 """
 IEX Cloud API handler functions that control how data is requested from the REST API.
 """
+from concurrent.futures import ThreadPoolExecutor
 import datetime as dt
 import logging
+import time
+
 import requests
 
+from pydas.columns import to_array
 from pydas.constants import SdasConstants, UtilityConstants
-from pydas.transformers.utils import build_query, calc_range
+from pydas.transformers.planner import plan_range_request, slice_range_response
+from pydas.transformers.sessions import HttpSession, is_transient_status
+from pydas.transformers.streaming import parse_response
+from pydas.transformers.utils import build_query, get_query_options, get_range_dates
 
 
-def batch_handler(uri: str, options: list, api_key: str) -> list:
+def batch_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
     """IEX API call with batch support
 
     Depending on the endpoint, batch operation support is available. This means
@@ -23,11 +30,16 @@ def batch_handler(uri: str, options: list, api_key: str) -> list:
         Additional batch options (e.g. range)
     api_key : str
         IEX API token for authorized calls
+    session : HttpSession
+        Pooled HTTP session to send requests through, e.g. the session provided by the
+        application container. Default: a new session with the default configuration.
 
     Returns
     -------
     list
-        Collection of tuples containing the date returned from the API request.
+        Collection of tuples containing the date returned from the API request. If the
+        HTTP session has ``stream_json`` enabled, array responses are returned as a
+        generator of their records, which are parsed as the response is received.
 
     Raises
     ------
@@ -42,12 +54,20 @@ def batch_handler(uri: str, options: list, api_key: str) -> list:
 
     logging.info(
         f'Requesting data from endpoint: "{uri+build_query(options, api_key)}"')
-    response = requests.get(uri+build_query(options, api_key))
+    session = session or HttpSession()
+    if session.stream_json:
+        response = session.get(uri+build_query(options, api_key), stream=True)
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return parse_response(response, session.chunk_size)
+
+    response = session.get(uri+build_query(options, api_key))
     response.raise_for_status()
     return response.json()
 
 
-def tech_indicators_handler(uri: str, options: list, api_key: str) -> list:
+def tech_indicators_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> dict:
     """IEX API call with batch support for technical indicators
 
     Depending on the endpoint, batch operation support is available. This means
@@ -62,11 +82,18 @@ def tech_indicators_handler(uri: str, options: list, api_key: str) -> list:
         Additional batch options (e.g. range) MUST INCLUDE `feature_name`
     api_key : str
         IEX API token for authorized calls
+    session : HttpSession
+        Pooled HTTP session to send requests through, e.g. the session provided by the
+        application container. Default: a new session with the default configuration.
 
     Returns
     -------
-    list
-        Collection of tuples containing the date returned from the API request.
+    dict
+        Columnar data point with a list of chart dates under ``date``, and the aligned values
+        of each indicator series. The first series is keyed by the feature name, and any
+        further series, e.g. the bands of ``bbands``, by the feature name suffixed with the
+        index of the series, e.g. ``bbands_1``. Numeric series are NumPy arrays if NumPy is
+        installed, and missing values are empty.
 
     Raises
     ------
@@ -78,27 +105,38 @@ def tech_indicators_handler(uri: str, options: list, api_key: str) -> list:
     if feature_name == UtilityConstants.str_empty:
         raise KeyError("Feature name was not found in the options collection")
 
-    response = batch_handler(uri, options, api_key)
+    response = batch_handler(uri, options, api_key, session)
 
-    chart_len = len(response["chart"])
-    indicator_len = len(response["indicator"][0])
-    if chart_len != indicator_len:
+    chart = response["chart"]
+    indicators = response["indicator"]
+    length = min([len(chart)] + [len(series) for series in indicators])
+    if any(len(series) != len(chart) for series in indicators):
         logging.warning(
             "Chart and indicator lengths do not match! Using the shortest length, data loss may occur.")
 
-    result = []
-    for i in range(indicator_len if indicator_len <= chart_len else chart_len):
-        value = response["indicator"][0][i]
-        result.append(
-            {'date': response["chart"][i]["date"],
-             feature_name: value if value is not None else UtilityConstants.str_empty})
+    result = {SdasConstants.date_property: [point[SdasConstants.date_property] for point in chart[:length]]}
+    for i, series in enumerate(indicators):
+        values = series[:length]
+        if None in values:
+            values = [value if value is not None else UtilityConstants.str_empty for value in values]
+
+        result[feature_name if i == 0 else f'{feature_name}_{i}'] = to_array(values)
 
     return result
 
 
-def range_handler(uri: str, options: list, api_key: str) -> list:
+def range_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
     """Calls REST API using options for determining day range for number of values to return
 
+    The trading days in the range are determined with the trading calendar, see
+    :mod:`pydas.transformers.trading_calendar`, so weekends and market holidays are never
+    requested. Chart endpoints are called once for the smallest chart range covering the
+    range, and the response is sliced into the data points of the trading days, see
+    :mod:`pydas.transformers.planner`. Other endpoints are called once for each trading day in
+    the range. These calls are made concurrently, up to the HTTP session's
+    ``max_in_flight`` calls at a time. A call that fails with a transient error is retried on
+    its own up to the session's ``retries`` times.
+
     Parameters
     ----------
     uri : str
@@ -107,11 +145,15 @@ def range_handler(uri: str, options: list, api_key: str) -> list:
         Additional endpoint parameters (including start date and range)
     api_key : str
         REST API authentication token
+    session : HttpSession
+        Pooled HTTP session to send requests through, e.g. the session provided by the
+        application container. Default: a new session with the default configuration.
 
     Returns
     -------
     list:
-        Collection of data points returned from REST API
+        Collection of data points returned from REST API, from the most recent day. Days
+        without a data point in a chart range, e.g. market holidays, are omitted.
 
     Raises
     ------
@@ -119,6 +161,8 @@ def range_handler(uri: str, options: list, api_key: str) -> list:
         If uri or api_key are invalid
     KeyError:
         If given range is not supported
+    requests.HTTPError:
+        If a call still fails after being retried
     """
     if uri is None or uri.strip() == UtilityConstants.str_empty:
         raise ValueError('Invalid URI for feature')
@@ -126,36 +170,63 @@ def range_handler(uri: str, options: list, api_key: str) -> list:
     if api_key is None or api_key.strip() == UtilityConstants.str_empty:
         raise ValueError('Invalid API key provided')
 
-    start_date = dt.date.today()
-    date_range = '1d'
-    for option in options:
-        if option[SdasConstants.name_property] == 'exactDate':
-            start_date = dt.datetime.strptime(
-                option[SdasConstants.value_property],
-                '%Y%m%d')
-
-        if option[SdasConstants.name_property] == 'range':
-            date_range = option[SdasConstants.value_property]
-
-    range_val = calc_range(start_date, date_range)
-    data = []
-    for i in range(range_val):
-        t_date = start_date - dt.timedelta(days=i)
-        # Check if weekday is Saturday or Sunday (5 or 6 respectively) and skip data retrieval
-        if t_date.weekday() > 4:
-            continue
-
-        query = build_query(
-            [{
-                'name': 'exactDate',
-                'value': t_date.strftime('%Y%m%d')}],
-            api_key)
-        response = requests.get(uri + query)
-        response.raise_for_status()
-        point = response.json()
-        if SdasConstants.date_property not in point:
-            point[SdasConstants.date_property] = t_date.strftime('%Y-%m-%d')
-
-        data.append(point)
-
-    return data
+    # Skip data retrieval for weekends and market holidays
+    dates = get_range_dates(options)
+    if not dates:
+        return []
+
+    session = session or HttpSession()
+    points = dict()
+    remaining = dates
+    range_uri = plan_range_request(uri, dates, dt.date.today())
+    if range_uri is not None:
+        logging.info('Requesting %d days as a single range from "%s"', len(dates), range_uri)
+        response = __get(session, range_uri + build_query(get_query_options(options), api_key), range_uri)
+        points, remaining = slice_range_response(response.json(), dates)
+
+    if remaining:
+        max_workers = min(session.max_in_flight, len(remaining))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='range-handler') as executor:
+            points.update(zip(remaining, executor.map(
+                lambda t_date: __get_day(session, uri, t_date, get_query_options(options), api_key),
+                remaining)))
+
+    return [points[t_date] for t_date in dates if t_date in points]
+
+
+def __get_day(session: HttpSession, uri: str, t_date: dt.date, options: list, api_key: str) -> dict:
+    """Requests the data point for a single day."""
+    query = build_query(
+        options + [{
+            'name': 'exactDate',
+            'value': t_date.strftime('%Y%m%d')}],
+        api_key)
+    point = __get(session, uri + query, t_date.strftime('%Y-%m-%d')).json()
+    if SdasConstants.date_property not in point:
+        point[SdasConstants.date_property] = t_date.strftime('%Y-%m-%d')
+
+    return point
+
+
+def __get(session: HttpSession, url: str, description: str) -> requests.Response:
+    """Sends a GET request, retrying transient failures."""
+    for attempt in range(session.retries + 1):
+        try:
+            response = session.get(url)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as exc:
+            if attempt == session.retries or not __is_transient(exc):
+                raise
+
+            delay = session.retry_backoff * 2 ** attempt
+            logging.warning('Retrying request for %s in %.1fs: %s', description, delay, exc)
+            time.sleep(delay)
+
+
+def __is_transient(exc: requests.RequestException) -> bool:
+    """Returns whether a failed request may succeed if it is retried."""
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and is_transient_status(exc.response.status_code)
+
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
@@ -1,13 +1,11 @@
 import datetime as dt
 import logging
-import string
-
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+from typing import Iterator
 
 from pydas.constants import UtilityConstants
 from pydas.transformers import batch_handler
+from pydas.transformers.sessions import HttpSession
+from pydas.transformers.text import get_preprocessor
 
 
 # TODO: This currently is limited to only retrieving a single data point.
@@ -15,13 +13,14 @@ from pydas.transformers import batch_handler
 # different endpoint (or rather appending '/date/{date}?chartByDay=true')
 # We have the issue of needing to be able to build the URI before we call
 # this. Tracker: #145
-def news_handler(uri: str, options: list, api_key: str) -> list:
+def news_handler(uri: str, options: list, api_key: str, session: HttpSession = None) -> list:
     """
     IEX API call with batch support for news data
 
     This function provides additional pre-processing for news data. Some of
     the pre-processing available includes converting source datetime into
-    a valid date string and removes stopwords from the summary text.
+    a valid date string and removes stopwords from the summary text, using the
+    shared :class:`pydas.transformers.text.TextPreprocessor`.
 
     Parameters
     ----------
@@ -31,6 +30,9 @@ def news_handler(uri: str, options: list, api_key: str) -> list:
         Additional batch options (e.g. range).
     api_key : str
         IEX API token for authorized calls.
+    session : HttpSession
+        Pooled HTTP session to send the request through. Default: a new session
+        with the default configuration.
 
     Returns
     -------
@@ -50,16 +52,17 @@ def news_handler(uri: str, options: list, api_key: str) -> list:
         raise ValueError('Invalid API key provided')
 
     logging.info('Fetching raw data')
-    raw_data = batch_handler(uri, options, api_key)
-    for value in raw_data:
-        logging.info('Preprocessing raw data')
+    raw_data = batch_handler(uri, options, api_key, session)
+    if isinstance(raw_data, Iterator):
+        raw_data = list(raw_data)
+
+    logging.info('Preprocessing %d raw data points', len(raw_data))
+    # Preprocess summaries to remove stopwords, fanning large batches out across processes
+    summaries = get_preprocessor().preprocess_all([value['summary'] for value in raw_data])
+    for value, summary in zip(raw_data, summaries):
         # Preprocess date into the standardized form YYYY-MM-DD
-        date = value['date']
-        value['date'] = _preprocess_datetime(date)
-
-        # Proprocess summary to remove stopwords
-        summary = value['summary']
-        value['summary'] = _preprocess_text(summary)
+        value['date'] = _preprocess_datetime(value['date'])
+        value['summary'] = summary
 
     logging.info('Returning preprocessed data')
     return raw_data
@@ -68,21 +71,3 @@ def news_handler(uri: str, options: list, api_key: str) -> list:
 def _preprocess_datetime(timestamp: int) -> str:
     date = dt.datetime.fromtimestamp(timestamp / 1000)
     return date.strftime('%Y-%m-%d')
-
-
-def _preprocess_text(text: str):
-    _nltk_require('tokenizers', 'punkt')
-    _nltk_require('corpora', 'stopwords')
-
-    translate_table = dict((ord(char), None) for char in string.punctuation)
-    text_tokens = word_tokenize(text.translate(translate_table))
-
-    no_sw = [word for word in text_tokens if not word in stopwords.words()]
-    return (" ").join(no_sw)
-
-
-def _nltk_require(path: str, package: str):
-    try:
-        nltk.data.find('/'.join([path, package]))
-    except LookupError:
-        nltk.download(package)
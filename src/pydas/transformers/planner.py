@@ -0,0 +1,94 @@
+"""
+Request planner that collapses the per-day requests of range handlers into chart range requests.
+
+IEX chart endpoints, e.g. ``/stock/{symbol}/chart`` or ``/stocks/{symbol}/chart``, return every trading day within a range,
+e.g. ``/stock/{symbol}/chart/1y``, in a single request. Rather than requesting each day of a
+range with an ``exactDate`` option, :func:`pydas.transformers.range_handler` requests the
+smallest chart range covering the days and slices the response back into per-day data points.
+"""
+import datetime as dt
+import re
+from typing import Dict, List, Optional, Tuple
+
+from pydas.constants import SdasConstants
+from pydas.transformers.trading_calendar import get_calendar
+
+# Chart ranges supported by chart endpoints, from smallest to largest.
+CHART_RANGES = ('5d', '1m', '3m', '6m', '1y', '2y', '5y')
+
+# Maximum ratio of calendar days returned by a chart range request to calendar days requested.
+# Requesting the days one at a time is cheaper than requesting a much larger range.
+MAX_OVERFETCH = 4
+
+_CHART_URI = re.compile(r'^(?P<base>.+/stocks?/[^/?]+/chart)(/date)?/?$')
+
+
+def plan_range_request(uri: str, dates: List[dt.date], today: dt.date) -> Optional[str]:
+    """
+    Returns the URI of the chart range request covering the given days, or ``None`` if the
+    days should be requested one at a time.
+
+    Parameters
+    ----------
+    uri: str
+        URI that the days would be requested from one at a time.
+
+    dates: list[:class:`datetime.date`]
+        Days to request.
+
+    today: :class:`datetime.date`
+        Day that chart ranges end on.
+
+    Returns
+    -------
+    str:
+        Chart range request URI, e.g. ``https://cloud.iexapis.com/v1/stock/gme/chart/1m``.
+    """
+    match = _CHART_URI.match(uri)
+    if match is None or not dates or max(dates) > today:
+        return None
+
+    calendar = get_calendar()
+    requested_days = (max(dates) - min(dates)).days + 1
+    for chart_range in CHART_RANGES:
+        start = calendar.get_range_start(today, chart_range)
+        if start <= min(dates):
+            if (today - start).days + 1 > requested_days * MAX_OVERFETCH:
+                return None
+
+            return f"{match.group('base')}/{chart_range}"
+
+    return None
+
+
+def slice_range_response(points: list,
+                         dates: List[dt.date]) -> Tuple[Dict[dt.date, dict], List[dt.date]]:
+    """
+    Slices a chart range response into the data points of the given days.
+
+    Parameters
+    ----------
+    points: list[dict]
+        Data points returned by a chart range request.
+
+    dates: list[:class:`datetime.date`]
+        Days that the chart range was requested for.
+
+    Returns
+    -------
+    tuple[dict[:class:`datetime.date`, dict], list[:class:`datetime.date`]]:
+        Data points keyed by day, and the days before the start of the response that still
+        need to be requested one at a time. Days within the response without a data point,
+        such as market holidays, are omitted from both.
+    """
+    requested = set(dates)
+    sliced = dict()
+    first_date = None
+    for point in points:
+        date = dt.date.fromisoformat(point[SdasConstants.date_property][:10])
+        first_date = date if first_date is None else min(first_date, date)
+        if date in requested:
+            sliced[date] = point
+
+    uncovered = [date for date in dates if first_date is None or date < first_date]
+    return sliced, uncovered
@@ -0,0 +1,237 @@
+"""
+Pooled HTTP session shared by the handler functions that request data from REST APIs.
+
+The application container provides a single session, opened with :func:`open_session`, which
+the data clients pass to the handler functions they call.
+"""
+import logging
+from threading import Lock
+from typing import Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _CountingAdapter(HTTPAdapter):
+    """Transport adapter that counts the connections opened by its connection pools."""
+
+    def __init__(self, **kwargs):
+        self.connections = 0
+        self._lock = Lock()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._counting_pool(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()}
+
+    def _counting_pool(self, pool_class):
+        adapter = self
+
+        class CountingConnectionPool(pool_class):
+            def _new_conn(self):
+                with adapter._lock:  # pylint: disable=protected-access
+                    adapter.connections += 1
+
+                return super()._new_conn()
+
+        return CountingConnectionPool
+
+
+class HttpSession:
+    """
+    Keep-alive HTTP session with a bounded pool of connections per host.
+
+    Connections are reused across requests, and across the worker threads that acquire
+    features concurrently, so only the first request to a host pays for the TCP and TLS
+    handshakes. Responses are requested with gzip encoding.
+
+    Attributes
+    ----------
+    pool_size: int
+        Maximum number of connections kept open per host. Requests made while every connection
+        is in use wait for a connection to be released.
+
+    timeout: float
+        Seconds to wait for a server to connect or respond before the request fails.
+
+    max_in_flight: int
+        Maximum number of requests a handler should make concurrently for a single feature.
+        Default: :attr:`pool_size`.
+
+    retries: int
+        Number of times a handler should retry a request that failed with a transient error.
+
+    retry_backoff: float
+        Seconds to wait before the first retry of a request, doubling with each retry.
+
+    stream_json: bool
+        Flag indicating whether handlers should parse JSON array responses incrementally, as
+        their bytes arrive, rather than reading the whole response first. Default: ``False``.
+
+    chunk_size: int
+        Number of bytes read at a time from responses that are parsed incrementally.
+
+    requests: int
+        Number of requests made through the session.
+    """
+
+    def __init__(self,
+                 pool_size: int = None,
+                 timeout: float = None,
+                 max_retries: int = 0,
+                 max_in_flight: int = None,
+                 retries: int = None,
+                 retry_backoff: float = None,
+                 stream_json: bool = False,
+                 chunk_size: int = None):
+        self.pool_size = pool_size or DEFAULT_POOL_SIZE
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.max_in_flight = max_in_flight or self.pool_size
+        self.retries = retries if retries is not None else DEFAULT_RETRIES
+        self.retry_backoff = retry_backoff if retry_backoff is not None else DEFAULT_RETRY_BACKOFF
+        self.stream_json = bool(stream_json)
+        self.chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        self.requests = 0
+        self._adapter = _CountingAdapter(pool_connections=self.pool_size,
+                                         pool_maxsize=self.pool_size,
+                                         max_retries=max_retries,
+                                         pool_block=True)
+        self._session = requests.Session()
+        self._session.mount('https://', self._adapter)
+        self._session.mount('http://', self._adapter)
+        self._session.headers.update({'Accept-Encoding': 'gzip, deflate',
+                                      'Connection': 'keep-alive'})
+        self._lock = Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request through the session.
+
+        Parameters
+        ----------
+        url: str
+            URL to request.
+
+        kwargs: dict
+            Additional arguments for :meth:`requests.Session.get`. The session's
+            :attr:`timeout` is used unless a timeout is given.
+
+        Returns
+        -------
+        :class:`requests.Response`:
+            Response returned by the server.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        response = self._session.get(url, **kwargs)
+        with self._lock:
+            self.requests += 1
+            requests_made = self.requests
+
+        logging.debug('%s response from %s (%d connections opened for %d requests)',
+                      response.status_code,
+                      url.split('?')[0],
+                      self._adapter.connections,
+                      requests_made)
+        return response
+
+    @property
+    def connections(self) -> int:
+        """Returns the number of connections opened by the session."""
+        return self._adapter.connections
+
+    def get_statistics(self) -> dict:
+        """Returns the number of requests made and how many of them reused a connection."""
+        with self._lock:
+            requests_made = self.requests
+
+        reused = max(requests_made - self.connections, 0)
+        return {
+            "pool_size": self.pool_size,
+            "requests": requests_made,
+            "connections": self.connections,
+            "reused": reused,
+            "reuse_ratio": reused / requests_made if requests_made else 0.0
+        }
+
+    def close(self):
+        """Closes every pooled connection."""
+        logging.info('Closing HTTP session after %d requests over %d connections',
+                     self.requests, self.connections)
+        self._session.close()
+
+
+def is_transient_status(status_code: int) -> bool:
+    """
+    Returns whether a request that failed with the given HTTP status code may succeed if it
+    is retried, i.e. if it was rate limited or failed with a server error.
+    """
+    return status_code == 429 or status_code >= 500
+
+
+def open_session(pool_size: int = None,
+                 timeout: float = None,
+                 max_retries: int = None,
+                 max_in_flight: int = None,
+                 retries: int = None,
+                 retry_backoff: float = None,
+                 stream_json: bool = None,
+                 chunk_size: int = None) -> Iterator[HttpSession]:
+    """
+    Opens the HTTP session that the application container provides to the data clients,
+    closing it when the container's resources are shut down.
+
+    Parameters
+    ----------
+    pool_size: int
+        Maximum number of connections kept open per host. Default: ``10``.
+
+    timeout: float
+        Seconds to wait for a server to connect or respond. Default: ``30``.
+
+    max_retries: int
+        Number of times a failed connection is retried. Default: ``0``.
+
+    max_in_flight: int
+        Maximum number of requests a handler makes concurrently for a single feature.
+        Default: the pool size.
+
+    retries: int
+        Number of times a handler retries a request that failed with a transient error.
+        Default: ``2``.
+
+    retry_backoff: float
+        Seconds to wait before the first retry, doubling with each retry. Default: ``0.5``.
+
+    stream_json: bool
+        Flag indicating whether JSON array responses are parsed incrementally.
+        Default: ``False``.
+
+    chunk_size: int
+        Number of bytes read at a time from responses that are parsed incrementally.
+        Default: ``65536``.
+
+    Returns
+    -------
+    Iterator[:class:`pydas.transformers.sessions.HttpSession`]:
+        Generator yielding the HTTP session, which is closed once the generator resumes.
+    """
+    session = HttpSession(pool_size,
+                          timeout,
+                          max_retries or 0,
+                          max_in_flight,
+                          retries,
+                          retry_backoff,
+                          stream_json or False,
+                          chunk_size)
+    try:
+        yield session
+    finally:
+        session.close()
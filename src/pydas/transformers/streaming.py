@@ -0,0 +1,145 @@
+"""
+Incremental JSON parsing of HTTP responses, so that large array responses, e.g. a ``max``
+chart, are parsed into records as their bytes arrive rather than held as raw text and a
+full object graph at the same time.
+"""
+import codecs
+from itertools import chain
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+import requests
+
+from pydas.transformers.sessions import DEFAULT_CHUNK_SIZE
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Parses a UTF-8 encoded JSON array incrementally, yielding each of its elements as soon as
+    the bytes of the element have been received.
+
+    Parameters
+    ----------
+    chunks: Iterable[bytes]
+        Chunks of the encoded array, in the order they were received.
+
+    Returns
+    -------
+    Iterator[Any]:
+        Generator of the decoded elements of the array.
+
+    Raises
+    ------
+    ValueError:
+        If the chunks aren't a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    parser = _ArrayParser(decoder)
+    for chunk in chunks:
+        yield from parser.feed(text_decoder.decode(chunk))
+
+    yield from parser.feed(text_decoder.decode(b'', final=True), final=True)
+
+
+def parse_response(response: requests.Response, chunk_size: int = None) -> Any:
+    """
+    Parses the JSON body of a response requested with ``stream=True``.
+
+    Array bodies are returned as a generator of their elements, which are parsed as the
+    body is received, and the response is closed once the generator is exhausted. Any other
+    body is read in full and returned as its decoded value.
+
+    Parameters
+    ----------
+    response: :class:`requests.Response`
+        Streamed response to parse.
+
+    chunk_size: int
+        Number of bytes read from the response at a time. Default: ``65536``.
+
+    Returns
+    -------
+    Any:
+        Generator of the elements of an array body, or the decoded body.
+    """
+    chunks = response.iter_content(chunk_size or DEFAULT_CHUNK_SIZE)
+    first = b''
+    for chunk in chunks:
+        first += chunk
+        if first.strip():
+            break
+
+    if first.lstrip()[:1] == b'[':
+        return _iter_response(response, chain([first], chunks))
+
+    try:
+        return json.loads(first + b''.join(chunks))
+    finally:
+        response.close()
+
+
+def _iter_response(response: requests.Response, chunks: Iterator[bytes]) -> Iterator[Any]:
+    try:
+        yield from iter_json_array(chunks)
+    finally:
+        response.close()
+
+
+class _ArrayParser:
+    """Parser state of an array whose text is fed in pieces."""
+
+    def __init__(self, decoder: json.JSONDecoder):
+        self._decoder = decoder
+        self._buffer = ''
+        self._state = 'start'
+
+    def feed(self, text: str, final: bool = False) -> Iterator[Any]:
+        buffer = self._buffer + text
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+
+            if self._state == 'done':
+                raise ValueError(f'Extra data after JSON array at position {pos}')
+
+            char = buffer[pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise ValueError('Expected a JSON array')
+
+                self._state = 'first'
+                pos += 1
+            elif self._state == 'separator':
+                if char not in ',]':
+                    raise ValueError(f'Expected "," or "]" in JSON array, found "{char}"')
+
+                self._state = 'element' if char == ',' else 'done'
+                pos += 1
+            elif self._state == 'first' and char == ']':
+                self._state = 'done'
+                pos += 1
+            else:
+                try:
+                    element, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+
+                # A number at the end of the text may continue in the next piece
+                if end == len(buffer) and not final:
+                    break
+
+                self._state = 'separator'
+                pos = end
+                yield element
+
+        self._buffer = buffer[pos:]
+        if final and self._state != 'done':
+            raise ValueError('Incomplete JSON array')
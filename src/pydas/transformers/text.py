@@ -0,0 +1,192 @@
+"""
+Text preprocessing engine used by handlers that acquire free text, e.g. news summaries.
+
+Preprocessing removes punctuation and stopwords from a text. The stopwords are loaded once
+into a set, and the tokenizer and punctuation translation table are only built once, so each
+text is preprocessed in a single pass over its tokens. Large batches of texts are fanned out
+across a pool of worker processes.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import string
+from threading import Lock
+from typing import FrozenSet, Iterable, List
+
+import nltk
+from nltk.tokenize import NLTKWordTokenizer
+
+DEFAULT_MIN_BATCH_SIZE = 64
+
+# NLTK data required by the preprocessor, as (path, package) pairs.
+REQUIRED_CORPORA = (('corpora', 'stopwords'),)
+
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_tokenizer = NLTKWordTokenizer()
+
+
+def require_corpora():
+    """Downloads the NLTK data required by the preprocessor if it isn't installed."""
+    for path, package in REQUIRED_CORPORA:
+        try:
+            nltk.data.find('/'.join([path, package]))
+        except LookupError:
+            logging.info('Downloading NLTK package "%s"', package)
+            nltk.download(package, quiet=True)
+
+
+def load_stopwords() -> FrozenSet[str]:
+    """Returns the stopwords of every language in the NLTK stopwords corpus."""
+    require_corpora()
+    # Imported here, as the corpus reader is only usable once the corpus is installed
+    from nltk.corpus import stopwords  # pylint: disable=import-outside-toplevel
+    return frozenset(stopwords.words())
+
+
+class TextPreprocessor:
+    """
+    Removes punctuation and stopwords from texts.
+
+    Attributes
+    ----------
+    processes: int
+        Number of worker processes that large batches of texts are preprocessed with. Batches
+        are preprocessed in the calling thread if this is ``0`` or ``1``. Default: ``0``.
+
+    min_batch_size: int
+        Number of texts a batch must contain to be fanned out across the worker processes.
+    """
+
+    def __init__(self,
+                 stopwords: Iterable[str] = None,
+                 processes: int = None,
+                 min_batch_size: int = None):
+        self.processes = processes or 0
+        self.min_batch_size = min_batch_size or DEFAULT_MIN_BATCH_SIZE
+        self._stopwords = frozenset(stopwords) if stopwords is not None else None
+        self._executor: ProcessPoolExecutor = None
+        self._lock = Lock()
+
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        """Stopwords removed from texts, which are loaded from NLTK when first used."""
+        if self._stopwords is None:
+            with self._lock:
+                if self._stopwords is None:
+                    self._stopwords = load_stopwords()
+
+        return self._stopwords
+
+    def preprocess(self, text: str) -> str:
+        """Returns a text without its punctuation and stopwords."""
+        return _preprocess(text, self.stopwords)
+
+    def preprocess_all(self, texts: List[str]) -> List[str]:
+        """
+        Preprocesses a batch of texts, fanning them out across the worker processes if the
+        batch contains at least :attr:`min_batch_size` texts.
+
+        Parameters
+        ----------
+        texts: list[str]
+            Texts to preprocess.
+
+        Returns
+        -------
+        list[str]:
+            Preprocessed texts in the same order as the given texts.
+        """
+        stopwords = self.stopwords
+        if self.processes <= 1 or len(texts) < self.min_batch_size:
+            return [_preprocess(text, stopwords) for text in texts]
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                                     initializer=_initialize_worker,
+                                                     initargs=(stopwords,))
+            executor = self._executor
+
+        chunksize = max(1, len(texts) // (self.processes * 4))
+        return list(executor.map(_preprocess_in_worker, texts, chunksize=chunksize))
+
+    def close(self):
+        """Shuts down the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown()
+
+
+def _preprocess(text: str, stopwords: FrozenSet[str]) -> str:
+    tokens = _tokenizer.tokenize(text.translate(_PUNCTUATION_TABLE))
+    return (" ").join(token for token in tokens if token not in stopwords)
+
+
+_worker_stopwords: FrozenSet[str] = frozenset()
+
+
+def _initialize_worker(stopwords: FrozenSet[str]):
+    global _worker_stopwords  # pylint: disable=global-statement
+    _worker_stopwords = stopwords
+
+
+def _preprocess_in_worker(text: str) -> str:
+    return _preprocess(text, _worker_stopwords)
+
+
+_preprocessor: TextPreprocessor = None
+_preprocessor_lock = Lock()
+
+
+def get_preprocessor() -> TextPreprocessor:
+    """
+    Returns the text preprocessor shared by the handler functions, creating a preprocessor with
+    the default configuration if :func:`configure_preprocessor` hasn't been called.
+    """
+    global _preprocessor  # pylint: disable=global-statement
+    with _preprocessor_lock:
+        if _preprocessor is None:
+            _preprocessor = TextPreprocessor()
+
+        return _preprocessor
+
+
+def configure_preprocessor(processes: int = None,
+                           min_batch_size: int = None,
+                           preload: bool = False):
+    """
+    Replaces the text preprocessor shared by the handler functions, closing the previous
+    preprocessor.
+
+    Parameters
+    ----------
+    processes: int
+        Number of worker processes that large batches of texts are preprocessed with.
+        Default: ``0``.
+
+    min_batch_size: int
+        Number of texts a batch must contain to be fanned out across the worker processes.
+        Default: ``64``.
+
+    preload: bool
+        Flag indicating whether the required NLTK data is verified, and the stopwords loaded,
+        immediately rather than when the first text is preprocessed. Default: ``False``.
+
+    Returns
+    -------
+    :class:`pydas.transformers.text.TextPreprocessor`:
+        The shared text preprocessor.
+    """
+    global _preprocessor  # pylint: disable=global-statement
+    preprocessor = TextPreprocessor(processes=processes, min_batch_size=min_batch_size)
+    if preload:
+        logging.info('Loaded %d stopwords', len(preprocessor.stopwords))
+
+    with _preprocessor_lock:
+        previous, _preprocessor = _preprocessor, preprocessor
+
+    if previous is not None:
+        previous.close()
+
+    return preprocessor
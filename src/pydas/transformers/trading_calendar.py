@@ -0,0 +1,229 @@
+"""
+Exchange trading calendar used to determine the trading days within a range.
+
+The trading days of each year are computed once, from the New York Stock Exchange's holiday
+rules and its unscheduled closures, and cached as a sorted sequence of dates. Ranges are then
+resolved with binary searches over those sequences, so no request is ever made for a weekend
+or market holiday.
+
+Range specifiers follow those of IEX Cloud's chart ranges:
+
+* ``Nd``: the last ``N`` trading days, e.g. ``5d``, up to the ``max`` range.
+* ``Nm``: the last ``N`` calendar months, e.g. ``1m``, ``3m`` or ``6m``.
+* ``Ny``: the last ``N`` calendar years, e.g. ``1y``, ``2y`` or ``5y``.
+* ``ytd``: from the first day of the year.
+* ``max``: the last 15 years.
+"""
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+import datetime as dt
+import re
+from threading import Lock
+from typing import Dict, FrozenSet, List, Tuple
+
+# Number of years covered by the max range.
+MAX_YEARS = 15
+
+# Full-day closures of the New York Stock Exchange that aren't regular holidays.
+SPECIAL_CLOSURES = frozenset([
+    dt.date(2001, 9, 11),
+    dt.date(2001, 9, 12),
+    dt.date(2001, 9, 13),
+    dt.date(2001, 9, 14),
+    dt.date(2004, 6, 11),
+    dt.date(2007, 1, 2),
+    dt.date(2012, 10, 29),
+    dt.date(2012, 10, 30),
+    dt.date(2018, 12, 5),
+    dt.date(2025, 1, 9)
+])
+
+_RANGE = re.compile(r'^(?P<count>[1-9]\d*)(?P<unit>[dmy])$')
+
+
+class TradingCalendar:
+    """
+    Trading calendar of the New York Stock Exchange.
+
+    Attributes
+    ----------
+    special_closures: frozenset[:class:`datetime.date`]
+        Days the exchange closed on that aren't regular holidays.
+    """
+
+    def __init__(self, special_closures: FrozenSet[dt.date] = SPECIAL_CLOSURES):
+        self.special_closures = special_closures
+        self._years: Dict[int, Tuple[dt.date, ...]] = dict()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_holidays(year: int) -> List[dt.date]:
+        """Returns the regular holidays that the exchange is closed on in the given year."""
+        holidays = [
+            _nth_weekday(year, 2, 0, 3),                    # Washington's Birthday
+            _easter(year) - dt.timedelta(days=2),           # Good Friday
+            _nth_weekday(year, 5, 0, -1),                   # Memorial Day
+            _observed(dt.date(year, 7, 4)),                 # Independence Day
+            _nth_weekday(year, 9, 0, 1),                    # Labor Day
+            _nth_weekday(year, 11, 3, 4),                   # Thanksgiving Day
+            _observed(dt.date(year, 12, 25))                # Christmas Day
+        ]
+
+        # New Year's Day isn't observed on the preceding Friday when it falls on a Saturday
+        new_year = dt.date(year, 1, 1)
+        if new_year.weekday() != 5:
+            holidays.append(_observed(new_year))
+
+        if year >= 1998:
+            holidays.append(_nth_weekday(year, 1, 0, 3))    # Martin Luther King, Jr. Day
+
+        if year >= 2022:
+            holidays.append(_observed(dt.date(year, 6, 19)))  # Juneteenth
+
+        return sorted(holidays)
+
+    def get_trading_days(self, year: int) -> Tuple[dt.date, ...]:
+        """Returns the trading days of the given year in date order."""
+        days = self._years.get(year)
+        if days is not None:
+            return days
+
+        closed = set(self.get_holidays(year)) | self.special_closures
+        start = dt.date(year, 1, 1)
+        days = tuple(day for day in (start + dt.timedelta(days=i)
+                                     for i in range((dt.date(year + 1, 1, 1) - start).days))
+                     if day.weekday() < 5 and day not in closed)
+        with self._lock:
+            return self._years.setdefault(year, days)
+
+    def is_trading_day(self, date: dt.date) -> bool:
+        """Returns a flag indicating whether the exchange is open on the given day."""
+        days = self.get_trading_days(date.year)
+        index = bisect_left(days, date)
+        return index < len(days) and days[index] == date
+
+    def get_days(self, start: dt.date, end: dt.date) -> List[dt.date]:
+        """Returns the trading days from the start to the end day, inclusive, in date order."""
+        days = []
+        for year in range(start.year, end.year + 1):
+            year_days = self.get_trading_days(year)
+            days.extend(year_days[bisect_left(year_days, start):bisect_right(year_days, end)])
+
+        return days
+
+    def get_range_start(self, end: dt.date, date_range: str) -> dt.date:
+        """
+        Returns the first calendar day of a range ending on the given day.
+
+        Parameters
+        ----------
+        end: :class:`datetime.date`
+            Last day of the range.
+
+        date_range: str
+            Range specifier, e.g. ``5d``, ``3m``, ``ytd`` or ``max``.
+
+        Returns
+        -------
+        :class:`datetime.date`:
+            First day of the range. For trading day ranges this is the earliest trading day
+            in the range, found with a binary search of each year's trading days, otherwise
+            it may be a non-trading day. Trading day ranges longer than the ``max`` range
+            are capped at the ``max`` range.
+
+        Raises
+        ------
+        KeyError:
+            If the range specifier isn't supported.
+        """
+        if date_range == 'ytd':
+            return dt.date(end.year, 1, 1)
+
+        if date_range == 'max':
+            return _shift_months(end, -12 * MAX_YEARS) + dt.timedelta(days=1)
+
+        match = _RANGE.match(date_range or '')
+        if match is None:
+            raise KeyError(f'Unable to determine range for "{date_range}"')
+
+        count = int(match.group('count'))
+        unit = match.group('unit')
+        if unit == 'm':
+            return _shift_months(end, -count) + dt.timedelta(days=1)
+
+        if unit == 'y':
+            return _shift_months(end, -12 * count) + dt.timedelta(days=1)
+
+        earliest = self.get_range_start(end, 'max')
+        year = end.year
+        days = self.get_trading_days(year)
+        remaining = count - bisect_right(days, end)
+        while remaining > 0 and year > earliest.year:
+            year -= 1
+            days = self.get_trading_days(year)
+            remaining -= len(days)
+
+        if remaining > 0 or days[-remaining] < earliest:
+            return self.get_days(earliest, end)[0]
+
+        return days[-remaining]
+
+    def get_range_days(self, end: dt.date, date_range: str) -> List[dt.date]:
+        """
+        Returns the trading days within a range ending on the given day, from the most recent.
+
+        See :meth:`get_range_start` for a description of the parameters.
+        """
+        days = self.get_days(self.get_range_start(end, date_range), end)
+        days.reverse()
+        return days
+
+
+_calendar = TradingCalendar()
+
+
+def get_calendar() -> TradingCalendar:
+    """Returns the trading calendar shared by the handler functions."""
+    return _calendar
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> dt.date:
+    """Returns the nth given weekday of a month, or the last one if n is -1."""
+    if n < 0:
+        last = dt.date(year, month, monthrange(year, month)[1])
+        return last - dt.timedelta(days=(last.weekday() - weekday) % 7)
+
+    first = dt.date(year, month, 1)
+    return first + dt.timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _observed(holiday: dt.date) -> dt.date:
+    """Moves a holiday on a Saturday to the Friday before, and on a Sunday to the Monday after."""
+    if holiday.weekday() == 5:
+        return holiday - dt.timedelta(days=1)
+
+    if holiday.weekday() == 6:
+        return holiday + dt.timedelta(days=1)
+
+    return holiday
+
+
+def _easter(year: int) -> dt.date:
+    """Returns Easter Sunday of the given year, using the anonymous Gregorian algorithm."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    w = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * w) // 451
+    month, day = divmod(h + w - 7 * m + 114, 31)
+    return dt.date(year, month, day + 1)
+
+
+def _shift_months(date: dt.date, months: int) -> dt.date:
+    """Shifts a date by a number of months, clamping the day to the length of the month."""
+    year, month = divmod(date.year * 12 + date.month - 1 + months, 12)
+    return dt.date(year, month + 1, min(date.day, monthrange(year, month + 1)[1]))
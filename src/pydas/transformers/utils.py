@@ -3,8 +3,8 @@ This module provides commonly used functions across the ``pydas.handlers`` modul
 """
 
 import datetime as dt
-from calendar import monthrange
 from pydas.constants import SdasConstants
+from pydas.transformers.trading_calendar import get_calendar
 
 
 def build_query(options: list, key: str) -> str:
@@ -36,34 +36,79 @@ def build_query(options: list, key: str) -> str:
     return query + f'token={key}'
 
 
+def get_query_options(options: list) -> list:
+    """
+    Returns the options of a range handler's feature that are passed through to each request,
+    i.e. every option except the ``exactDate`` and ``range`` options that determine the days
+    requested, e.g. ``chartCloseOnly``.
+    """
+    return [option for option in options
+            if option[SdasConstants.name_property] not in ('exactDate', 'range')]
+
+
 def calc_range(start: dt.date, date_range: str):
     """
-    Given a date range and starting date, returns the number of days within
-    the range. This is useful for IEX range handlers that need to call the
-    API for each given day to acquire a range of data points.
+    Given a date range and starting date, returns the number of calendar days
+    within the range, including any weekends and market holidays. The range is
+    resolved with the shared :class:`pydas.transformers.trading_calendar.TradingCalendar`,
+    so day ranges such as ``5d`` count trading days.
 
     Parameters
     ----------
-    start: :class:`datetime.datetime`
-        Starting date for calculating the range of days.
+    start: :class:`datetime.date`
+        Starting date for calculating the range of days, i.e. the last day of
+        the range.
 
     date_range: str
-        Range specifier for size of range to calculate.
+        Range specifier for size of range to calculate, e.g. ``5d``, ``1m``,
+        ``6m``, ``ytd``, ``2y`` or ``max``.
 
     Returns
     -------
     int:
         Number of days within the specified range.
+
+    Raises
+    ------
+    KeyError:
+        If the range specifier isn't supported.
     """
-    # TODO: Determine all values needed to be supported and how to calculate multi-month values
-    range_map = {
-        "1d": 1,
-        "1m": monthrange(start.year, start.month)[1],
-        "3m": 90,
-        "1y": 365
-    }
-
-    if date_range in range_map:
-        return range_map[date_range]
-
-    raise KeyError(f'Unable to determine range for "{date_range}"')
+    if isinstance(start, dt.datetime):
+        start = start.date()
+
+    return (start - get_calendar().get_range_start(start, date_range)).days + 1
+
+
+def get_range_dates(options: list) -> list:
+    """
+    Returns the trading days requested by a range handler's ``exactDate`` and ``range``
+    options, skipping weekends and market holidays.
+
+    Parameters
+    ----------
+    options: list
+        Collection of :class:`metadata.models.Option` objects. The range ends on the
+        ``exactDate`` option, or today, and spans the ``range`` option, or ``1d``.
+
+    Returns
+    -------
+    list[:class:`datetime.date`]:
+        Trading days in the range, from the most recent.
+
+    Raises
+    ------
+    KeyError:
+        If the range specifier isn't supported.
+    """
+    start_date = dt.date.today()
+    date_range = '1d'
+    for option in options:
+        if option[SdasConstants.name_property] == 'exactDate':
+            start_date = dt.datetime.strptime(
+                option[SdasConstants.value_property],
+                '%Y%m%d').date()
+
+        if option[SdasConstants.name_property] == 'range':
+            date_range = option[SdasConstants.value_property]
+
+    return get_calendar().get_range_days(start_date, date_range)
@@ -0,0 +1,56 @@
+# pylint: disable=no-member,invalid-name,line-too-long,trailing-whitespace
+"""Add AcquisitionJobBASE
+
+Revision ID: 3f8b1c2d9e47
+Revises: da13020a988c
+Create Date: 2026-10-18 09:12:37.418205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8b1c2d9e47'
+down_revision = 'da13020a988c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('AcquisitionJobBASE',
+                    sa.Column('JobID',
+                              sa.String(36),
+                              primary_key=True),
+                    sa.Column('EntityIdentifiersTXT',
+                              sa.Text,
+                              nullable=False),
+                    sa.Column('JobStatusCD',
+                              sa.String(15),
+                              nullable=False),
+                    sa.Column('FeaturesDoneCNT',
+                              sa.Integer,
+                              nullable=False,
+                              default=0),
+                    sa.Column('FeaturesTotalCNT',
+                              sa.Integer,
+                              nullable=False,
+                              default=0),
+                    sa.Column('ResultPathTXT',
+                              sa.String(255),
+                              nullable=True),
+                    sa.Column('MessageTXT',
+                              sa.String(255),
+                              nullable=True),
+                    sa.Column('CreatedDTS',
+                              sa.DateTime,
+                              nullable=False,
+                              server_default=sa.func.now()),
+                    sa.Column('UpdatedDTS',
+                              sa.DateTime,
+                              nullable=False,
+                              server_default=sa.func.now()))
+
+
+def downgrade():
+    op.drop_table('AcquisitionJobBASE')
@@ -0,0 +1,26 @@
+# pylint: disable=no-member,invalid-name,line-too-long,trailing-whitespace
+"""Add FirstDT column to AcquisitionWatermarkBASE
+
+Revision ID: 5e1d7c9a2f36
+Revises: 8c4e2a7b5d10
+Create Date: 2026-10-18 21:12:37.418503
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1d7c9a2f36'
+down_revision = '8c4e2a7b5d10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('AcquisitionWatermarkBASE',
+                  sa.Column('FirstDT', sa.Date, nullable=True))
+
+
+def downgrade():
+    op.drop_column('AcquisitionWatermarkBASE', 'FirstDT')
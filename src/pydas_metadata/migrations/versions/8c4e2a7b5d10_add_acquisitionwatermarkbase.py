@@ -0,0 +1,41 @@
+# pylint: disable=no-member,invalid-name,line-too-long,trailing-whitespace
+"""Add AcquisitionWatermarkBASE
+
+Revision ID: 8c4e2a7b5d10
+Revises: 3f8b1c2d9e47
+Create Date: 2026-10-18 11:04:52.731946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e2a7b5d10'
+down_revision = '3f8b1c2d9e47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('AcquisitionWatermarkBASE',
+                    sa.Column('EntityID',
+                              sa.String(50),
+                              primary_key=True),
+                    sa.Column('FeatureName',
+                              sa.String(50),
+                              primary_key=True),
+                    sa.Column('OptionsHashTXT',
+                              sa.String(40),
+                              primary_key=True),
+                    sa.Column('LastDT',
+                              sa.Date,
+                              nullable=False),
+                    sa.Column('UpdatedDTS',
+                              sa.DateTime,
+                              nullable=False,
+                              server_default=sa.func.now()))
+
+
+def downgrade():
+    op.drop_table('AcquisitionWatermarkBASE')
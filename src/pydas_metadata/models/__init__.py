@@ -1,5 +1,7 @@
 '''Database models defined for ORM usage in the pydas application domain.'''
 
+from .acquisition_job import AcquisitionJob, JobStatus
+from .acquisition_watermark import AcquisitionWatermark
 from .archive import Archive
 from .base import Base
 from .entity import Entity
@@ -0,0 +1,106 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+
+from pydas_metadata.models.base import Base
+
+
+class JobStatus(Enum):
+    """
+    Lifecycle states of an :class:`pydas_metadata.models.AcquisitionJob`.
+
+    Attributes
+    ----------
+    PENDING: 1
+        The job has been submitted and is waiting for a worker.
+
+    RUNNING: 2
+        The job is being executed by a worker.
+
+    COMPLETED: 3
+        The job finished and its dataset is available for download.
+
+    FAILED: 4
+        The job could not be completed.
+    """
+    PENDING = 1
+    RUNNING = 2
+    COMPLETED = 3
+    FAILED = 4
+
+
+class AcquisitionJob(Base):
+    """
+    Persisted state of an acquisition that is executed in the background.
+
+    Attributes
+    ----------
+    id: str
+        Unique identifier for the job.
+
+    entity_identifiers: str
+        Comma-delimited list of the entity identifiers the job acquires data for.
+
+    status: str
+        Name of the :class:`pydas_metadata.models.JobStatus` the job is in.
+
+    features_done: int
+        Number of features that have been acquired so far.
+
+    features_total: int
+        Total number of features the job will acquire. This is ``0`` until the job has started.
+
+    result_path: str
+        Local filepath of the acquired dataset once the job has completed.
+
+    message: str
+        Details about why the job failed, if it failed.
+
+    date_created: datetime
+        Date and time the job was submitted.
+
+    date_updated: datetime
+        Date and time the job was last updated.
+    """
+    __tablename__ = 'AcquisitionJobBASE'
+
+    id: str = Column('JobID', String(36), primary_key=True)
+    entity_identifiers: str = Column('EntityIdentifiersTXT', Text, nullable=False)
+    status: str = Column('JobStatusCD', String(15), nullable=False,
+                         default=JobStatus.PENDING.name)
+    features_done: int = Column('FeaturesDoneCNT', Integer, nullable=False, default=0)
+    features_total: int = Column('FeaturesTotalCNT', Integer, nullable=False, default=0)
+    result_path: str = Column('ResultPathTXT', String(255), nullable=True)
+    message: str = Column('MessageTXT', String(255), nullable=True)
+    date_created: datetime = Column(
+        'CreatedDTS', DateTime, default=func.now(), nullable=False)
+    date_updated: datetime = Column(
+        'UpdatedDTS', DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    @property
+    def identifiers(self) -> list:
+        """Returns the entity identifiers the job acquires data for."""
+        return self.entity_identifiers.split(',')
+
+    @property
+    def is_finished(self) -> bool:
+        """Returns a flag indicating whether the job has completed or failed."""
+        return JobStatus[self.status] in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def __json__(self):
+        """Returns a jsonify-able representation of the acquisition job object."""
+        return {
+            "id": self.id,
+            "identifiers": self.identifiers,
+            "status": self.status,
+            "progress": {
+                "features_done": self.features_done,
+                "features_total": self.features_total
+            },
+            "message": self.message,
+            "date_created": self.date_created.isoformat() if self.date_created else None,
+            "date_updated": self.date_updated.isoformat() if self.date_updated else None,
+            "result": {"$ref": f'/api/v1/jobs/{self.id}/result'}
+        }
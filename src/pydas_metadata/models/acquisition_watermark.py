@@ -0,0 +1,54 @@
+from datetime import date, datetime
+
+from sqlalchemy import Column, Date, DateTime, String
+from sqlalchemy.sql import func
+
+from pydas_metadata.models.base import Base
+
+
+class AcquisitionWatermark(Base):
+    """
+    Latest date that has been acquired for a feature of an entity with a given set of options.
+
+    Attributes
+    ----------
+    entity_id: str
+        Identifier of the entity the data was acquired for.
+
+    feature_name: str
+        Name of the feature that was acquired.
+
+    options_hash: str
+        SHA-1 digest of the feature options the data was acquired with. Changing the options
+        of a feature starts a new watermark, as the acquired data may no longer match.
+
+    last_date: date
+        Latest date of the data points acquired so far.
+
+    first_date: date
+        Earliest date covered by the data points acquired so far, i.e. the start of the
+        widest range acquired in full. Ranges starting before it are acquired in full again.
+
+    date_updated: datetime
+        Date and time the watermark was last advanced.
+    """
+    __tablename__ = 'AcquisitionWatermarkBASE'
+
+    entity_id: str = Column('EntityID', String(50), primary_key=True)
+    feature_name: str = Column('FeatureName', String(50), primary_key=True)
+    options_hash: str = Column('OptionsHashTXT', String(40), primary_key=True)
+    last_date: date = Column('LastDT', Date, nullable=False)
+    first_date: date = Column('FirstDT', Date, nullable=True)
+    date_updated: datetime = Column(
+        'UpdatedDTS', DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __json__(self):
+        """Returns a jsonify-able representation of the acquisition watermark object."""
+        return {
+            "entity_id": self.entity_id,
+            "feature_name": self.feature_name,
+            "options_hash": self.options_hash,
+            "last_date": self.last_date.isoformat(),
+            "first_date": self.first_date.isoformat() if self.first_date else None,
+            "date_updated": self.date_updated.isoformat() if self.date_updated else None
+        }
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import importlib
 
 from sqlalchemy import Column, ForeignKey, Integer, String
@@ -56,10 +57,7 @@ class Feature(Base):
         Callable:
             Data acquisition function associated with the feature.
         """
-        # TODO: Determine if there's a way we can remove this coupling by making
-        # the handler_path configurable
-        handlers = importlib.import_module('pydas.transformers')
-        return getattr(handlers, self.handler_metadata.name)
+        return _resolve_handler(self.handler_metadata.name)
 
     def get_value(self, data: dict) -> tuple:
         """Returns a tuple containing the feature data and date extracted from a larger object.
@@ -84,6 +82,37 @@ class Feature(Base):
         data set acquired from the feature's handler function."""
         return [self.get_value(d) for d in data]
 
+    def get_columns(self, data) -> tuple:
+        """Returns parallel lists of the feature values and dates extracted from a larger data set.
+
+        Parameters
+        ----------
+        data: list or dict
+            Data set acquired from the feature's handler function, either a list of data
+            points, or a single data point whose properties are all lists of the same length,
+            e.g. ``{"date": [...], "close": [...]}``.
+
+        Returns
+        -------
+        tuple:
+            Feature values and their dates. Data points without a value for the feature are
+            skipped.
+        """
+        if isinstance(data, dict):
+            if self.name not in data:
+                return [], []
+
+            return data[self.name], data[const.DATE_PROPERTY]
+
+        values = []
+        dates = []
+        for point in data:
+            if self.name in point:
+                values.append(point[self.name])
+                dates.append(point[const.DATE_PROPERTY])
+
+        return values, dates
+
     def __json__(self):
         """Returns a jsonify-able representation of the feature object."""
         return {
@@ -95,3 +124,11 @@ class Feature(Base):
                 "name": self.handler_metadata.name
             }
         }
+
+
+@lru_cache(maxsize=None)
+def _resolve_handler(handler_name: str):
+    # TODO: Determine if there's a way we can remove this coupling by making
+    # the handler_path configurable
+    handlers = importlib.import_module('pydas.transformers')
+    return getattr(handlers, handler_name)
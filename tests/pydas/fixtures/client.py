@@ -1,5 +1,6 @@
 from pydas import create_app
 from pydas_metadata.contexts import ContextFactory
+from pydas_metadata.models import AcquisitionJob
 from pydas_metadata.models.event_handler import EventHandler
 
 from tests.pydas.mocks import MockContext
@@ -8,6 +9,7 @@ from tests.pydas.mocks import MockContext
 def app_client():
     ContextFactory.supported_contexts += (MockContext,)
     MockContext.setup(EventHandler, all=list())
+    MockContext.setup(AcquisitionJob, all=list())
 
     app = create_app('test_pydas.yaml')
     return app.test_client()
@@ -20,14 +20,14 @@ class MockContext(BaseContext):
 
     @classmethod
     def setup(cls, model: object, **query_config):
-        MockSession.instances[model.__class__.__name__] = query_config
+        MockSession.instances[model.__name__] = query_config
 
 
 class MockSession:
     instances = {}
 
     def query(self, model: object):
-        return MockQuery(**MockSession.instances[model.__class__.__name__])
+        return MockQuery(**MockSession.instances.get(model.__name__, dict()))
 
     def add(self, *args):
         pass
@@ -35,18 +35,24 @@ class MockSession:
     def commit(self, *args):
         pass
 
+    def expunge(self, *args):
+        pass
+
 
 class MockQuery:
     def __init__(self, **config):
         self.config = config
         self.predicate = None
 
-    def filter(self, predicate):
+    def filter(self, *predicate):
         self.predicate = predicate
         return self
 
+    def options(self, *args):
+        return self
+
     def __getattribute__(self, name: str):
-        if name in ('config', 'predicate', 'filter'):
+        if name in ('config', 'predicate', 'filter', 'options'):
             return object.__getattribute__(self, name)
 
         if name not in self.config:
@@ -0,0 +1,391 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pydas_metadata.models import Configuration, Entity, Feature, FeatureToggle, Handler, Option
+from pydas.acquisition import SingleFlight
+from pydas.signals import SignalFactory
+from pydas.transformers.aio import EventLoopThread
+from tests.pydas.mocks import MockContext
+from tests.pydas.fixtures import app_client
+
+
+def mock_handler(uri: str, options: list, api_key: str, session=None) -> list:
+    if 'fail' in uri:
+        raise ValueError('Unable to fetch feature')
+
+    return [{'open': 1.0, 'close': 2.0, 'date': '2021-01-04'},
+            {'open': 3.0, 'close': 4.0, 'date': '2021-01-05'}]
+
+
+def mock_indicator_handler(uri: str, options: list, api_key: str, session=None) -> dict:
+    return {'date': ['2021-01-04', '2021-01-05'],
+            'bbands': [1.0, 2.0],
+            'bbands_1': [3.0, 4.0],
+            'bbands_2': [5.0, 6.0]}
+
+
+def slow_handler(uri: str, options: list, api_key: str, session=None) -> list:
+    time.sleep(0.3)
+    return mock_handler(uri, options, api_key)
+
+
+class TestAcquireRoute(unittest.TestCase):
+    base_path = "/api/v1/acquire/"
+
+    def setUp(self):
+        self.client = app_client()
+        handler = Handler(id=1, name='batch_handler')
+        self.entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        self.entity.features = [Feature(name='open', uri='/stock/{symbol}', handler_metadata=handler),
+                                Feature(name='close', uri='/stock/{symbol}', handler_metadata=handler)]
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=mock_handler)
+        self.handler_patch.start()
+        MockContext.setup(Configuration, first=None)
+        MockContext.setup(FeatureToggle, first=None)
+        MockContext.setup(Option, all=[])
+
+    def tearDown(self):
+        self.handler_patch.stop()
+
+    def test_get_acquire(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier)
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertDictEqual(res.json, {'header': ['date', 'open', 'close'],
+                                        'values': [['2021-01-04', 1.0, 2.0],
+                                                   ['2021-01-05', 3.0, 4.0]]})
+
+    def test_get_acquire_features_sharing_a_uri_keep_their_values(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        self.handler_patch.stop()
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=slow_handler)
+        self.handler_patch.start()
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier)
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertListEqual(res.json['values'], [['2021-01-04', 1.0, 2.0],
+                                                  ['2021-01-05', 3.0, 4.0]])
+
+    def test_get_acquire_uses_container_session(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        handler = mock.Mock(side_effect=mock_handler)
+        self.handler_patch.stop()
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=handler)
+        self.handler_patch.start()
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier)
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        session = self.client.application.container.http_session()
+        self.assertEqual(handler.call_count, 2)
+        self.assertTrue(all(call.kwargs['session'] is session for call in handler.call_args_list))
+
+    def test_get_acquire_awaits_requests_on_event_loop(self):
+        # arrange
+        self.entity.features = [Feature(name='close',
+                                        uri='/stock/{symbol}/indicator/bbands',
+                                        handler_metadata=Handler(id=2, name='tech_indicators_handler'))]
+        MockContext.setup(Entity, all=[self.entity])
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return mock_handler(*args, **kwargs)
+
+        self.handler_patch.stop()
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=record_thread)
+        self.handler_patch.start()
+        event_loop = EventLoopThread()
+        container = self.client.application.container
+        container.event_loop.override(event_loop)
+
+        # act
+        try:
+            res = self.client.get(self.base_path + self.entity.identifier + '?cache=bypass')
+        finally:
+            container.event_loop.reset_override()
+            event_loop.close()
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertListEqual(res.json['values'], [['2021-01-04', 2.0], ['2021-01-05', 4.0]])
+        self.assertTrue(threads[0].name.startswith('asyncio'))
+
+    def test_get_acquire_includes_extra_indicator_series(self):
+        # arrange
+        handler = Handler(id=2, name='tech_indicators_handler')
+        self.entity.features = [Feature(name='bbands',
+                                        uri='/stock/{symbol}/indicator/bbands',
+                                        handler_metadata=handler)]
+        MockContext.setup(Entity, all=[self.entity])
+        self.handler_patch.stop()
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=mock_indicator_handler)
+        self.handler_patch.start()
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier)
+        streamed = self.client.get(self.base_path + self.entity.identifier + '?format=ndjson')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertDictEqual(res.json, {'header': ['date', 'bbands', 'bbands_1', 'bbands_2'],
+                                        'values': [['2021-01-04', 1.0, 3.0, 5.0],
+                                                   ['2021-01-05', 2.0, 4.0, 6.0]]})
+        lines = [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()]
+        self.assertListEqual(lines, [{'header': ['date', 'bbands', 'bbands_1', 'bbands_2']},
+                                     ['2021-01-04', 1.0, 3.0, 5.0],
+                                     ['2021-01-05', 2.0, 4.0, 6.0]])
+
+    def test_get_acquire_is_cached(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        handler = mock.Mock(side_effect=mock_handler)
+        self.handler_patch.stop()
+        self.handler_patch = mock.patch.object(Feature,
+                                               'handler',
+                                               new_callable=mock.PropertyMock,
+                                               return_value=handler)
+        self.handler_patch.start()
+
+        # act
+        first = self.client.get(self.base_path + self.entity.identifier)
+        second = self.client.get(self.base_path + self.entity.identifier)
+        refreshed = self.client.get(self.base_path + self.entity.identifier + '?cache=refresh')
+
+        # assert
+        self.assertDictEqual(second.json, first.json)
+        self.assertDictEqual(refreshed.json, first.json)
+        self.assertEqual(handler.call_count, 4)
+
+    def test_get_acquire_refresh_is_not_coalesced_with_other_acquisitions(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        keys = []
+
+        def do(flight, key, func, *args, **kwargs):
+            keys.append(key)
+            return func(*args, **kwargs)
+
+        # act
+        with mock.patch.object(SingleFlight, 'do', autospec=True, side_effect=do):
+            self.client.get(self.base_path + self.entity.identifier + '?cache=bypass')
+            self.client.get(self.base_path + self.entity.identifier + '?refresh=true')
+
+        # assert
+        # Entity keys hold the feature names, while feature keys hold a single URI
+        entity_keys = [key for key in keys if isinstance(key[1], tuple)]
+        self.assertEqual(len(entity_keys), 2)
+        self.assertNotEqual(entity_keys[0], entity_keys[1])
+
+    def test_get_acquire_cached_ndjson_signals_post_acquisition(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        MockContext.setup(FeatureToggle, first=FeatureToggle(name='enable_event_handlers', is_enabled=True))
+        self.client.get(self.base_path + self.entity.identifier)
+
+        # act
+        with mock.patch.object(SignalFactory, 'post_acquisition') as post_acquisition:
+            res = self.client.get(self.base_path + self.entity.identifier + '?format=ndjson')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        post_acquisition.send.assert_called_once()
+
+    def test_get_acquire_collects_feature_errors(self):
+        # arrange
+        self.entity.features[1].uri = '/fail/{symbol}'
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier)
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertListEqual(res.json['header'], ['date', 'open', 'close'])
+        self.assertListEqual(res.json['values'], [['2021-01-04', 1.0, ''],
+                                                  ['2021-01-05', 3.0, '']])
+        self.assertIn('close', res.json['errors'])
+
+    def test_get_acquire_ndjson(self):
+        # arrange
+        self.entity.features[1].uri = '/fail/{symbol}'
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier + '?format=ndjson')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'application/x-ndjson')
+        lines = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+        self.assertListEqual(lines[:3], [{'header': ['date', 'open', 'close']},
+                                         ['2021-01-04', 1.0, ''],
+                                         ['2021-01-05', 3.0, '']])
+        self.assertIn('close', lines[3]['errors'])
+
+    def test_get_acquire_file_is_streamed(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        configuration = {'OutputFileRowDelimiter': '\\n',
+                         'OutputFileFieldDelimiter': ',',
+                         'OutputFileHasHeaderRow': 'true'}
+
+        # act
+        with mock.patch('pydas.routes.formatting.get_output_configuration',
+                        side_effect=lambda config, attribute, option: configuration.get(option)):
+            res = self.client.get(self.base_path + self.entity.identifier + '?format=file')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'text/csv')
+        self.assertTrue(res.headers['Content-Disposition'].startswith('attachment; filename=data_'))
+        self.assertEqual(res.get_data(as_text=True),
+                         'date,open,close\n2021-01-04,1.0,2.0\n2021-01-05,3.0,4.0\n')
+
+    def test_get_acquire_file_is_saved(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+        with tempfile.TemporaryDirectory() as output_path:
+            configuration = {'OutputFilePath': output_path,
+                             'OutputFileRowDelimiter': '\\n',
+                             'OutputFileFieldDelimiter': ',',
+                             'OutputFileHasHeaderRow': 'true'}
+
+            # act
+            with mock.patch('pydas.routes.formatting.get_output_configuration',
+                            side_effect=lambda config, attribute, option: configuration.get(option)):
+                res = self.client.get(self.base_path + self.entity.identifier + '?format=file&save=true')
+                content = res.get_data(as_text=True)
+                res.close()
+
+            files = os.listdir(output_path)
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(files), 1)
+        self.assertIn(f'filename={files[0]}', res.headers['Content-Disposition'])
+        self.assertEqual(content, 'date,open,close\n2021-01-04,1.0,2.0\n2021-01-05,3.0,4.0\n')
+
+    def test_get_acquire_ndjson_gzip_is_streamed(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier + '?format=ndjson+gzip')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'application/gzip')
+        self.assertTrue(res.headers['Content-Disposition'].endswith('.ndjson.gz'))
+        lines = gzip.decompress(res.get_data()).decode('utf-8').splitlines()
+        self.assertListEqual([json.loads(line) for line in lines],
+                             [{'header': ['date', 'open', 'close']},
+                              ['2021-01-04', 1.0, 2.0],
+                              ['2021-01-05', 3.0, 4.0]])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_get_acquire_npy_is_streamed(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier + '?format=npy')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'application/octet-stream')
+        self.assertTrue(res.headers['Content-Disposition'].endswith('.npy'))
+        records = np.load(io.BytesIO(res.get_data()))
+        self.assertListEqual(records['close'].tolist(), [2.0, 4.0])
+
+    def test_get_acquire_columnar_is_streamed(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.get(self.base_path + self.entity.identifier + '?format=pdc')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res.headers['Content-Disposition'].endswith('.pdc'))
+        self.assertTrue(res.get_data().startswith(b'PDC1'))
+
+    def test_post_acquire_batch(self):
+        # arrange
+        other_entity = Entity(identifier='amc', name='AMC', category='Entertainment')
+        other_entity.features = self.entity.features[:1]
+        MockContext.setup(Entity, all=[self.entity, other_entity])
+
+        # act
+        res = self.client.post(self.base_path, json={'identifiers': ['amc', 'gme', 'bb']})
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertListEqual(res.json['header'], ['entity', 'date', 'open', 'close'])
+        self.assertListEqual(res.json['values'], [['amc', '2021-01-04', 1.0, ''],
+                                                  ['amc', '2021-01-05', 3.0, ''],
+                                                  ['gme', '2021-01-04', 1.0, 2.0],
+                                                  ['gme', '2021-01-05', 3.0, 4.0]])
+        self.assertDictEqual(res.json['errors'], {'bb': 'Cannot find entity'})
+
+    def test_post_acquire_batch_ndjson(self):
+        # arrange
+        MockContext.setup(Entity, all=[self.entity])
+
+        # act
+        res = self.client.post(self.base_path + '?format=ndjson', json={'identifiers': ['gme', 'bb']})
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, 'application/x-ndjson')
+        lines = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+        self.assertListEqual(lines, [{'header': ['entity', 'date', 'open', 'close']},
+                                     ['gme', '2021-01-04', 1.0, 2.0],
+                                     ['gme', '2021-01-05', 3.0, 4.0],
+                                     {'errors': {'bb': 'Cannot find entity'}}])
+
+    def test_post_acquire_batch_requires_identifiers(self):
+        # act
+        res = self.client.post(self.base_path, json={})
+
+        # assert
+        self.assertEqual(res.status_code, 400)
@@ -0,0 +1,47 @@
+import json
+from os import path
+import tempfile
+import unittest
+
+from pydas_metadata.models import AcquisitionJob, JobStatus
+from tests.pydas.mocks import MockContext
+from tests.pydas.fixtures import app_client
+
+
+class TestJobsRoute(unittest.TestCase):
+    base_path = "/api/v1/jobs/"
+
+    def setUp(self):
+        self.client = app_client()
+        self.directory = tempfile.TemporaryDirectory()
+        self.job = AcquisitionJob(id='done',
+                                  entity_identifiers='gme',
+                                  status=JobStatus.COMPLETED.name,
+                                  result_path=path.join(self.directory.name, 'done.json'))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_job_result(self):
+        # arrange
+        with open(self.job.result_path, 'w') as file:
+            json.dump({'header': ['date'], 'values': [['2021-01-04']]}, file)
+        MockContext.setup(AcquisitionJob, one_or_none=self.job)
+
+        # act
+        res = self.client.get(self.base_path + self.job.id + '/result')
+
+        # assert
+        self.assertEqual(res.status_code, 200)
+        self.assertDictEqual(res.json, {'header': ['date'], 'values': [['2021-01-04']]})
+
+    def test_get_missing_job_result(self):
+        # arrange
+        MockContext.setup(AcquisitionJob, one_or_none=self.job)
+
+        # act
+        res = self.client.get(self.base_path + self.job.id + '/result')
+
+        # assert
+        self.assertEqual(res.status_code, 410)
+        self.assertEqual(res.get_data(as_text=True), 'Result of job requested is no longer available')
@@ -0,0 +1,696 @@
+import datetime as dt
+import json
+from os import path
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pydas_metadata.contexts import MemoryContext
+from pydas_metadata.models import AcquisitionJob, Base, Entity, Feature, Handler, JobStatus
+
+from pydas.acquisition import (CoalescingClient,
+                              EntityRequest,
+                              FeatureRequest,
+                              IncrementalFetch,
+                              JobManager,
+                              MarketBatchClient,
+                              PlanCache,
+                              ResultCache,
+                              SingleFlight,
+                              acquire_features)
+from pydas.acquisition.batching import get_batch_type
+from pydas.acquisition.features import acquire_feature
+from pydas.acquisition.incremental import options_hash
+from pydas.clients.iex import IexClient
+from pydas.columns import FeatureColumns
+from pydas.stores import SegmentStore
+
+
+class MockClient:
+    def __init__(self, delays: dict, failures=()):
+        self.delays = delays
+        self.failures = failures
+        self.threads = set()
+
+    def get_feature_data(self, feature, entity, options):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delays.get(feature.name, 0))
+        if feature.name in self.failures:
+            raise ValueError(f'Unable to fetch {feature.name}')
+
+        return [{feature.name: f'{entity.identifier}-{feature.name}', 'date': '2021-01-04'}]
+
+
+class TestAcquireFeatures(unittest.TestCase):
+    def setUp(self):
+        handler = Handler(id=1, name='batch_handler')
+        self.entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        self.requests = [FeatureRequest(Feature(name=name, uri='/stock/{symbol}', handler_metadata=handler), [])
+                         for name in ('open', 'close', 'volume')]
+
+    def test_results_keep_feature_order(self):
+        # arrange
+        client = MockClient({'open': 0.05, 'close': 0.01, 'volume': 0.0})
+
+        # act
+        results = acquire_features(client, self.entity, self.requests, max_workers=3)
+
+        # assert
+        self.assertListEqual([result.feature_name for result in results],
+                             ['open', 'close', 'volume'])
+        self.assertListEqual(results[0].values, [('gme-open', '2021-01-04')])
+        self.assertGreater(len(client.threads), 1)
+
+    def test_streamed_records_are_extracted(self):
+        # arrange
+        client = mock.Mock()
+        client.get_feature_data.return_value = (point for point in [{'open': 1.0, 'date': '2021-01-04'},
+                                                                    {'open': 2.0, 'date': '2021-01-05'}])
+
+        # act
+        results = acquire_features(client, self.entity, self.requests[:1])
+
+        # assert
+        self.assertListEqual(results[0].values, [(1.0, '2021-01-04'), (2.0, '2021-01-05')])
+
+    def test_errors_are_collected(self):
+        # arrange
+        client = MockClient({}, failures=('close',))
+
+        # act
+        results = acquire_features(client, self.entity, self.requests, max_workers=2)
+
+        # assert
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0].succeeded)
+        self.assertFalse(results[1].succeeded)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertListEqual(results[1].values, [])
+        self.assertTrue(results[2].succeeded)
+
+
+TODAY = dt.date(2021, 1, 29)
+
+
+class RangeClient:
+    def __init__(self, today):
+        self.today = today
+        self.ranges = []
+
+    def get_feature_data(self, feature, entity, options):
+        date_range = options[0]['value']
+        self.ranges.append(date_range)
+        days = int(date_range[:-1])
+        return [{feature.name: days, 'date': (self.today() - dt.timedelta(days=i)).isoformat()}
+                for i in range(days)]
+
+
+class TestIncrementalFetch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.context = MemoryContext(database=path.join(self.directory.name, 'metadata.sqlite'))
+        Base.metadata.create_all(self.context.engine)
+        self.entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        self.request = FeatureRequest(Feature(name='close',
+                                              uri='/stock/{symbol}/chart',
+                                              handler_metadata=Handler(id=2, name='range_handler')),
+                                      [{'name': 'range', 'value': '5d'}])
+        self.today = TODAY
+
+    def tearDown(self):
+        self.context.engine.dispose()
+        self.directory.cleanup()
+
+    def fetch(self):
+        return IncrementalFetch(self.context,
+                                SegmentStore(path.join(self.directory.name, 'store')),
+                                today=lambda: self.today)
+
+    def test_first_acquisition_requests_full_range(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+
+        # act
+        result = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d'])
+        self.assertEqual(len(result.values), 5)
+        self.assertEqual(result.values[-1], (5, '2021-01-29'))
+        self.assertEqual(self.fetch().get_watermark('gme', 'close', options_hash(self.request.options)),
+                         TODAY)
+
+    def test_acquisition_requests_missing_tail(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        self.fetch()(client, self.entity, self.request)
+        self.today = TODAY + dt.timedelta(days=4)
+
+        # act
+        result = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        # Monday 2021-02-01 and Tuesday 2021-02-02 are the trading days since Friday 2021-01-29
+        self.assertListEqual(client.ranges, ['5d', '2d'])
+        self.assertListEqual([value[1] for value in result.values],
+                             ['2021-01-27', '2021-01-28', '2021-01-29', '2021-02-01', '2021-02-02'])
+        self.assertListEqual([value[0] for value in result.values], [5, 5, 5, 2, 2])
+
+    def test_acquisition_is_served_locally_until_next_trading_day(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        self.fetch()(client, self.entity, self.request)
+        self.today = TODAY + dt.timedelta(days=2)
+
+        # act
+        result = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d'])
+        self.assertEqual(len(result.values), 5)
+
+    def test_widened_range_is_acquired_in_full(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        self.fetch()(client, self.entity, self.request)
+        widened = FeatureRequest(self.request.feature, [{'name': 'range', 'value': '10d'}])
+
+        # act
+        result = self.fetch()(client, self.entity, widened)
+        narrowed = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d', '10d'])
+        self.assertEqual(len(result.values), 10)
+        self.assertEqual(result.values[0], (10, '2021-01-20'))
+        self.assertEqual(len(narrowed.values), 5)
+
+    def test_intraday_features_are_not_served_locally(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        self.request.feature.handler_metadata = Handler(id=3, name='tech_indicators_handler')
+        self.fetch()(client, self.entity, self.request)
+
+        # act
+        self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d', '5d'])
+
+    def test_features_with_repeated_dates_are_not_stored(self):
+        # arrange
+        client = mock.Mock()
+        client.get_feature_data.return_value = [{'close': 1, 'date': '2021-01-29'},
+                                                {'close': 2, 'date': '2021-01-29'}]
+        self.fetch()(client, self.entity, self.request)
+
+        # act
+        result = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertEqual(client.get_feature_data.call_count, 2)
+        self.assertListEqual(result.values, [(1, '2021-01-29'), (2, '2021-01-29')])
+        self.assertIsNone(self.fetch().get_watermark('gme', 'close', options_hash(self.request.options)))
+
+    def test_acquisition_is_served_locally_once_up_to_date(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        expected = self.fetch()(client, self.entity, self.request)
+
+        # act
+        result = self.fetch()(client, self.entity, self.request)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d'])
+        self.assertListEqual(result.values, expected.values)
+
+    def test_refresh_requests_full_range(self):
+        # arrange
+        client = RangeClient(lambda: self.today)
+        self.fetch()(client, self.entity, self.request)
+
+        # act
+        self.fetch().acquire(client, self.entity, self.request, refresh=True)
+
+        # assert
+        self.assertListEqual(client.ranges, ['5d', '5d'])
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        self.plan = EntityRequest(entity, [
+            FeatureRequest(Feature(name='open', handler_metadata=Handler(id=1, name='batch_handler')), []),
+            FeatureRequest(Feature(name='close', handler_metadata=Handler(id=2, name='range_handler')),
+                           [{'name': 'range', 'value': '1y'}])])
+
+    def test_ttl_is_shortest_handler_ttl(self):
+        # arrange
+        cache = ResultCache(default_ttl=30, ttls={'batch_handler': 10, 'range_handler': 3600})
+
+        # act
+        ttl = cache.get_ttl(self.plan)
+
+        # assert
+        self.assertEqual(ttl, 10)
+
+    def test_end_of_day_handlers_share_end_of_day_ttl(self):
+        # arrange
+        cache = ResultCache(default_ttl=30, end_of_day_ttl=3600)
+        indicator_plan = EntityRequest(self.plan.entity, self.plan.requests + [
+            FeatureRequest(Feature(name='bbands', handler_metadata=Handler(id=3, name='tech_indicators_handler')),
+                           [])])
+
+        # act
+        ttl = cache.get_ttl(self.plan)
+        indicator_ttl = cache.get_ttl(indicator_plan)
+
+        # assert
+        self.assertEqual(ttl, 3600)
+        self.assertEqual(indicator_ttl, 30)
+
+    def test_expired_datasets_are_missed(self):
+        # arrange
+        cache = ResultCache()
+        key = cache.get_key(self.plan, 'json')
+        cache.put(key, {'values': []}, ttl=60)
+
+        # act
+        with mock.patch('pydas.acquisition.cache.time.monotonic', return_value=time.monotonic() + 61):
+            expired = cache.get(key)
+
+        # assert
+        self.assertIsNone(expired)
+        self.assertIsNone(cache.get(key))
+
+    def test_least_recently_used_dataset_is_evicted(self):
+        # arrange
+        cache = ResultCache(max_entries=2)
+        cache.put('gme', 1)
+        cache.put('amc', 2)
+        cache.get('gme')
+
+        # act
+        cache.put('bb', 3)
+
+        # assert
+        self.assertEqual(cache.get('gme'), 1)
+        self.assertIsNone(cache.get('amc'))
+        statistics = cache.get_statistics()
+        self.assertEqual(statistics['hits'], 2)
+        self.assertEqual(statistics['misses'], 1)
+        self.assertEqual(statistics['evictions'], 1)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_are_coalesced(self):
+        # arrange
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def acquire():
+            calls.append(threading.get_ident())
+            started.set()
+            release.wait(5)
+            return ['gme']
+
+        leader = threading.Thread(target=flight.do, args=('gme', acquire))
+        leader.start()
+        started.wait(5)
+        results = []
+        follower = threading.Thread(target=lambda: results.append(flight.do('gme', acquire)))
+
+        # act
+        follower.start()
+        while not flight.coalesced:
+            time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        # assert
+        self.assertEqual(len(calls), 1)
+        self.assertListEqual(results, [['gme']])
+        self.assertEqual(flight.coalesced, 1)
+
+    def test_exceptions_are_shared(self):
+        # arrange
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError('Unable to fetch')
+
+        # act/assert
+        with self.assertRaises(ValueError):
+            flight.do('gme', fail)
+
+        self.assertEqual(flight.do('gme', lambda: 'gme'), 'gme')
+
+    def test_client_coalesces_identical_requests(self):
+        # arrange
+        client = MockClient({'open': 0.2})
+        coalescing_client = CoalescingClient(client, SingleFlight())
+        entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        feature = Feature(name='open', uri='/stock/{symbol}', handler_metadata=Handler(id=1, name='batch_handler'))
+        results = []
+
+        # act
+        threads = [threading.Thread(target=lambda: results.append(
+            coalescing_client.get_feature_data(feature, entity, [])))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # assert
+        self.assertEqual(len(client.threads), 1)
+        self.assertEqual(len(results), 3)
+        self.assertGreaterEqual(coalescing_client.flight.coalesced, 1)
+
+    def test_clients_coalesce_identical_requests(self):
+        # arrange
+        flight = SingleFlight()
+        clients = [MockClient({'open': 0.2}), MarketBatchClient(MockClient({'open': 0.2}), [])]
+        entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        feature = Feature(name='open', uri='/stock/{symbol}', handler_metadata=Handler(id=1, name='batch_handler'))
+        threads = [threading.Thread(target=CoalescingClient(client, flight).get_feature_data,
+                                    args=(feature, entity, []))
+                   for client in clients]
+
+        # act
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # assert
+        self.assertEqual(len(clients[0].threads) + len(clients[1].client.threads), 1)
+        self.assertEqual(flight.coalesced, 1)
+
+    def test_client_extracts_streamed_records(self):
+        # arrange
+        client = mock.Mock()
+        client.get_feature_data.side_effect = lambda *_: iter([{'open': 1.0, 'date': '2021-01-04'},
+                                                               {'open': 1.5, 'date': '2021-01-05'}])
+        coalescing_client = CoalescingClient(client, SingleFlight())
+        entity = Entity(identifier='gme', name='GameStop', category='Retail')
+        feature = Feature(name='open', uri='/stock/{symbol}', handler_metadata=Handler(id=1, name='batch_handler'))
+        request = FeatureRequest(feature, [])
+
+        # act
+        data = coalescing_client.get_feature_data(feature, entity, [])
+        result = acquire_feature(coalescing_client, entity, request)
+
+        # assert
+        self.assertIsInstance(data, FeatureColumns)
+        self.assertListEqual(data.dates, ['2021-01-04', '2021-01-05'])
+        self.assertListEqual(result.values, [(1.0, '2021-01-04'), (1.5, '2021-01-05')])
+
+
+class TestPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.context = MemoryContext(database=path.join(self.directory.name, 'metadata.sqlite'))
+        Base.metadata.create_all(self.context.engine)
+        with self.context.get_session() as session:
+            handler = Handler(id=1, name='batch_handler')
+            entity = Entity(identifier='gme', name='GameStop', category='Retail')
+            entity.features = [Feature(name='open', uri='/stock/{symbol}', handler_metadata=handler)]
+            session.add(entity)
+
+    def tearDown(self):
+        self.context.engine.dispose()
+        self.directory.cleanup()
+
+    def test_plans_are_cached(self):
+        # arrange
+        cache = PlanCache()
+
+        # act
+        plan = cache.get_plan(self.context, 'gme')
+        with mock.patch.object(self.context, 'get_session') as get_session:
+            cached = cache.get_plan(self.context, 'gme')
+
+        # assert
+        self.assertIs(cached, plan)
+        get_session.assert_not_called()
+        self.assertEqual(plan.entity.identifier, 'gme')
+        self.assertListEqual([request.feature.name for request in plan.requests], ['open'])
+        self.assertEqual(plan.requests[0].feature.handler_metadata.name, 'batch_handler')
+
+    def test_unknown_entities_are_omitted(self):
+        # arrange
+        cache = PlanCache()
+
+        # act
+        plans = cache.get_plans(self.context, ['gme', 'amc'])
+
+        # assert
+        self.assertListEqual(list(plans), ['gme'])
+        self.assertIsNone(cache.get_plan(self.context, 'amc'))
+
+    def test_invalidate_recompiles_plan(self):
+        # arrange
+        cache = PlanCache()
+        plan = cache.get_plan(self.context, 'gme')
+        with self.context.get_session() as session:
+            entity = session.query(Entity).filter(Entity.identifier == 'gme').one()
+            entity.features.append(Feature(name='close',
+                                           uri='/stock/{symbol}',
+                                           handler_metadata=entity.features[0].handler_metadata))
+
+        # act
+        cache.invalidate('gme')
+        recompiled = cache.get_plan(self.context, 'gme')
+
+        # assert
+        self.assertIsNot(recompiled, plan)
+        self.assertListEqual([request.feature.name for request in recompiled.requests],
+                             ['open', 'close'])
+
+
+class MockIexClient:
+    def __init__(self, missing=(), fail=False):
+        self.missing = missing
+        self.fail = fail
+        self.batches = []
+        self.requests = []
+
+    def get_market_batch(self, symbols, types, options):
+        self.batches.append((symbols, types, options))
+        if self.fail:
+            raise ValueError('Market batch request failed')
+
+        return {symbol.upper(): {'quote': {'close': 1.0, 'date': '2021-01-04'},
+                                 'chart': [{'open': 2.0, 'date': '2021-01-04'}]}
+                for symbol in symbols if symbol not in self.missing}
+
+    def get_feature_data(self, feature, entity, options):
+        self.requests.append((entity.identifier, feature.name))
+        return [{feature.name: 3.0, 'date': '2021-01-04'}]
+
+
+class TestMarketBatchClient(unittest.TestCase):
+    def setUp(self):
+        batch = Handler(id=1, name='batch_handler')
+        news = Handler(id=3, name='news_handler')
+        range_option = {'name': 'range', 'value': '1m', 'feature_name': 'open', 'entity_id': None}
+        self.plans = []
+        for identifier in ('gme', 'amc', 'bb'):
+            self.plans.append(EntityRequest(Entity(identifier=identifier), [
+                FeatureRequest(Feature(name='close', uri='/stock/{symbol}/quote', handler_metadata=batch), []),
+                FeatureRequest(Feature(name='open', uri='/stock/{symbol}/chart', handler_metadata=batch),
+                               [dict(range_option, entity_id=identifier)]),
+                FeatureRequest(Feature(name='news', uri='/stock/{symbol}/news', handler_metadata=news), [])]))
+
+    def test_shared_features_are_batched(self):
+        # arrange
+        iex_client = MockIexClient()
+        client = MarketBatchClient(iex_client, self.plans, batch_size=2)
+
+        # act
+        results = {plan.entity.identifier: acquire_features(client, plan.entity, plan.requests)
+                   for plan in self.plans}
+
+        # assert
+        self.assertListEqual(sorted(iex_client.batches), [
+            (['bb'], ['chart'], [{'name': 'range', 'value': '1m'}]),
+            (['bb'], ['quote'], []),
+            (['gme', 'amc'], ['chart'], [{'name': 'range', 'value': '1m'}]),
+            (['gme', 'amc'], ['quote'], [])])
+        self.assertEqual(client.batches, 4)
+        self.assertListEqual(iex_client.requests, [('gme', 'news'), ('amc', 'news'), ('bb', 'news')])
+        for identifier in ('gme', 'amc', 'bb'):
+            self.assertListEqual([result.values for result in results[identifier]],
+                                 [[(1.0, '2021-01-04')], [(2.0, '2021-01-04')], [(3.0, '2021-01-04')]])
+
+    def test_missing_symbols_fail_their_features(self):
+        # arrange
+        iex_client = MockIexClient(missing=('amc',))
+        client = MarketBatchClient(iex_client, self.plans)
+
+        # act
+        results = acquire_features(client, self.plans[1].entity, self.plans[1].requests)
+
+        # assert
+        self.assertIsInstance(results[0].error, LookupError)
+        self.assertIsInstance(results[1].error, LookupError)
+        self.assertTrue(results[2].succeeded)
+
+    def test_single_entity_is_not_batched(self):
+        # arrange
+        iex_client = MockIexClient()
+        client = MarketBatchClient(iex_client, self.plans[:1])
+
+        # act
+        acquire_features(client, self.plans[0].entity, self.plans[0].requests)
+
+        # assert
+        self.assertListEqual(iex_client.batches, [])
+        self.assertEqual(len(iex_client.requests), 3)
+
+
+    def test_seeded_feature_uris_are_batched(self):
+        # arrange
+        batch = Handler(id=1, name='batch_handler')
+
+        # act
+        chart = get_batch_type(Feature(name='open', uri='/stocks/{symbol:}/chart', handler_metadata=batch))
+        stats = get_batch_type(Feature(name='beta', uri='/stock/{symbol:}/advanced-stats', handler_metadata=batch))
+
+        # assert
+        self.assertEqual(chart, 'chart')
+        self.assertEqual(stats, 'advanced-stats')
+
+    def test_types_are_not_requested_for_entities_without_them(self):
+        # arrange
+        iex_client = MockIexClient()
+        batch = Handler(id=1, name='batch_handler')
+        chart = FeatureRequest(Feature(name='high', uri='/stock/{symbol}/chart', handler_metadata=batch), [])
+        self.plans[0].requests.append(chart)
+        client = MarketBatchClient(iex_client, self.plans)
+
+        # act
+        for plan in self.plans:
+            acquire_features(client, plan.entity, plan.requests)
+
+        # assert
+        # GameStop is the only entity requesting a chart without options, so it isn't batched
+        # with the entities that only request a quote
+        self.assertIn((['amc', 'bb'], ['quote'], []), iex_client.batches)
+        self.assertNotIn(['chart', 'quote'], [types for _, types, _ in iex_client.batches])
+        self.assertIn(('gme', 'close'), iex_client.requests)
+        self.assertIn(('gme', 'high'), iex_client.requests)
+
+    def test_failed_batches_are_requested_per_entity(self):
+        # arrange
+        iex_client = MockIexClient(fail=True)
+        client = MarketBatchClient(iex_client, self.plans)
+
+        # act
+        results = {plan.entity.identifier: acquire_features(client, plan.entity, plan.requests)
+                   for plan in self.plans}
+
+        # assert
+        self.assertEqual(len(iex_client.batches), 2)
+        for identifier in ('gme', 'amc', 'bb'):
+            self.assertTrue(all(result.succeeded for result in results[identifier]))
+            self.assertIn((identifier, 'close'), iex_client.requests)
+
+
+class TestIexClient(unittest.TestCase):
+    def test_market_batch_types_are_requested_in_chunks(self):
+        # arrange
+        types = [f'type{i}' for i in range(12)]
+
+        def handler(uri, options, api_key, session):
+            requested = options[1]['value'].split(',')
+            return {'GME': {batch_type: [] for batch_type in requested}}
+
+        # act
+        with mock.patch('pydas.clients.iex.batch_handler', side_effect=handler) as batch_handler:
+            data = IexClient('token').get_market_batch(['gme'], types, [])
+
+        # assert
+        self.assertListEqual([call.args[1][1]['value'].count(',') + 1 for call in batch_handler.call_args_list],
+                             [10, 2])
+        self.assertListEqual(sorted(data['GME']), sorted(types))
+
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.context = MemoryContext(database=path.join(self.directory.name, 'metadata.sqlite'))
+        Base.metadata.create_all(self.context.engine)
+        with self.context.get_session() as session:
+            handler = Handler(id=1, name='batch_handler')
+            entity = Entity(identifier='gme', name='GameStop', category='Retail')
+            entity.features = [Feature(name='open', uri='/stock/{symbol}', handler_metadata=handler),
+                               Feature(name='close', uri='/stock/{symbol}', handler_metadata=handler)]
+            session.add(entity)
+
+        self.handler_patch = mock.patch.object(
+            Feature,
+            'handler',
+            new_callable=mock.PropertyMock,
+            return_value=lambda uri, options, api_key, session=None: [
+                {'open': 1.0, 'close': 2.0, 'date': '2021-01-04'}])
+        self.handler_patch.start()
+
+    def tearDown(self):
+        self.handler_patch.stop()
+        self.context.engine.dispose()
+        self.directory.cleanup()
+
+    def test_submit_completes_job(self):
+        # arrange
+        manager = JobManager(self.context, max_workers=2, result_path=self.directory.name)
+
+        # act
+        job = manager.submit(['gme'])
+        manager.shutdown()
+
+        # assert
+        completed = manager.get_job(job.id)
+        self.assertEqual(completed.status, JobStatus.COMPLETED.name)
+        self.assertEqual(completed.features_done, 2)
+        self.assertEqual(completed.features_total, 2)
+        with open(completed.result_path) as file:
+            self.assertDictEqual(json.load(file), {'header': ['date', 'open', 'close'],
+                                                   'values': [['2021-01-04', 1.0, 2.0]]})
+
+    def test_recover_resumes_unfinished_jobs(self):
+        # arrange
+        with self.context.get_session() as session:
+            session.add(AcquisitionJob(id='unfinished',
+                                       entity_identifiers='gme',
+                                       status=JobStatus.RUNNING.name,
+                                       features_done=1,
+                                       features_total=2))
+        manager = JobManager(self.context, result_path=self.directory.name)
+
+        # act
+        recovered = manager.recover()
+        manager.shutdown()
+
+        # assert
+        self.assertEqual(recovered, 1)
+        self.assertEqual(manager.get_job('unfinished').status, JobStatus.COMPLETED.name)
+
+    def test_unknown_entities_fail_job(self):
+        # arrange
+        manager = JobManager(self.context, result_path=self.directory.name)
+
+        # act
+        job = manager.submit(['amc'])
+        manager.shutdown()
+
+        # assert
+        self.assertEqual(manager.get_job(job.id).status, JobStatus.FAILED.name)
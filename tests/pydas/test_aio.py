@@ -0,0 +1,123 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pydas_metadata.models import Entity, Feature, Handler
+
+from pydas.acquisition import EntityRequest, FeatureRequest, acquire_entities
+from pydas.clients import AsyncIexClient
+from pydas.transformers import aio, sessions
+
+DELAY = 0.2
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        with SlowHandler.lock:
+            SlowHandler.in_flight += 1
+            SlowHandler.peak = max(SlowHandler.peak, SlowHandler.in_flight)
+
+        time.sleep(DELAY)
+        with SlowHandler.lock:
+            SlowHandler.in_flight -= 1
+
+        symbol = self.path.split('/')[2]
+        status = 503 if symbol == 'fail' else 200
+        body = json.dumps({'close': symbol, 'date': '2021-01-29'}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestAsyncAcquisition(unittest.TestCase):
+    def setUp(self):
+        SlowHandler.in_flight = SlowHandler.peak = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.session = sessions.HttpSession(retries=0)
+        self.event_loop = aio.EventLoopThread()
+        self.client = AsyncIexClient('token', self.session, event_loop=self.event_loop)
+        self.client.base_uri = f'http://127.0.0.1:{self.server.server_port}'
+        self.client.version = ''
+
+    def tearDown(self):
+        self.event_loop.close()
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def plan(self, identifier: str, handler_name: str = 'batch_handler') -> EntityRequest:
+        handler = Handler(id=1, name=handler_name)
+        return EntityRequest(Entity(identifier=identifier), [
+            FeatureRequest(Feature(name='close', uri='/stock/{symbol}/quote', handler_metadata=handler), [])])
+
+    def test_requests_are_awaited_on_event_loop(self):
+        # arrange
+        plans = [self.plan(f'sym{i}') for i in range(20)]
+
+        # act
+        results = acquire_entities(self.client, plans, max_workers=8)
+
+        # assert
+        self.assertGreater(SlowHandler.peak, 1)
+        self.assertEqual(self.session.requests, 0)
+        self.assertListEqual([entity.identifier for entity, _ in results], [f'sym{i}' for i in range(20)])
+        self.assertListEqual([feature_results[0].values for _, feature_results in results],
+                             [[(f'sym{i}', '2021-01-29')] for i in range(20)])
+
+    def test_blocking_handlers_run_on_executor(self):
+        # arrange
+        plans = [self.plan('gme', 'tech_indicators_handler')]
+        threads = []
+
+        def record_thread(*_):
+            threads.append(threading.current_thread())
+            return [{'close': 1.0, 'date': '2021-01-29'}]
+
+        handler = mock.Mock(side_effect=record_thread)
+
+        # act
+        with mock.patch.object(Feature, 'handler', new_callable=mock.PropertyMock, return_value=handler):
+            results = acquire_entities(self.client, plans)
+
+        # assert
+        self.assertListEqual(results[0][1][0].values, [(1.0, '2021-01-29')])
+        handler.assert_called_once_with(self.client.base_uri + '/stock/gme/quote', [], 'token', self.session)
+        self.assertTrue(threads[0].name.startswith('asyncio'))
+
+    def test_errors_are_collected(self):
+        # arrange
+        plans = [self.plan('gme'), self.plan('fail')]
+
+        # act
+        results = acquire_entities(self.client, plans)
+
+        # assert
+        self.assertTrue(results[0][1][0].succeeded)
+        self.assertFalse(results[1][1][0].succeeded)
+
+    def test_requests_without_event_loop_are_awaited(self):
+        # arrange
+        self.client.event_loop = None
+        plan = self.plan('gme')
+
+        # act
+        data = self.client.get_feature_data(plan.requests[0].feature, plan.entity, [])
+
+        # assert
+        self.assertDictEqual(data, {'close': 'gme', 'date': '2021-01-29'})
@@ -0,0 +1,90 @@
+import io
+from os import path
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from pydas.formatters import FormatterFactory, NpyFormatter, NpzFormatter
+from pydas.formatters.arrays import to_typed_array
+
+DATA = {'header': ['date', 'open', 'volume', 'summary'],
+        'values': [['2021-01-04', 1.5, 100, 'up'],
+                   ['2021-01-05', '', 200, 'flat'],
+                   ['2021-01-06', 3.0, 300, 'down']]}
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class TestNumpyFormatters(unittest.TestCase):
+    def test_factory_returns_numpy_formatters(self):
+        # act
+        npz = FormatterFactory.get_formatter('npz')
+        npy = FormatterFactory.get_formatter('NPY')
+
+        # assert
+        self.assertIsInstance(npz, NpzFormatter)
+        self.assertIsInstance(npy, NpyFormatter)
+        self.assertTrue(npy.get_filename().endswith('.npy'))
+
+    def test_npz_contains_typed_columns(self):
+        # act
+        bundle = b''.join(NpzFormatter().transform(DATA))
+
+        # assert
+        with np.load(io.BytesIO(bundle)) as arrays:
+            self.assertListEqual(arrays.files, DATA['header'])
+            self.assertEqual(arrays['date'].dtype, np.dtype('datetime64[D]'))
+            self.assertEqual(arrays['volume'].dtype, np.int64)
+            self.assertTrue(np.isnan(arrays['open'][1]))
+            self.assertListEqual(arrays['summary'].tolist(), ['up', 'flat', 'down'])
+
+    def test_npz_keeps_any_feature_name(self):
+        # arrange
+        data = {'header': ['date', 'file', '50-day ma'],
+                'values': [['2021-01-04', 1.5, 2.5]]}
+
+        # act
+        bundle = b''.join(NpzFormatter().transform(data))
+
+        # assert
+        with np.load(io.BytesIO(bundle)) as arrays:
+            self.assertListEqual(arrays.files, data['header'])
+            self.assertListEqual(arrays['file'].tolist(), [1.5])
+            self.assertListEqual(arrays['50-day ma'].tolist(), [2.5])
+
+    def test_npy_is_memory_mappable(self):
+        # arrange
+        formatter = NpyFormatter()
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = path.join(directory, formatter.get_filename())
+            with open(filename, 'wb') as file:
+                for chunk in formatter.transform(DATA):
+                    file.write(chunk)
+
+            # act
+            records = np.load(filename, mmap_mode='r')
+
+            # assert
+            self.assertIsInstance(records, np.memmap)
+            self.assertTupleEqual(records.dtype.names, tuple(DATA['header']))
+            self.assertListEqual(records['volume'].tolist(), [100, 200, 300])
+            self.assertEqual(str(records['date'][2]), '2021-01-06')
+            del records
+
+    def test_empty_dataset(self):
+        # act
+        records = np.load(io.BytesIO(b''.join(NpyFormatter().transform({'header': ['date'], 'values': []}))))
+
+        # assert
+        self.assertEqual(len(records), 0)
+
+    def test_unparsable_dates_are_strings(self):
+        # act
+        array = to_typed_array(('2021-01-04', 'soon'), is_date=True)
+
+        # assert
+        self.assertEqual(array.dtype.kind, 'U')
@@ -0,0 +1,55 @@
+import gzip
+import io
+import unittest
+from zipfile import ZipFile
+
+from pydas.formatters import FormatterChain, FormatterFactory, get_stages
+
+DATA = {'header': ['date', 'open'],
+        'values': [['2021-01-04', 1.0], ['2021-01-05', 2.0]]}
+OPTIONS = {'field_delimiter': ',', 'row_delimiter': '\\n', 'include_headers': 'true'}
+
+
+class TestFormatterChain(unittest.TestCase):
+    def test_stages_are_split_on_plus_or_space(self):
+        # act / assert
+        self.assertListEqual(get_stages('CSV+gzip'), ['csv', 'gzip'])
+        self.assertListEqual(get_stages('ndjson zip'), ['ndjson', 'zip'])
+
+    def test_factory_creates_chains(self):
+        # act
+        formatter = FormatterFactory.get_formatter('csv+gzip')
+
+        # assert
+        self.assertIsInstance(formatter, FormatterChain)
+        self.assertEqual(formatter.content_type, 'application/gzip')
+        self.assertTrue(formatter.get_filename().endswith('.csv.gz'))
+
+    def test_csv_gzip_is_compressed_as_streamed(self):
+        # act
+        chunks = FormatterFactory.get_formatter('csv+gzip').transform(DATA, **OPTIONS)
+
+        # assert
+        self.assertEqual(gzip.decompress(b''.join(chunks)),
+                         b'date,open\n2021-01-04,1.0\n2021-01-05,2.0\n')
+
+    def test_ndjson_zip_archives_lines(self):
+        # arrange
+        formatter = FormatterFactory.get_formatter('ndjson+zip')
+
+        # act
+        archive = ZipFile(io.BytesIO(b''.join(formatter.transform(DATA))))
+
+        # assert
+        self.assertEqual(len(archive.namelist()), 1)
+        self.assertTrue(archive.namelist()[0].endswith('.ndjson'))
+        self.assertEqual(archive.read(archive.namelist()[0]).decode('utf-8').splitlines()[1],
+                         '["2021-01-04", 1.0]')
+
+    def test_unsupported_stages_are_rejected(self):
+        # act / assert
+        with self.assertRaises(KeyError):
+            FormatterFactory.get_formatter('gzip+csv')
+
+        with self.assertRaises(KeyError):
+            FormatterFactory.get_formatter('json+gzip')
@@ -0,0 +1,99 @@
+from datetime import date
+from os import path
+import math
+import tempfile
+import unittest
+
+from pydas.formatters import ColumnarFormatter, ColumnarReader, FormatterFactory
+from pydas.formatters.columnar import get_column_type
+
+DATA = {'header': ['date', 'open', 'volume', 'summary', 'tags'],
+        'values': [['2021-01-04', 1.5, 100, 'Shares rally', ['a']],
+                   ['2021-01-05', '', 200, 'Shares rally', None],
+                   ['2021-01-07', 3.0, -300, 'Shares fall', {'b': 1}],
+                   ['2021-01-08', 4.0, 400, '', True],
+                   ['2021-01-11', 5.0, 500, 'Shares fall', 'c']]}
+
+
+class TestColumnarFormat(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = path.join(self.directory.name, 'data.pdc')
+        with open(self.filename, 'wb') as file:
+            for chunk in ColumnarFormatter().transform(DATA, chunk_rows=2):
+                file.write(chunk)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_factory_returns_columnar_formatter(self):
+        # act
+        formatter = FormatterFactory.get_formatter('pdc')
+
+        # assert
+        self.assertIsInstance(formatter, ColumnarFormatter)
+        self.assertTrue(formatter.get_filename().endswith('.pdc'))
+
+    def test_round_trip(self):
+        # act
+        with ColumnarReader(self.filename) as reader:
+            dataset = reader.read()
+            types = reader.types
+            rows = reader.rows
+
+        # assert
+        self.assertListEqual(types, ['date', 'float64', 'int64', 'string', 'json'])
+        self.assertEqual(rows, 5)
+        self.assertListEqual(dataset['header'], DATA['header'])
+        self.assertTrue(math.isnan(dataset['values'][1][1]))
+        dataset['values'][1][1] = ''
+        self.assertListEqual(dataset['values'], DATA['values'])
+
+    def test_column_projection(self):
+        # act
+        with ColumnarReader(self.filename) as reader:
+            columns = reader.read_columns(['summary'])
+
+        # assert
+        self.assertDictEqual(columns, {'summary': ['Shares rally', 'Shares rally', 'Shares fall', '', 'Shares fall']})
+
+    def test_date_range(self):
+        # act
+        with ColumnarReader(self.filename) as reader:
+            dataset = reader.read(['volume'], start_date='2021-01-05', end_date=date(2021, 1, 8))
+
+        # assert
+        self.assertDictEqual(dataset, {'header': ['date', 'volume'],
+                                       'values': [['2021-01-05', 200], ['2021-01-07', -300], ['2021-01-08', 400]]})
+
+    def test_unknown_column(self):
+        # act / assert
+        with ColumnarReader(self.filename) as reader:
+            self.assertRaises(KeyError, reader.read_columns, ['close'])
+
+    def test_invalid_file(self):
+        # arrange
+        with open(self.filename, 'wb') as file:
+            file.write(b'date,open\n2021-01-04,1.5\n')
+
+        # act / assert
+        self.assertRaises(ValueError, ColumnarReader, self.filename)
+
+    def test_empty_dataset(self):
+        # arrange
+        with open(self.filename, 'wb') as file:
+            file.write(b''.join(ColumnarFormatter().transform({'header': ['date', 'open'], 'values': []})))
+
+        # act
+        with ColumnarReader(self.filename) as reader:
+            dataset = reader.read(start_date='2021-01-01')
+
+        # assert
+        self.assertDictEqual(dataset, {'header': ['date', 'open'], 'values': []})
+
+    def test_dates_that_are_not_iso_dates_are_strings(self):
+        # act
+        column_type = get_column_type(('2021-01-04 09:30', '2021-01-04 09:31'), is_date=True)
+
+        # assert
+        self.assertEqual(column_type, 'string')
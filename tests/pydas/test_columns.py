@@ -0,0 +1,126 @@
+import unittest
+
+from pydas.columns import FeatureColumns, iter_points, to_array
+from pydas.formatters.json import JsonFormatter
+from pydas.formatters.ndjson import NdjsonFormatter
+
+
+class TestFeatureColumns(unittest.TestCase):
+    def test_from_values_skips_missing_points(self):
+        # arrange
+        values = [(1.5, '2021-01-04'), '', (2.5, '2021-01-05')]
+
+        # act
+        columns = FeatureColumns.from_values(values)
+
+        # assert
+        self.assertListEqual(columns.dates, ['2021-01-04', '2021-01-05'])
+        self.assertListEqual(columns.get_values(), [1.5, 2.5])
+
+    def test_columns_are_a_sequence_of_tuples(self):
+        # arrange
+        columns = FeatureColumns.from_columns(['2021-01-04', '2021-01-05'], [1, 2])
+
+        # act
+        values = list(columns)
+
+        # assert
+        self.assertListEqual(values, [(1, '2021-01-04'), (2, '2021-01-05')])
+        self.assertEqual(columns[1], (2, '2021-01-05'))
+        self.assertEqual(columns, values)
+        self.assertEqual(len(columns[:1]), 1)
+
+    def test_text_values_are_kept_as_list(self):
+        # act
+        values = to_array(['a', 'b'])
+
+        # assert
+        self.assertIsInstance(values, list)
+
+    def test_mismatched_columns_are_rejected(self):
+        # act / assert
+        with self.assertRaises(ValueError):
+            FeatureColumns(['2021-01-04'], [])
+
+        with self.assertRaises(ValueError):
+            FeatureColumns(['2021-01-04'], [1], {'bbands_1': []})
+
+    def test_extra_columns_are_sliced_with_values(self):
+        # arrange
+        columns = FeatureColumns.from_columns(['2021-01-04', '2021-01-05'], [1, 2], {'bbands_1': [3, 4]})
+
+        # act
+        extra_columns = columns[1:].get_extra_columns()
+
+        # assert
+        self.assertEqual(len(extra_columns), 1)
+        self.assertEqual(extra_columns[0][0], 'bbands_1')
+        self.assertListEqual(list(extra_columns[0][1]), [(4, '2021-01-05')])
+
+    def test_iter_points_accepts_tuples(self):
+        # arrange
+        values = [(1, '2021-01-04'), '']
+
+        # act
+        points = list(iter_points(values))
+
+        # assert
+        self.assertListEqual(points, [('2021-01-04', 1)])
+
+
+class TestColumnarFormatting(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            'open': FeatureColumns.from_columns(['2021-01-04', '2021-01-05'], [1.0, 2.0]),
+            'close': FeatureColumns.from_columns(['2021-01-05'], [3.0])
+        }
+
+    def test_json_formatter_merges_columns(self):
+        # act
+        output = JsonFormatter().transform(self.data)
+
+        # assert
+        self.assertListEqual(output['header'], ['date', 'open', 'close'])
+        self.assertListEqual(output['values'], [['2021-01-04', 1.0, ''],
+                                                ['2021-01-05', 2.0, 3.0]])
+
+    def test_json_formatter_merges_extra_columns(self):
+        # arrange
+        self.data['bbands'] = FeatureColumns.from_columns(['2021-01-05'], [1.0], {'bbands_1': [2.0]})
+
+        # act
+        output = JsonFormatter().transform(self.data)
+
+        # assert
+        self.assertListEqual(output['header'], ['date', 'open', 'close', 'bbands', 'bbands_1'])
+        self.assertListEqual(output['values'], [['2021-01-04', 1.0, '', '', ''],
+                                                ['2021-01-05', 2.0, 3.0, 1.0, 2.0]])
+
+    def test_ndjson_formatter_merges_columns(self):
+        # act
+        lines = list(NdjsonFormatter().stream(['open', 'close'], self.data.items()))
+
+        # assert
+        self.assertListEqual(lines, ['{"header": ["date", "open", "close"]}\n',
+                                     '["2021-01-04", 1.0, ""]\n',
+                                     '["2021-01-05", 2.0, 3.0]\n'])
+
+    def test_ndjson_formatter_writes_lines_once_features_are_merged(self):
+        # arrange
+        consumed = []
+
+        def feature_values():
+            for name, values in self.data.items():
+                consumed.append(name)
+                yield name, values
+
+        lines = NdjsonFormatter().stream(['open', 'close'], feature_values())
+
+        # act
+        header = next(lines)
+        consumed_before_header = list(consumed)
+
+        # assert
+        self.assertEqual(header, '{"header": ["date", "open", "close"]}\n')
+        self.assertListEqual(consumed_before_header, ['open', 'close'])
+        self.assertEqual(next(lines), '["2021-01-04", 1.0, ""]\n')
@@ -0,0 +1,96 @@
+import gzip
+import io
+from os import path
+import tarfile
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+from pydas.formatters import CompressionFormatter
+from pydas.formatters.blocks import BlockCompressor, configure_compressor, iter_blocks
+
+DATA = b''.join(f'2021-01-{i % 28 + 1:02d},{i},{i * 1.5}\n'.encode('ascii') for i in range(20000))
+
+
+class TestBlockCompressor(unittest.TestCase):
+    def setUp(self):
+        self.compressor = BlockCompressor(processes=2, block_size=16 * 1024)
+
+    def tearDown(self):
+        self.compressor.close()
+
+    def test_blocks_are_regrouped(self):
+        # act
+        blocks = list(iter_blocks([b'ab', b'cde', b'f'], block_size=4))
+
+        # assert
+        self.assertListEqual(blocks, [b'abcd', b'ef'])
+
+    def test_gzip_members_decompress_as_one_stream(self):
+        # act
+        members = list(self.compressor.gzip(iter_blocks([DATA], self.compressor.block_size)))
+
+        # assert
+        self.assertGreater(len(members), 1)
+        self.assertEqual(gzip.decompress(b''.join(members)), DATA)
+
+    def test_deflate_stream_tallies_crc_and_size(self):
+        # act
+        stream = self.compressor.deflate(iter_blocks([DATA], self.compressor.block_size))
+        compressed = b''.join(stream)
+
+        # assert
+        self.assertEqual(stream.size, len(DATA))
+        self.assertGreater(len(compressed), 0)
+
+
+class TestCompressionFormatter(unittest.TestCase):
+    def setUp(self):
+        configure_compressor(processes=2, block_size=16 * 1024)
+        self.formatter = CompressionFormatter()
+
+    def tearDown(self):
+        configure_compressor().close()
+
+    def test_stream_zip(self):
+        # act
+        archive = b''.join(self.formatter.stream(iter([DATA]), output_format='zip', filename='data.csv'))
+
+        # assert
+        with ZipFile(io.BytesIO(archive)) as zipfile:
+            self.assertIsNone(zipfile.testzip())
+            self.assertEqual(zipfile.read('data.csv'), DATA)
+
+    def test_stream_tar(self):
+        # act
+        archive = b''.join(self.formatter.stream(iter([DATA]), output_format='tar', filename='data.csv'))
+
+        # assert
+        self.assertEqual(len(archive) % tarfile.RECORDSIZE, 0)
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tarball:
+            self.assertEqual(tarball.extractfile('data.csv').read(), DATA)
+
+    def test_transform_archives_files(self):
+        # arrange
+        with tempfile.TemporaryDirectory() as output_path:
+            files = [path.join(output_path, 'a.csv'), path.join(output_path, 'b.csv')]
+            for file in files:
+                with open(file, 'wb') as writable:
+                    writable.write(DATA)
+
+            # act
+            archives = {output_format: self.formatter.transform({'gme': files},
+                                                                output_format=output_format,
+                                                                path=output_path)[0][1]
+                        for output_format in ('gz', 'zip', 'tar')}
+
+            # assert
+            with gzip.open(archives['gz']) as gzipfile:
+                self.assertEqual(gzipfile.read(), DATA + DATA)
+
+            with ZipFile(archives['zip']) as zipfile:
+                self.assertListEqual(zipfile.namelist(), ['a.csv', 'b.csv'])
+                self.assertEqual(zipfile.read('b.csv'), DATA)
+
+            with tarfile.open(archives['tar']) as tarball:
+                self.assertListEqual(tarball.getnames(), ['a.csv', 'b.csv'])
@@ -0,0 +1,51 @@
+import io
+from os import path
+import tempfile
+import unittest
+
+from pydas.formatters import FileFormatter
+
+DATA = {'header': ['date', 'open'],
+        'values': [['2021-01-04', 1.0], ['2021-01-05', ''], ['2021-01-06', 3.0]]}
+OPTIONS = {'field_delimiter': '|', 'row_delimiter': '\\r\\n', 'include_headers': 'true'}
+
+
+class TestFileFormatter(unittest.TestCase):
+    def test_rows_are_encoded_in_chunks(self):
+        # act
+        chunks = list(FileFormatter().encode(DATA, chunk_rows=2, **OPTIONS))
+
+        # assert
+        self.assertListEqual(chunks, ['date|open\r\n',
+                                      '2021-01-04|1.0\r\n2021-01-05|\r\n',
+                                      '2021-01-06|3.0\r\n'])
+
+    def test_write_to_writable(self):
+        # arrange
+        writable = io.StringIO()
+
+        # act
+        written = FileFormatter().write(DATA, writable, **dict(OPTIONS, include_headers='false'))
+
+        # assert
+        self.assertEqual(writable.getvalue(), '2021-01-04|1.0\r\n2021-01-05|\r\n2021-01-06|3.0\r\n')
+        self.assertEqual(written, len(writable.getvalue()))
+
+    def test_transform_without_output_path_streams(self):
+        # act
+        result = FileFormatter().transform(DATA, **OPTIONS)
+
+        # assert
+        self.assertNotIsInstance(result, str)
+        self.assertTrue(''.join(result).startswith('date|open\r\n'))
+
+    def test_transform_with_output_path_writes_file(self):
+        # arrange
+        with tempfile.TemporaryDirectory() as output_path:
+            # act
+            filename = FileFormatter().transform(DATA, output_path=output_path, **OPTIONS)
+
+            # assert
+            self.assertEqual(path.dirname(filename), output_path)
+            with open(filename, newline='') as file:
+                self.assertEqual(file.read(), ''.join(FileFormatter().encode(DATA, **OPTIONS)))
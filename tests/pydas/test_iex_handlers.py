@@ -0,0 +1,218 @@
+import datetime as dt
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from pydas_metadata.models import Feature
+
+from pydas.acquisition.features import extract_values
+from pydas.transformers import sessions
+from pydas.transformers.iex_handlers import range_handler, tech_indicators_handler
+from pydas.transformers.trading_calendar import get_calendar
+
+
+class DailyHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        url = urlparse(self.path)
+        if 'exactDate' not in parse_qs(url.query):
+            self._send_range(url.path.rsplit('/', 1)[-1], parse_qs(url.query))
+            return
+
+        exact_date = parse_qs(url.query)['exactDate'][0]
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            attempts = server.attempts[exact_date] = server.attempts.get(exact_date, 0) + 1
+
+        # Complete out of order, so that the handler has to restore the date order
+        time.sleep(random.uniform(0, 0.02))
+        status = server.statuses.get(exact_date, [])[attempts - 1:attempts] or [200]
+        body = json.dumps({'exactDate': exact_date}).encode('utf-8')
+        self.send_response(status[0])
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.in_flight -= 1
+
+    def _send_range(self, chart_range: str, query: dict):
+        server = self.server
+        with server.lock:
+            server.ranges.append(chart_range)
+            server.range_queries.append(query)
+
+        body = json.dumps(server.chart).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestRangeHandler(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), DailyHandler)
+        self.server.lock = threading.Lock()
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.attempts = dict()
+        self.server.statuses = dict()
+        self.server.ranges = []
+        self.server.range_queries = []
+        self.server.chart = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_uri = f'http://127.0.0.1:{self.server.server_port}/stock/gme'
+        self.uri = self.base_uri + '/intraday-prices'
+        # Friday 2021-01-29 back to Friday 2021-01-15, skipping weekends and 2021-01-18 (MLK Day)
+        self.options = [{'name': 'exactDate', 'value': '20210129'}, {'name': 'range', 'value': '10d'}]
+        self.dates = ['20210129', '20210128', '20210127', '20210126', '20210125',
+                      '20210122', '20210121', '20210120', '20210119', '20210115']
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_range_handler_keeps_date_order(self):
+        # arrange
+        self.session = sessions.HttpSession(pool_size=4, timeout=5, max_in_flight=3)
+
+        # act
+        data = range_handler(self.uri, self.options, 'token', self.session)
+
+        # assert
+        self.assertListEqual([point['exactDate'] for point in data], self.dates)
+        self.assertListEqual([point['date'] for point in data][:2], ['2021-01-29', '2021-01-28'])
+        self.assertLessEqual(self.server.max_in_flight, 3)
+
+    def test_range_handler_retries_failed_days(self):
+        # arrange
+        self.session = sessions.HttpSession(timeout=5, retries=2, retry_backoff=0)
+        self.server.statuses = {'20210127': [503, 429], '20210121': [502]}
+
+        # act
+        data = range_handler(self.uri, self.options, 'token', self.session)
+
+        # assert
+        self.assertListEqual([point['exactDate'] for point in data], self.dates)
+        self.assertEqual(self.server.attempts['20210127'], 3)
+        self.assertEqual(self.server.attempts['20210121'], 2)
+        self.assertEqual(self.server.attempts['20210129'], 1)
+
+    def test_range_handler_raises_after_retries(self):
+        # arrange
+        self.session = sessions.HttpSession(timeout=5, retries=1, retry_backoff=0)
+        self.server.statuses = {'20210127': [503, 503, 503]}
+
+        # act / assert
+        with self.assertRaises(requests.HTTPError):
+            range_handler(self.uri, self.options, 'token', self.session)
+
+        self.assertEqual(self.server.attempts['20210127'], 2)
+
+    def test_range_handler_does_not_retry_client_errors(self):
+        # arrange
+        self.session = sessions.HttpSession(timeout=5, retries=2, retry_backoff=0)
+        self.server.statuses = {'20210127': [404]}
+
+        # act / assert
+        with self.assertRaises(requests.HTTPError):
+            range_handler(self.uri, self.options, 'token', self.session)
+
+        self.assertEqual(self.server.attempts['20210127'], 1)
+
+    def test_range_handler_requests_chart_range(self):
+        # arrange
+        self.session = sessions.HttpSession(timeout=5)
+        weekdays = get_calendar().get_range_days(dt.date.today(), '10d')
+        # The chart range starts after the oldest day, which is then requested on its own
+        self.server.chart = [{'date': date.isoformat(), 'close': 1.0} for date in reversed(weekdays[:-1])]
+
+        # act
+        data = range_handler(self.base_uri + '/chart/date', [{'name': 'range', 'value': '10d'}],
+                             'token', self.session)
+
+        # assert
+        self.assertListEqual(self.server.ranges, ['1m'])
+        self.assertDictEqual(self.server.attempts, {weekdays[-1].strftime('%Y%m%d'): 1})
+        self.assertListEqual([point['date'] for point in data], [date.isoformat() for date in weekdays])
+
+    def test_range_handler_passes_options_to_chart_range(self):
+        # arrange
+        self.session = sessions.HttpSession(timeout=5)
+        weekdays = get_calendar().get_range_days(dt.date.today(), '5d')
+        self.server.chart = [{'date': date.isoformat(), 'close': 1.0} for date in reversed(weekdays)]
+        uri = f'http://127.0.0.1:{self.server.server_port}/stocks/gme/chart'
+
+        # act
+        data = range_handler(uri, [{'name': 'range', 'value': '5d'},
+                                   {'name': 'chartCloseOnly', 'value': 'true'}], 'token', self.session)
+
+        # assert
+        self.assertListEqual(self.server.ranges, ['5d'])
+        self.assertDictEqual(self.server.range_queries[0], {'chartCloseOnly': ['true'], 'token': ['token']})
+        self.assertEqual(len(data), 5)
+
+
+class TestTechIndicatorsHandler(unittest.TestCase):
+    def setUp(self):
+        self.options = [{'feature_name': 'bbands', 'name': 'range', 'value': '1m'}]
+        self.response = {
+            'chart': [{'date': '2021-01-27'}, {'date': '2021-01-28'}, {'date': '2021-01-29'}],
+            'indicator': [[None, 1.0, 2.0], [None, 3.0, 4.0], [5.0, 6.0]]
+        }
+
+    def test_every_series_is_aligned_with_chart_dates(self):
+        # act
+        with mock.patch('pydas.transformers.iex_handlers.batch_handler', return_value=self.response):
+            data = tech_indicators_handler('/stock/gme/indicator/bbands', self.options, 'token')
+
+        # assert
+        self.assertListEqual(data['date'], ['2021-01-27', '2021-01-28'])
+        self.assertListEqual(list(data['bbands']), ['', 1.0])
+        self.assertListEqual(list(data['bbands_1']), ['', 3.0])
+        self.assertListEqual(list(data['bbands_2']), [5.0, 6.0])
+
+    def test_result_is_extracted_as_columns(self):
+        # arrange
+        feature = Feature(name='bbands_2')
+
+        # act
+        with mock.patch('pydas.transformers.iex_handlers.batch_handler', return_value=self.response):
+            data = tech_indicators_handler('/stock/gme/indicator/bbands', self.options, 'token')
+        columns = extract_values(feature, data)
+
+        # assert
+        self.assertListEqual(columns.dates, ['2021-01-27', '2021-01-28'])
+        self.assertListEqual(columns.get_values(), [5.0, 6.0])
+        self.assertDictEqual(columns.extra, {})
+
+    def test_further_series_are_extracted_as_extra_columns(self):
+        # arrange
+        feature = Feature(name='bbands')
+
+        # act
+        with mock.patch('pydas.transformers.iex_handlers.batch_handler', return_value=self.response):
+            data = tech_indicators_handler('/stock/gme/indicator/bbands', self.options, 'token')
+        columns = extract_values(feature, data)
+
+        # assert
+        self.assertListEqual(list(columns), [('', '2021-01-27'), (1.0, '2021-01-28')])
+        self.assertListEqual([name for name, _ in columns.get_extra_columns()], ['bbands_1', 'bbands_2'])
+        self.assertListEqual(list(columns.extra['bbands_1']), ['', 3.0])
+        self.assertListEqual(list(columns.extra['bbands_2']), [5.0, 6.0])
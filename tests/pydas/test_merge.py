@@ -0,0 +1,70 @@
+import unittest
+
+from pydas.columns import FeatureColumns
+from pydas.formatters.json import JsonFormatter
+from pydas.formatters.merge import DatasetMerger
+
+
+class TestDatasetMerger(unittest.TestCase):
+    def test_rows_follow_first_appearance_of_dates(self):
+        # arrange
+        merger = DatasetMerger()
+
+        # act
+        merger.merge('open', [(1, '2021-01-05'), (2, '2021-01-04')])
+        merger.merge('close', [(3, '2021-01-06'), (4, '2021-01-05')])
+
+        # assert
+        self.assertListEqual(merger.header, ['date', 'open', 'close'])
+        self.assertListEqual(merger.get_rows(), [['2021-01-05', 1, 4],
+                                                 ['2021-01-04', 2, ''],
+                                                 ['2021-01-06', '', 3]])
+
+    def test_contiguous_ranges_are_merged_as_columns(self):
+        # arrange
+        dates = ['2021-01-04', '2021-01-05', '2021-01-06']
+        merger = DatasetMerger(['open', 'close'])
+
+        # act
+        merger.merge('open', FeatureColumns.from_columns(dates, [1, 2, 3]))
+        merger.merge('close', FeatureColumns.from_columns(dates[1:], [5, 6]))
+
+        # assert
+        self.assertListEqual(merger.get_rows(), [['2021-01-04', 1, ''],
+                                                 ['2021-01-05', 2, 5],
+                                                 ['2021-01-06', 3, 6]])
+
+    def test_last_value_of_repeated_date_is_kept(self):
+        # arrange
+        merger = DatasetMerger()
+
+        # act
+        merger.merge('open', FeatureColumns.from_columns(['2021-01-04', '2021-01-04'], [1, 2]))
+
+        # assert
+        self.assertListEqual(merger.get_rows(), [['2021-01-04', 2]])
+
+    def test_features_without_data_are_left_empty(self):
+        # arrange
+        merger = DatasetMerger(['open', 'close'])
+
+        # act
+        merger.merge('open', [(1, '2021-01-04'), ''])
+
+        # assert
+        self.assertListEqual(merger.get_rows(), [['2021-01-04', 1, '']])
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_transform_keeps_output_shape(self):
+        # arrange
+        data = {'open': [(1, '2021-01-04')], 'close': [], 'volume': [(9, '2021-01-05')]}
+
+        # act
+        output = JsonFormatter().transform(data)
+
+        # assert
+        self.assertDictEqual(output, {
+            'header': ['date', 'open', 'close', 'volume'],
+            'values': [['2021-01-04', 1, '', ''], ['2021-01-05', '', '', 9]]
+        })
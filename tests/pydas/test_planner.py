@@ -0,0 +1,61 @@
+import datetime as dt
+import unittest
+
+from pydas.transformers.planner import plan_range_request, slice_range_response
+
+BASE_URI = 'https://cloud.iexapis.com/v1/stock/gme'
+TODAY = dt.date(2021, 1, 29)
+
+
+class TestPlanner(unittest.TestCase):
+    def test_plan_range_request_uses_smallest_range(self):
+        # arrange
+        dates = [TODAY - dt.timedelta(days=i) for i in range(60)]
+
+        # act
+        uri = plan_range_request(BASE_URI + '/chart/date', dates, TODAY)
+
+        # assert
+        self.assertEqual(uri, BASE_URI + '/chart/3m')
+
+    def test_plan_range_request_matches_stocks_endpoints(self):
+        # arrange
+        dates = [TODAY - dt.timedelta(days=i) for i in range(3)]
+
+        # act
+        uri = plan_range_request('https://cloud.iexapis.com/v1/stocks/gme/chart', dates, TODAY)
+
+        # assert
+        self.assertEqual(uri, 'https://cloud.iexapis.com/v1/stocks/gme/chart/5d')
+
+    def test_plan_range_request_ignores_other_endpoints(self):
+        # arrange
+        dates = [TODAY - dt.timedelta(days=i) for i in range(60)]
+
+        # act
+        uri = plan_range_request(BASE_URI + '/intraday-prices', dates, TODAY)
+
+        # assert
+        self.assertIsNone(uri)
+
+    def test_plan_range_request_avoids_overfetching(self):
+        # arrange
+        dates = [TODAY - dt.timedelta(days=100)]
+
+        # act
+        uri = plan_range_request(BASE_URI + '/chart', dates, TODAY)
+
+        # assert
+        self.assertIsNone(uri)
+
+    def test_slice_range_response(self):
+        # arrange
+        dates = [dt.date(2021, 1, 29), dt.date(2021, 1, 18), dt.date(2021, 1, 15)]
+        points = [{'date': '2021-01-19', 'close': 1.0}, {'date': '2021-01-29', 'close': 2.0}]
+
+        # act
+        sliced, uncovered = slice_range_response(points, dates)
+
+        # assert
+        self.assertDictEqual(sliced, {dt.date(2021, 1, 29): {'date': '2021-01-29', 'close': 2.0}})
+        self.assertListEqual(uncovered, [dt.date(2021, 1, 18), dt.date(2021, 1, 15)])
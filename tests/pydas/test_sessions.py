@@ -0,0 +1,60 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import unittest
+
+from pydas.transformers.sessions import HttpSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b'{"close": 1.0}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestHttpSession(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/stock/gme/quote'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connections_are_reused(self):
+        # arrange
+        session = HttpSession(pool_size=2, timeout=5)
+
+        # act
+        responses = [session.get(self.url) for _ in range(3)]
+        session.close()
+
+        # assert
+        self.assertListEqual([response.json() for response in responses], [{'close': 1.0}] * 3)
+        self.assertDictEqual(session.get_statistics(), {'pool_size': 2,
+                                                        'requests': 3,
+                                                        'connections': 1,
+                                                        'reused': 2,
+                                                        'reuse_ratio': 2 / 3})
+
+    def test_requests_accept_gzip(self):
+        # arrange
+        session = HttpSession()
+
+        # act
+        response = session.get(self.url)
+        session.close()
+
+        # assert
+        self.assertIn('gzip', response.request.headers['Accept-Encoding'])
+        self.assertEqual(session.timeout, 30.0)
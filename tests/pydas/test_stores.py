@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+from pydas.stores import SegmentStore, SqliteStore, StoreFactory
+
+
+class StoreTests:
+    def create_store(self, path: str):
+        raise NotImplementedError()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = self.create_store(self.directory.name)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_read_returns_written_points(self):
+        # arrange
+        self.store.write('gme', 'close', 'abc', {'2021-01-04': 17.25, '2021-01-05': 17.37})
+
+        # act
+        points = self.store.read('gme', 'close', 'abc')
+
+        # assert
+        self.assertDictEqual(points, {'2021-01-04': 17.25, '2021-01-05': 17.37})
+        self.assertDictEqual(self.store.read('gme', 'open', 'abc'), {})
+
+    def test_write_replaces_existing_dates(self):
+        # arrange
+        self.store.write('gme', 'close', 'abc', {'2021-01-04': 17.25, '2021-01-05': 17.37})
+
+        # act
+        self.store.write('gme', 'close', 'abc', {'2021-01-05': 18.36, '2021-01-06': 18.08})
+
+        # assert
+        self.assertDictEqual(self.store.read('gme', 'close', 'abc'),
+                             {'2021-01-04': 17.25, '2021-01-05': 18.36, '2021-01-06': 18.08})
+        self.assertEqual(self.store.last_date('gme', 'close', 'abc'), '2021-01-06')
+
+    def test_read_from_start_date(self):
+        # arrange
+        self.store.write('gme', 'close', 'abc', {'2021-01-04': 17.25, '2021-01-05': 17.37})
+
+        # act
+        points = self.store.read('gme', 'close', 'abc', start='2021-01-05')
+
+        # assert
+        self.assertDictEqual(points, {'2021-01-05': 17.37})
+
+
+class TestSegmentStore(StoreTests, unittest.TestCase):
+    def create_store(self, path: str):
+        return SegmentStore(path, segment_size=64, max_segments=3)
+
+    def test_segments_are_compacted(self):
+        # arrange
+        for day in range(4, 30):
+            self.store.write('gme', 'close', 'abc', {f'2021-01-{day:02d}': day})
+
+        # act
+        self.store.write('gme', 'close', 'abc', {'2021-01-04': 0})
+
+        # assert
+        points = self.store.read('gme', 'close', 'abc')
+        self.assertEqual(len(points), 26)
+        self.assertEqual(points['2021-01-04'], 0)
+        series_path = os.path.join(self.directory.name, 'gme', 'close-abc')
+        segments = [name for name in os.listdir(series_path) if name.endswith('.seg')]
+        self.assertLessEqual(len(segments), 3)
+
+    def test_partial_records_are_ignored(self):
+        # arrange
+        self.store.write('gme', 'close', 'abc', {'2021-01-04': 17.25})
+        with open(os.path.join(self.directory.name, 'gme', 'close-abc', '00000001.seg'), 'ab') as file:
+            file.write(b'["2021-01-05", 1')
+
+        # act
+        self.store.write('gme', 'close', 'abc', {'2021-01-06': 18.08})
+
+        # assert
+        self.assertDictEqual(self.store.read('gme', 'close', 'abc'),
+                             {'2021-01-04': 17.25, '2021-01-06': 18.08})
+
+
+class TestSqliteStore(StoreTests, unittest.TestCase):
+    def create_store(self, path: str):
+        return SqliteStore(path)
+
+
+class TestStoreFactory(unittest.TestCase):
+    def test_get_store(self):
+        # arrange
+        with tempfile.TemporaryDirectory() as directory:
+            # act
+            store = StoreFactory.get_store('sqlite', path=directory)
+            store.close()
+
+        # assert
+        self.assertIsInstance(store, SqliteStore)
+
+    def test_unsupported_store(self):
+        with self.assertRaises(ValueError):
+            StoreFactory.get_store('redis')
@@ -0,0 +1,100 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import unittest
+
+from pydas.transformers import sessions
+from pydas.transformers.iex_handlers import batch_handler
+from pydas.transformers.streaming import iter_json_array
+
+RECORDS = [{'date': '2021-01-28', 'close': 193.6, 'label': 'Jan 28 – GME'},
+           {'date': '2021-01-29', 'close': 325, 'label': None}]
+
+
+class ChunkedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = json.dumps(RECORDS if 'chart' in self.path else {'close': 325}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for i in range(0, len(body), 7):
+            chunk = body[i:i + 7]
+            self.wfile.write(f'{len(chunk):x}\r\n'.encode('ascii') + chunk + b'\r\n')
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestIterJsonArray(unittest.TestCase):
+    def test_elements_split_across_chunks_are_parsed(self):
+        # arrange
+        body = json.dumps(RECORDS, ensure_ascii=False).encode('utf-8')
+
+        # act
+        for size in (1, 2, 5, len(body)):
+            records = list(iter_json_array(body[i:i + size] for i in range(0, len(body), size)))
+
+            # assert
+            self.assertListEqual(records, RECORDS)
+
+    def test_numbers_at_end_of_chunk_are_completed(self):
+        # act
+        values = list(iter_json_array([b'[12', b'34, 5', b'6]']))
+
+        # assert
+        self.assertListEqual(values, [1234, 56])
+
+    def test_elements_are_yielded_before_array_ends(self):
+        # arrange
+        records = iter_json_array(iter([b' [{"close": 1}, ', b'{"close": 2}']))
+
+        # act
+        first = next(records)
+
+        # assert
+        self.assertDictEqual(first, {'close': 1})
+        with self.assertRaises(ValueError):
+            list(records)
+
+    def test_empty_array_has_no_elements(self):
+        # act / assert
+        self.assertListEqual(list(iter_json_array([b'[ ', b']'])), [])
+
+    def test_objects_are_rejected(self):
+        # act / assert
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"close": 1}']))
+
+
+class TestStreamedBatchHandler(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ChunkedHandler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_uri = f'http://127.0.0.1:{self.server.server_port}/stock/gme'
+        self.session = sessions.HttpSession(stream_json=True, chunk_size=16)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_array_responses_are_streamed(self):
+        # act
+        records = batch_handler(self.base_uri + '/chart/5d', [], 'token', self.session)
+
+        # assert
+        self.assertNotIsInstance(records, list)
+        self.assertListEqual(list(records), RECORDS)
+
+    def test_object_responses_are_decoded(self):
+        # act
+        data = batch_handler(self.base_uri + '/quote', [], 'token', self.session)
+
+        # assert
+        self.assertDictEqual(data, {'close': 325})
@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+
+from pydas.transformers.iex_news_handlers import news_handler
+from pydas.transformers.text import TextPreprocessor
+
+STOPWORDS = ('the', 'a', 'of', 'on')
+
+
+class TestTextPreprocessor(unittest.TestCase):
+    def test_preprocess_removes_punctuation_and_stopwords(self):
+        # arrange
+        preprocessor = TextPreprocessor(stopwords=STOPWORDS)
+
+        # act
+        text = preprocessor.preprocess("Shares of GameStop soared on the news, a short squeeze!")
+
+        # assert
+        self.assertEqual(text, 'Shares GameStop soared news short squeeze')
+
+    def test_preprocess_all_uses_worker_processes(self):
+        # arrange
+        preprocessor = TextPreprocessor(stopwords=STOPWORDS, processes=2, min_batch_size=4)
+        texts = [f'the price of share {i} rose.' for i in range(10)]
+
+        # act
+        results = preprocessor.preprocess_all(texts)
+        preprocessor.close()
+
+        # assert
+        self.assertListEqual(results, [f'price share {i} rose' for i in range(10)])
+
+    def test_small_batches_are_preprocessed_in_process(self):
+        # arrange
+        preprocessor = TextPreprocessor(stopwords=STOPWORDS, processes=2, min_batch_size=4)
+
+        # act
+        results = preprocessor.preprocess_all(['the end.'])
+
+        # assert
+        self.assertListEqual(results, ['end'])
+        self.assertIsNone(preprocessor._executor)  # pylint: disable=protected-access
+
+    def test_news_handler_preprocesses_articles(self):
+        # arrange
+        articles = [{'date': 1611878400000, 'summary': 'the stock of GME rallied.'},
+                    {'date': 1611964800000, 'summary': 'a squeeze on the shorts.'}]
+
+        # act
+        with mock.patch('pydas.transformers.iex_news_handlers.batch_handler', return_value=articles), \
+                mock.patch('pydas.transformers.iex_news_handlers.get_preprocessor',
+                           return_value=TextPreprocessor(stopwords=STOPWORDS)):
+            data = news_handler('https://cloud.iexapis.com/v1/stock/gme/news', [], 'token')
+
+        # assert
+        self.assertListEqual([value['summary'] for value in data], ['stock GME rallied', 'squeeze shorts'])
+        self.assertTrue(all(len(value['date']) == 10 for value in data))
@@ -0,0 +1,82 @@
+import datetime as dt
+import unittest
+
+from pydas.transformers.trading_calendar import TradingCalendar
+from pydas.transformers.utils import calc_range
+
+
+class TestTradingCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = TradingCalendar()
+
+    def test_get_holidays(self):
+        # act
+        holidays = self.calendar.get_holidays(2021)
+
+        # assert
+        self.assertListEqual(holidays, [dt.date(2021, 1, 1),
+                                        dt.date(2021, 1, 18),
+                                        dt.date(2021, 2, 15),
+                                        dt.date(2021, 4, 2),
+                                        dt.date(2021, 5, 31),
+                                        dt.date(2021, 7, 5),
+                                        dt.date(2021, 9, 6),
+                                        dt.date(2021, 11, 25),
+                                        dt.date(2021, 12, 24)])
+
+    def test_get_trading_days(self):
+        # act / assert
+        self.assertEqual(len(self.calendar.get_trading_days(2021)), 252)
+        self.assertEqual(len(self.calendar.get_trading_days(2022)), 251)
+        self.assertEqual(len(self.calendar.get_trading_days(2025)), 250)
+        self.assertIs(self.calendar.get_trading_days(2021), self.calendar.get_trading_days(2021))
+
+    def test_is_trading_day(self):
+        # act / assert
+        self.assertTrue(self.calendar.is_trading_day(dt.date(2021, 1, 29)))
+        self.assertFalse(self.calendar.is_trading_day(dt.date(2021, 1, 30)))
+        self.assertFalse(self.calendar.is_trading_day(dt.date(2021, 4, 2)))
+        self.assertFalse(self.calendar.is_trading_day(dt.date(2012, 10, 29)))
+
+    def test_get_range_days_skips_holidays(self):
+        # act
+        days = self.calendar.get_range_days(dt.date(2021, 1, 5), '5d')
+
+        # assert
+        self.assertListEqual(days, [dt.date(2021, 1, 5),
+                                    dt.date(2021, 1, 4),
+                                    dt.date(2020, 12, 31),
+                                    dt.date(2020, 12, 30),
+                                    dt.date(2020, 12, 29)])
+
+    def test_get_range_start(self):
+        # arrange
+        end = dt.date(2021, 3, 31)
+
+        # act / assert
+        self.assertEqual(self.calendar.get_range_start(end, '1m'), dt.date(2021, 3, 1))
+        self.assertEqual(self.calendar.get_range_start(end, '6m'), dt.date(2020, 10, 1))
+        self.assertEqual(self.calendar.get_range_start(end, '2y'), dt.date(2019, 4, 1))
+        self.assertEqual(self.calendar.get_range_start(end, 'ytd'), dt.date(2021, 1, 1))
+        self.assertEqual(self.calendar.get_range_start(end, 'max'), dt.date(2006, 4, 1))
+        with self.assertRaises(KeyError):
+            self.calendar.get_range_start(end, '1w')
+
+    def test_get_range_start_caps_trading_days_at_max_range(self):
+        # arrange
+        end = dt.date(2021, 1, 29)
+
+        # act
+        start = self.calendar.get_range_start(end, '1000000d')
+
+        # assert
+        # The max range starts on Monday 2006-01-30, which is a trading day
+        self.assertEqual(start, dt.date(2006, 1, 30))
+        self.assertEqual(start, self.calendar.get_range_start(end, 'max'))
+
+    def test_calc_range(self):
+        # act / assert
+        self.assertEqual(calc_range(dt.date(2021, 1, 29), '5d'), 5)
+        self.assertEqual(calc_range(dt.date(2021, 1, 31), '5d'), 7)
+        # 2020-01-30 to 2021-01-29 includes 2020-02-29
+        self.assertEqual(calc_range(dt.date(2021, 1, 29), '1y'), 366)